@@ -89,10 +89,26 @@ def download_document(doc_id):
         abort(500)
 
 
+DEFAULT_PAGE_SIZE = 100
+
+
+def _page_args() -> tuple:
+    """(after, limit) from ?after=<cursor>&limit=<n>; limit is None (no paging) unless either is given"""
+    after = request.args.get('after') or None
+    limit = request.args.get('limit', type=int)
+    if limit is None and after is not None:
+        limit = DEFAULT_PAGE_SIZE
+    return after, limit
+
+
 @api_bp.route('/leases', methods=['GET'])
 @require_login
 def get_leases():
-    """Get all leases for current user"""
+    """
+    Get all leases for current user
+    Optional: ?after=<next_cursor>&limit=<n> (keyset pages, newest first), ?fields=a,b or ?view=list
+    (column projection), ?status=&entity=&asset_class=&from_date=&to_date= (filters)
+    """
     user_id = session['user_id']
     logger.info(f"📋 GET /api/leases - User {user_id} fetching leases")
     
@@ -100,12 +116,27 @@ def get_leases():
         user = database.get_user(user_id)
         # If the user is an admin or reviewer, return all leases.
         # Otherwise, only return leases created by the user.
-        if user and (user['role'] == 'admin' or user['role'] == 'reviewer'):
-            leases = database.get_all_leases()
-        else:
-            leases = database.get_leases_by_user(user_id)
+        owner_id = None if user and (user['role'] == 'admin' or user['role'] == 'reviewer') else user_id
+        
+        after, limit = _page_args()
+        fields = request.args.get('fields')
+        if fields:
+            fields = [f.strip() for f in fields.split(',') if f.strip()]
+        elif request.args.get('view') == 'list':
+            fields = list(database.LEASE_LIST_COLUMNS)
+        
+        leases, next_cursor = database.list_leases(
+            user_id=owner_id, after=after, limit=limit, fields=fields,
+            status=request.args.get('status'),
+            entity=request.args.get('entity'),
+            asset_class=request.args.get('asset_class'),
+            from_date=request.args.get('from_date'),
+            to_date=request.args.get('to_date'),
+        )
         logger.info(f"Found {len(leases)} leases for user {user_id}")
-        return jsonify({'success': True, 'leases': leases})
+        return jsonify({'success': True, 'leases': leases, 'next_cursor': next_cursor})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching leases: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -310,6 +341,7 @@ def set_lease_status(lease_id):
             return jsonify({'success': False, 'error': 'Invalid status'}), 400
         with database.get_db_connection() as conn:
             conn.execute("UPDATE leases SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE lease_id = ?", (status, lease_id))
+            database._invalidate_lease_schedule(conn, lease_id)
         try:
             username = session.get('username')
             database.add_lease_audit(lease_id, username or 'admin', f'status_set_{status}', None)
@@ -836,6 +868,14 @@ def set_admin_config():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@api_bp.route('/admin/db_pool_stats', methods=['GET'])
+@require_login
+@require_admin
+def get_db_pool_stats():
+    """SQLite connection pool counters"""
+    return jsonify({'success': True, 'stats': database.get_connection_pool_stats()})
+
+
 # ============ Dashboard Stats ============
 @api_bp.route('/leases/stats', methods=['GET'])
 @require_login
@@ -846,36 +886,8 @@ def get_lease_stats():
     
     try:
         user = database.get_user(user_id)
-        
-        if user and (user['role'] == 'admin' or user['role'] == 'reviewer'):
-            leases = database.get_all_leases()
-        else:
-            leases = database.get_leases_by_user(user_id)
-        
-        stats = {
-            'total': len(leases),
-            'active': 0,
-            'expired': 0,
-            'counts': {}
-        }
-        
-        today = date.today()
-        
-        for lease in leases:
-            status = lease.get('status', 'draft')
-            stats['counts'][status] = stats['counts'].get(status, 0) + 1
-            
-            end_date_str = lease.get('lease_end_date')
-            if end_date_str:
-                try:
-                    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                    if end_date < today:
-                        stats['expired'] += 1
-                    else:
-                        stats['active'] += 1
-                except ValueError:
-                    # Handle cases where the date format might be incorrect
-                    pass
+        owner_id = None if user and (user['role'] == 'admin' or user['role'] == 'reviewer') else user_id
+        stats = database.get_lease_stats(owner_id)
 
         return jsonify({'success': True, **stats})
         
@@ -892,32 +904,9 @@ def get_lease_stats_by_company():
     
     try:
         user = database.get_user(user_id)
-        
-        if user and (user['role'] == 'admin' or user['role'] == 'reviewer'):
-            leases = database.get_all_leases()
-        else:
-            leases = database.get_leases_by_user(user_id)
-            
-        stats = {}
-        
-        for lease in leases:
-            company_name = lease.get('company_name', 'Unknown')
-            if company_name not in stats:
-                stats[company_name] = {'total': 0, 'active': 0, 'expired': 0}
-            
-            stats[company_name]['total'] += 1
-            
-            end_date_str = lease.get('lease_end_date')
-            if end_date_str:
-                try:
-                    end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                    if end_date < date.today():
-                        stats[company_name]['expired'] += 1
-                    else:
-                        stats[company_name]['active'] += 1
-                except ValueError:
-                    pass
-                    
+        owner_id = None if user and (user['role'] == 'admin' or user['role'] == 'reviewer') else user_id
+        stats = database.get_lease_stats_by_company(owner_id)
+
         return jsonify({'success': True, 'stats': stats})
         
     except Exception as e:
@@ -942,16 +931,28 @@ def get_current_user_info():
 @api_bp.route('/audit_logs', methods=['GET'])
 @require_login
 def get_audit_logs():
-    """Get all audit logs"""
+    """
+    Get all audit logs
+    Optional: ?after=<next_cursor>&limit=<n> (keyset pages, newest first),
+    ?lease_id=&changed_by=&action=&from_date=&to_date= (filters)
+    """
     user_id = session['user_id']
     logger.info(f"📋 GET /api/audit_logs - User {user_id} fetching audit logs")
     
     try:
-        with database.get_db_connection() as conn:
-            rows = conn.execute("SELECT * FROM lease_data_audit ORDER BY change_timestamp DESC").fetchall()
-            logs = [dict(row) for row in rows]
+        after, limit = _page_args()
+        logs, next_cursor = database.list_audit_logs(
+            after=after, limit=limit,
+            lease_id=request.args.get('lease_id', type=int),
+            changed_by=request.args.get('changed_by'),
+            action=request.args.get('action'),
+            from_date=request.args.get('from_date'),
+            to_date=request.args.get('to_date'),
+        )
         
-        return jsonify({'success': True, 'logs': logs})
+        return jsonify({'success': True, 'logs': logs, 'next_cursor': next_cursor})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching audit logs: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -27,6 +27,13 @@ from lease_application import database
 # Import notification service
 from lease_application.lease_management.notifications import run_daily_date_check
 
+# Import schedule engine selection
+from lease_application.lease_accounting.schedule.generator_vba_complete import set_calculation_engine
+from lease_application.lease_accounting.schedule.schedule_cache import configure_schedule_cache
+from lease_application.lease_accounting.core.results_processor import configure_bulk_processing
+from lease_application.consolidation_jobs import configure_consolidation_jobs, recover_interrupted_jobs
+from lease_application.schedule_store import DatabaseScheduleStore
+
 
 def setup_logging(log_dir: Path):
     """Setup application logging"""
@@ -98,10 +105,34 @@ def create_app(config_name=None):
          resources={r"/api/*": {"origins": cors_origins, "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"], "allow_headers": ["Content-Type"]}}, 
          supports_credentials=True)
     
+    # Select basic_calc() engine for schedule generation
+    set_calculation_engine(app.config['CALCULATION_ENGINE'])
+    logger.info(f"✅ Calculation engine: {app.config['CALCULATION_ENGINE']}")
+    configure_schedule_cache(app.config['SCHEDULE_CACHE_SIZE'], store=DatabaseScheduleStore())
+    logger.info(f"✅ Schedule cache size: {app.config['SCHEDULE_CACHE_SIZE']}")
+    configure_bulk_processing(
+        workers=app.config['BULK_WORKERS'],
+        chunk_size=app.config['BULK_CHUNK_SIZE'],
+        lease_timeout=app.config['BULK_LEASE_TIMEOUT'],
+        parallel_threshold=app.config['BULK_PARALLEL_THRESHOLD']
+    )
+    logger.info(f"✅ Bulk processing workers: {app.config['BULK_WORKERS']}")
+    
     # Initialize database (only users table)
+    database.configure_database(
+        pool_size=app.config['DB_POOL_SIZE'],
+        cache_size_kb=app.config['DB_CACHE_SIZE_KB'],
+        mmap_size=app.config['DB_MMAP_SIZE']
+    )
     database.init_database()
+    if not database.check_query_plans():
+        logger.info("✅ Query plans use indexes")
     logger.info("✅ Database initialized")
     
+    # Background consolidation jobs (jobs left running by a previous process are failed)
+    configure_consolidation_jobs(app.config['CONSOLIDATION_JOB_WORKERS'])
+    recover_interrupted_jobs()
+    
     # Register blueprints
     app.register_blueprint(auth_bp)
     app.register_blueprint(api_bp)
@@ -265,7 +296,9 @@ def create_app(config_name=None):
 
 
 # Create app instance
-app = create_app()
+# Bulk-processing pool workers (spawn) re-import this module as __mp_main__; only the server builds the app
+if __name__ != '__mp_main__':
+    app = create_app()
 
 
 if __name__ == '__main__':
@@ -3,17 +3,18 @@ Lease Calculation Backend API
 Handles lease calculation requests and returns schedules, journal entries, and results
 """
 
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, Response, current_app, request, jsonify, session, stream_with_context
 from datetime import date, datetime
 from typing import Optional, List
 import logging
 from .lease_accounting.core.models import LeaseData, ProcessingFilters
-from .lease_accounting.schedule.generator_vba_complete import generate_complete_schedule
+from .lease_accounting.schedule.schedule_cache import get_cached_schedule, get_schedule_cache_stats
 from .lease_accounting.core.processor import LeaseProcessor
 from .lease_accounting.core.results_processor import ResultsProcessor
 from .lease_accounting.utils.journal_generator import JournalGenerator
 from .auth import require_login
 from . import database
+from . import consolidation_jobs
 
 # Create blueprint
 calc_bp = Blueprint('calc', __name__, url_prefix='/api')
@@ -195,7 +196,11 @@ def calculate_lease():
         filters = ProcessingFilters(
             start_date=from_date,
             end_date=to_date,
-            gaap_standard=data.get('gaap_standard', 'IFRS')
+            gaap_standard=data.get('gaap_standard', 'IFRS'),
+            projection_periods=int(data.get('projection_periods') or 3),
+            projection_period_months=int(data.get('projection_period_months') or 3),
+            # 'unbounded_projections' lifts the VBA cap of 6 periods (e.g. monthly budgets over the full term)
+            max_projection_periods=None if data.get('unbounded_projections') else 6
         )
         
         # Set gaap_standard on lease_data
@@ -203,7 +208,7 @@ def calculate_lease():
         
         # Generate full schedule
         logger.info("📅 Generating payment schedule...")
-        full_schedule = generate_complete_schedule(lease_data)
+        full_schedule = get_cached_schedule(lease_data)
         
         if not full_schedule:
             return jsonify({'error': 'Failed to generate schedule - check lease parameters'}), 400
@@ -277,6 +282,13 @@ def calculate_lease():
         return jsonify({'error': str(e)}), 500
 
 
+@calc_bp.route('/schedule_cache_stats', methods=['GET'])
+@require_login
+def schedule_cache_stats():
+    """Hit/miss/eviction counters of the shared schedule cache"""
+    return jsonify({'success': True, 'stats': get_schedule_cache_stats()})
+
+
 def _map_lease_to_leasedata(lease_dict: dict) -> LeaseData:
     """Map database lease dict to LeaseData model"""
     # Extract IBR from lease data
@@ -385,6 +397,9 @@ def _map_lease_to_leasedata(lease_dict: dict) -> LeaseData:
         group_entity_name=lease_dict.get('group_entity_name', ''),
         short_term_lease_ifrs=lease_dict.get('short_term_ifrs', 'No'),
         short_term_lease_usgaap=lease_dict.get('short_term_usgaap', 'No'),
+        
+        # Loaded from the leases table (enables the materialized schedule store)
+        persisted=True,
     )
 
 
@@ -394,66 +409,51 @@ def consolidate_reports():
     """
     Bulk consolidate calculation endpoint
     Processes multiple leases and returns consolidated results
+    
+    Optional 'periods': [{'from_date': ..., 'to_date': ...}, ...] evaluates every lease for
+    each reporting period from a single schedule build; the response then has one entry
+    per period under 'periods'
+    
+    With 'stream': true the response is NDJSON: one {"type": "result"} line per lease as it
+    is computed, one {"type": "summary"} line per period (totals, journals, statistics) and
+    a final {"type": "end"} line
     """
     try:
         data = request.json
         user_id = session['user_id']
         
-        # Get lease IDs to process
-        lease_ids = data.get('lease_ids', [])
-        if not lease_ids:
-            return jsonify({'error': 'No lease IDs provided'}), 400
+        try:
+            lease_ids, filters, periods = _parse_consolidation_request(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         logger.info(f"📥 Received consolidate request: {len(lease_ids)} leases")
         
-        # Parse date range filters
-        from_date = _parse_date(data.get('from_date'))
-        to_date = _parse_date(data.get('to_date'))
-        
-        if not from_date:
-            from_date = date.today()
-        if not to_date:
-            to_date = date.today()
-        
-        # Create filters
-        filters = ProcessingFilters(
-            start_date=from_date,
-            end_date=to_date,
-            gaap_standard=data.get('gaap_standard', 'IFRS'),
-            cost_center_filter=data.get('cost_center_filter'),
-            entity_filter=data.get('entity_filter'),
-            asset_class_filter=data.get('asset_class_filter'),
-            profit_center_filter=data.get('profit_center_filter')
-        )
-        
-        # Fetch leases from database
-        logger.info(f"📋 Fetching {len(lease_ids)} leases from database...")
-        lease_data_list = []
-        
-        for lease_id in lease_ids:
-            try:
-                lease_dict = database.get_lease(lease_id, user_id)
-                if not lease_dict:
-                    logger.warning(f"⚠️  Lease {lease_id} not found or not accessible")
-                    continue
-                
-                # Map to LeaseData
-                lease_data = _map_lease_to_leasedata(lease_dict)
-                lease_data.gaap_standard = filters.gaap_standard
-                lease_data_list.append(lease_data)
-                
-            except Exception as e:
-                logger.error(f"❌ Error mapping lease {lease_id}: {e}")
-                continue
-        
+        lease_data_list = _load_consolidation_leases(lease_ids, user_id, filters.gaap_standard)
         if not lease_data_list:
             return jsonify({'error': 'No valid leases found'}), 400
         
-        logger.info(f"✅ Mapped {len(lease_data_list)} leases to LeaseData")
-        
         # Process bulk leases
         logger.info(f"🔄 Processing {len(lease_data_list)} leases...")
         results_processor = ResultsProcessor(filters)
+        
+        if data.get('stream'):
+            return Response(
+                stream_with_context(_stream_consolidation(results_processor, lease_data_list, filters, periods)),
+                mimetype='application/x-ndjson'
+            )
+        
+        if periods:
+            period_results = results_processor.process_bulk_lease_periods(lease_data_list, periods)
+            return jsonify({
+                'success': True,
+                'periods': [
+                    dict(_consolidation_summary(period_from, period_to, bulk_result),
+                         results=bulk_result['results'])
+                    for (period_from, period_to), bulk_result in zip(periods, period_results)
+                ]
+            })
+        
         bulk_result = results_processor.process_bulk_leases(lease_data_list)
         
         logger.info(f"✅ Bulk processing complete: {bulk_result['processed_count']} processed, {bulk_result['skipped_count']} skipped")
@@ -462,17 +462,7 @@ def consolidate_reports():
         response = {
             'success': True,
             'results': bulk_result['results'],
-            'aggregated_totals': bulk_result['aggregated_totals'],
-            'consolidated_journals': bulk_result['consolidated_journals'],
-            'statistics': {
-                'processed_count': bulk_result['processed_count'],
-                'skipped_count': bulk_result['skipped_count'],
-                'total_count': bulk_result['total_count']
-            },
-            'date_range': {
-                'from_date': from_date.isoformat(),
-                'to_date': to_date.isoformat()
-            }
+            **_consolidation_summary(filters.start_date, filters.end_date, bulk_result)
         }
         
         return jsonify(response)
@@ -481,3 +471,175 @@ def consolidate_reports():
         logger.error(f"❌ Error in consolidate_reports: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
+
+@calc_bp.route('/consolidation_jobs', methods=['POST'])
+@require_login
+def submit_consolidation_job():
+    """
+    Queue a consolidate_reports request (same body) for background processing
+    Returns the job id immediately; poll /consolidation_jobs/<id> for progress
+    """
+    try:
+        job_id = consolidation_jobs.submit_consolidation_job(session['user_id'], request.json or {})
+        return jsonify({'success': True, 'job_id': job_id, 'status': 'queued'}), 202
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"❌ Error submitting consolidation job: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
+@calc_bp.route('/consolidation_jobs', methods=['GET'])
+@require_login
+def list_consolidation_jobs():
+    """Recent consolidation jobs of the current user"""
+    return jsonify({'success': True, 'jobs': database.get_consolidation_jobs_by_user(session['user_id'])})
+
+
+@calc_bp.route('/consolidation_jobs/<int:job_id>', methods=['GET'])
+@require_login
+def consolidation_job_status(job_id):
+    """Status, progress and per-period totals/journals of a job"""
+    job = consolidation_jobs.get_job_status(job_id, session['user_id'])
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, **job})
+
+
+@calc_bp.route('/consolidation_jobs/<int:job_id>/results', methods=['GET'])
+@require_login
+def consolidation_job_results(job_id):
+    """Page of a job's per-lease result rows (?period=0&offset=0&limit=500)"""
+    try:
+        period_index = int(request.args.get('period', 0))
+        offset = max(int(request.args.get('offset', 0)), 0)
+        limit = min(max(int(request.args.get('limit', 500)), 1), 5000)
+    except ValueError:
+        return jsonify({'error': 'period, offset and limit must be integers'}), 400
+    
+    page = consolidation_jobs.get_job_results_page(job_id, session['user_id'], period_index, offset, limit)
+    if not page:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, **page})
+
+
+@calc_bp.route('/consolidation_jobs/<int:job_id>/cancel', methods=['POST'])
+@require_login
+def cancel_consolidation_job(job_id):
+    """Cancel a queued or running job"""
+    if not consolidation_jobs.cancel_job(job_id, session['user_id']):
+        return jsonify({'error': 'Job not found or already finished'}), 404
+    return jsonify({'success': True, 'job_id': job_id, 'cancel_requested': True})
+
+
+def _stream_consolidation(results_processor: ResultsProcessor, lease_data_list: List[LeaseData],
+                          filters: ProcessingFilters, periods: list):
+    """NDJSON lines of a streamed consolidate_reports response"""
+    stream_periods = periods or [(filters.start_date, filters.end_date)]
+    
+    def line(payload: dict) -> str:
+        return current_app.json.dumps(payload) + '\n'
+    
+    try:
+        for kind, period_index, payload in results_processor.iter_bulk_lease_periods(lease_data_list, stream_periods):
+            if kind == 'result':
+                yield line({'type': 'result', 'period_index': period_index, 'result': payload})
+            else:
+                period_from, period_to = stream_periods[period_index]
+                yield line({'type': 'summary', 'period_index': period_index,
+                            **_consolidation_summary(period_from, period_to, payload)})
+        yield line({'type': 'end', 'success': True})
+    except Exception as e:
+        logger.error(f"❌ Error streaming consolidate_reports: {e}", exc_info=True)
+        yield line({'type': 'error', 'error': str(e)})
+
+
+def _parse_consolidation_request(data: dict) -> tuple:
+    """
+    Lease IDs, ProcessingFilters and reporting periods of a consolidate request
+    Raises ValueError for invalid input
+    """
+    # Get lease IDs to process
+    lease_ids = data.get('lease_ids', [])
+    if not lease_ids:
+        raise ValueError('No lease IDs provided')
+    
+    # Parse date range filters
+    from_date = _parse_date(data.get('from_date'))
+    to_date = _parse_date(data.get('to_date'))
+    
+    if not from_date:
+        from_date = date.today()
+    if not to_date:
+        to_date = date.today()
+    
+    # Optional list of reporting periods (e.g. monthly windows plus quarter and YTD)
+    periods = []
+    for period in data.get('periods') or []:
+        period_from = _parse_date(period.get('from_date'))
+        period_to = _parse_date(period.get('to_date'))
+        if not period_from or not period_to:
+            raise ValueError(f"Invalid reporting period: {period}")
+        periods.append((period_from, period_to))
+    
+    # Create filters
+    filters = ProcessingFilters(
+        start_date=from_date,
+        end_date=to_date,
+        gaap_standard=data.get('gaap_standard', 'IFRS'),
+        cost_center_filter=data.get('cost_center_filter'),
+        entity_filter=data.get('entity_filter'),
+        asset_class_filter=data.get('asset_class_filter'),
+        profit_center_filter=data.get('profit_center_filter')
+    )
+    
+    return lease_ids, filters, periods
+
+
+def _load_consolidation_leases(lease_ids: list, user_id: int, gaap_standard: str) -> List[LeaseData]:
+    """Fetch the user's leases from the database and map them to LeaseData (skipping missing ones)"""
+    logger.info(f"📋 Fetching {len(lease_ids)} leases from database...")
+    leases = database.get_leases_bulk(lease_ids, user_id)
+    lease_data_list = []
+    missing = 0
+    
+    for lease_id in lease_ids:
+        try:
+            lease_dict = leases.get(int(lease_id))
+        except (ValueError, TypeError):
+            lease_dict = None
+        if not lease_dict:
+            missing += 1
+            continue
+        
+        try:
+            # Map to LeaseData
+            lease_data = _map_lease_to_leasedata(lease_dict)
+            lease_data.gaap_standard = gaap_standard
+            lease_data_list.append(lease_data)
+            
+        except Exception as e:
+            logger.error(f"❌ Error mapping lease {lease_id}: {e}")
+            continue
+    
+    if missing:
+        logger.warning(f"⚠️  {missing} lease(s) not found or not accessible")
+    logger.info(f"✅ Mapped {len(lease_data_list)} leases to LeaseData")
+    return lease_data_list
+
+
+def _consolidation_summary(from_date: date, to_date: date, bulk_result: dict) -> dict:
+    """Totals, journals, statistics and date range of one bulk result (everything but the rows)"""
+    return {
+        'aggregated_totals': bulk_result['aggregated_totals'],
+        'consolidated_journals': bulk_result['consolidated_journals'],
+        'statistics': {
+            'processed_count': bulk_result['processed_count'],
+            'skipped_count': bulk_result['skipped_count'],
+            'total_count': bulk_result['total_count']
+        },
+        'date_range': {
+            'from_date': from_date.isoformat(),
+            'to_date': to_date.isoformat()
+        }
+    }
@@ -27,6 +27,26 @@ class Config:
     # CORS settings
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
     
+    # Lease calculation engine for basic_calc(): 'vectorized' (NumPy) or 'scalar'
+    CALCULATION_ENGINE = os.environ.get('CALCULATION_ENGINE', 'vectorized')
+    
+    # Generated schedules kept in the shared LRU schedule cache (0 disables it)
+    SCHEDULE_CACHE_SIZE = int(os.environ.get('SCHEDULE_CACHE_SIZE', 256))
+    
+    # Bulk consolidation process pool (BULK_WORKERS=1 keeps it serial, 0 = one per CPU)
+    BULK_WORKERS = int(os.environ.get('BULK_WORKERS', 1))
+    BULK_CHUNK_SIZE = int(os.environ.get('BULK_CHUNK_SIZE', 50))
+    BULK_LEASE_TIMEOUT = float(os.environ.get('BULK_LEASE_TIMEOUT', 30))
+    BULK_PARALLEL_THRESHOLD = int(os.environ.get('BULK_PARALLEL_THRESHOLD', 200))
+    
+    # Background workers for asynchronous consolidation jobs
+    CONSOLIDATION_JOB_WORKERS = int(os.environ.get('CONSOLIDATION_JOB_WORKERS', 2))
+    
+    # SQLite connection pool (idle connections kept open) and per-connection cache/mmap sizes
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 8))
+    DB_CACHE_SIZE_KB = int(os.environ.get('DB_CACHE_SIZE_KB', 16384))
+    DB_MMAP_SIZE = int(os.environ.get('DB_MMAP_SIZE', 64 * 1024 * 1024))
+    
     # Logging
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
     LOG_BACKUP_COUNT = 5
@@ -0,0 +1,187 @@
+"""
+Asynchronous Consolidation Jobs
+Runs consolidate_reports computations on a background worker pool
+
+A job is queued in the consolidation_jobs table and returns immediately with its id.
+A worker thread loads the leases, runs ResultsProcessor (recording progress and
+honouring cancel requests between leases) and stores the per-lease result rows in
+batches as they are produced, then the per-period summaries, in SQLite. Results can
+be fetched page by page and re-downloaded without recomputation, and a job never
+holds the whole portfolio's result rows in memory.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+import json
+import logging
+import threading
+import time
+from . import database
+from .lease_accounting.core.results_processor import ResultsProcessor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_WORKERS = 2
+PROGRESS_INTERVAL = 1.0  # Seconds between progress writes
+RESULT_BATCH_SIZE = 500  # Result rows per insert
+
+_job_workers = DEFAULT_JOB_WORKERS
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class JobCancelled(Exception):
+    """Raised from the progress callback when a job's cancellation was requested"""
+
+
+def configure_consolidation_jobs(workers: Optional[int] = None) -> None:
+    """Set the number of background job workers (takes effect for a new pool)"""
+    global _job_workers
+    if workers is not None:
+        _job_workers = max(workers, 1)
+
+
+def recover_interrupted_jobs() -> int:
+    """Fail jobs that were queued or running when the previous process stopped"""
+    count = database.fail_interrupted_consolidation_jobs()
+    if count:
+        logger.warning(f"⚠️  Marked {count} interrupted consolidation job(s) as failed")
+    return count
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_job_workers, thread_name_prefix='consolidation-job')
+        return _executor
+
+
+def submit_consolidation_job(user_id: int, data: dict) -> int:
+    """
+    Queue a consolidate_reports request body for background processing
+    Raises ValueError for invalid input (checked before queueing)
+    """
+    from .calculate_backend import _parse_consolidation_request
+    lease_ids, _, _ = _parse_consolidation_request(data)
+
+    job_id = database.create_consolidation_job(user_id, json.dumps(data), len(lease_ids))
+    _get_executor().submit(_run_consolidation_job, job_id, user_id, data)
+    logger.info(f"📥 Queued consolidation job {job_id}: {len(lease_ids)} leases")
+    return job_id
+
+
+def _run_consolidation_job(job_id: int, user_id: int, data: dict) -> None:
+    """Worker: compute and persist one job"""
+    from .calculate_backend import (
+        _parse_consolidation_request, _load_consolidation_leases, _consolidation_summary
+    )
+
+    if not database.start_consolidation_job(job_id):
+        logger.info(f"⏹️  Consolidation job {job_id} cancelled before start")
+        return
+
+    try:
+        lease_ids, filters, periods = _parse_consolidation_request(data)
+        if not periods:
+            periods = [(filters.start_date, filters.end_date)]
+
+        lease_data_list = _load_consolidation_leases(lease_ids, user_id, filters.gaap_standard)
+        if not lease_data_list:
+            database.finish_consolidation_job(job_id, 'failed', error='No valid leases found')
+            return
+
+        last_write = [0.0]
+
+        def progress(done: int, total: int) -> None:
+            now = time.monotonic()
+            if done < total and now - last_write[0] < PROGRESS_INTERVAL:
+                return
+            last_write[0] = now
+            if database.update_consolidation_job_progress(job_id, done, total):
+                raise JobCancelled()
+
+        # Record the mapped lease count before the first lease finishes
+        if database.update_consolidation_job_progress(job_id, 0, len(lease_data_list)):
+            raise JobCancelled()
+
+        # Result rows are written in batches as leases finish; only the summaries are kept
+        summaries = [None] * len(periods)
+        next_seq = [0] * len(periods)
+        batch = []
+        for kind, period_index, payload in ResultsProcessor(filters).iter_bulk_lease_periods(
+                lease_data_list, periods, progress=progress):
+            if kind == 'summary':
+                summaries[period_index] = payload
+                continue
+            batch.append((period_index, next_seq[period_index], json.dumps(payload, default=str)))
+            next_seq[period_index] += 1
+            if len(batch) >= RESULT_BATCH_SIZE:
+                database.add_consolidation_job_results(job_id, batch)
+                batch = []
+        if batch:
+            database.add_consolidation_job_results(job_id, batch)
+
+        summary = {
+            'periods': [
+                _consolidation_summary(period_from, period_to, bulk_summary)
+                for (period_from, period_to), bulk_summary in zip(periods, summaries)
+            ]
+        }
+        database.finish_consolidation_job(job_id, 'completed', summary=json.dumps(summary, default=str))
+        logger.info(f"✅ Consolidation job {job_id} completed: {len(lease_data_list)} leases, "
+                    f"{len(periods)} period(s)")
+
+    except JobCancelled:
+        database.finish_consolidation_job(job_id, 'cancelled')
+        logger.info(f"⏹️  Consolidation job {job_id} cancelled")
+    except Exception as e:
+        logger.error(f"❌ Consolidation job {job_id} failed: {e}", exc_info=True)
+        database.finish_consolidation_job(job_id, 'failed', error=str(e))
+
+
+def get_job_status(job_id: int, user_id: int) -> Optional[Dict]:
+    """Status, progress and (when completed) per-period summaries of a user's job"""
+    job = database.get_consolidation_job(job_id, user_id)
+    if not job:
+        return None
+
+    summary = json.loads(job['summary']) if job.get('summary') else None
+    return {
+        'job_id': job['job_id'],
+        'status': job['status'],
+        'progress': {
+            'processed_count': job['processed_count'],
+            'total_count': job['total_count'],
+        },
+        'cancel_requested': bool(job['cancel_requested']),
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+        'periods': summary['periods'] if summary else None,
+    }
+
+
+def get_job_results_page(job_id: int, user_id: int, period_index: int = 0,
+                         offset: int = 0, limit: int = 500) -> Optional[Dict]:
+    """One page of a completed job's result rows for a reporting period"""
+    job = database.get_consolidation_job(job_id, user_id)
+    if not job:
+        return None
+
+    rows, total = database.get_consolidation_job_results(job_id, period_index, offset, limit)
+    return {
+        'job_id': job_id,
+        'status': job['status'],
+        'period_index': period_index,
+        'offset': offset,
+        'limit': limit,
+        'total': total,
+        'results': [json.loads(row) for row in rows],
+    }
+
+
+def cancel_job(job_id: int, user_id: int) -> bool:
+    """Request cancellation; a running job stops at its next progress check"""
+    return database.cancel_consolidation_job(job_id, user_id)
@@ -2,29 +2,177 @@
 Simplified Database layer - Users only
 """
 import sqlite3
+import base64
+import binascii
+import json
+from datetime import date
 from typing import Dict, Optional
 import bcrypt
 from contextlib import contextmanager
+from functools import lru_cache
 import logging
+import os
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
 DATABASE_PATH = "lease_management.db"
 
+# Bump when a migration is added to init_database (users ALTERs, migrate_leases_table)
+SCHEMA_VERSION = 2
+
+DEFAULT_POOL_SIZE = 8  # Idle connections kept open for reuse
+DEFAULT_CACHE_SIZE_KB = 16 * 1024  # Page cache per connection
+DEFAULT_MMAP_SIZE = 64 * 1024 * 1024  # Bytes of the database file memory-mapped per connection
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+class ConnectionPool:
+    """
+    Pool of open SQLite connections (WAL journal, synchronous=NORMAL, tuned cache/mmap)
+    Each get_db_connection() block checks out its own connection, so transactions are
+    isolated exactly as with one connection per call; the connection is returned to the
+    pool after commit/rollback instead of being closed.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+                 mmap_size: int = DEFAULT_MMAP_SIZE, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
+        self.pool_size = pool_size
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self._idle = []  # (path, connection), most recently returned last
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.created = 0
+        self.reused = 0
+        self.closed = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        path = DATABASE_PATH
+        conn = None
+        stale = []
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: never share the parent's connections
+                self._idle = []
+                self._pid = os.getpid()
+            while self._idle:
+                idle_path, idle_conn = self._idle.pop()
+                if idle_path == path:
+                    conn = idle_conn
+                    break
+                stale.append(idle_conn)
+            if conn is not None:
+                self.reused += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        self._close_all(stale)
+
+        if conn is None:
+            try:
+                conn = self._connect(path)
+            except Exception:
+                with self._lock:
+                    self.in_use -= 1
+                raise
+            with self._lock:
+                self.created += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection, reusable: bool = True) -> None:
+        try:
+            reusable = reusable and not conn.in_transaction
+        except sqlite3.ProgrammingError:
+            reusable = False  # Closed by the caller
+        with self._lock:
+            self.in_use -= 1
+            if reusable and len(self._idle) < self.pool_size:
+                self._idle.append((DATABASE_PATH, conn))
+                return
+        self._close_all([conn])
+
+    def clear(self) -> None:
+        """Close all idle connections (new settings apply to connections opened afterwards)"""
+        with self._lock:
+            idle = [conn for _, conn in self._idle]
+            self._idle = []
+        self._close_all(idle)
+
+    def _close_all(self, connections) -> None:
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        if connections:
+            with self._lock:
+                self.closed += len(connections)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'idle': len(self._idle),
+                'in_use': self.in_use,
+                'peak_in_use': self.peak_in_use,
+                'created': self.created,
+                'reused': self.reused,
+                'closed': self.closed,
+                'cache_size_kb': self.cache_size_kb,
+                'mmap_size': self.mmap_size,
+            }
+
+
+_pool = ConnectionPool()
+
+
+def configure_database(pool_size: Optional[int] = None, cache_size_kb: Optional[int] = None,
+                       mmap_size: Optional[int] = None) -> None:
+    """Tune the connection pool (0 pool_size closes every connection after use)"""
+    if pool_size is not None:
+        _pool.pool_size = max(pool_size, 0)
+    if cache_size_kb is not None:
+        _pool.cache_size_kb = cache_size_kb
+    if mmap_size is not None:
+        _pool.mmap_size = mmap_size
+    _pool.clear()
+
+
+def get_connection_pool_stats() -> Dict:
+    """Connection pool counters for monitoring"""
+    return _pool.stats()
+
 
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
+    """Context manager for database connections (pooled; commits on success, rolls back on error)"""
+    conn = _pool.acquire()
+    reusable = True
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            reusable = False
         raise
     finally:
-        conn.close()
+        _pool.release(conn, reusable)
 
 
 def init_database():
@@ -154,30 +302,117 @@ def init_database():
                 sent_at TEXT DEFAULT CURRENT_TIMESTAMP,
                 is_read INTEGER DEFAULT 0,
                 is_dismissed INTEGER DEFAULT 0,
+                rule_id INTEGER,
                 FOREIGN KEY (lease_id) REFERENCES leases (lease_id),
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
         """)
         
-        # Add role and is_active columns if they don't exist (migration for existing databases)
-        try:
-            conn.execute("ALTER TABLE users ADD COLUMN role TEXT DEFAULT 'user'")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        try:
-            conn.execute("ALTER TABLE users ADD COLUMN is_active INTEGER DEFAULT 1")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Migrate leases table - add missing columns if they don't exist
-        migrate_leases_table(conn)
+        # Migrations run only when the stored schema version differs
+        create_schema_version_table(conn)
+        stored_version = get_schema_version(conn)
+        if stored_version != SCHEMA_VERSION:
+            # Add role and is_active columns if they don't exist (migration for existing databases)
+            try:
+                conn.execute("ALTER TABLE users ADD COLUMN role TEXT DEFAULT 'user'")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            
+            try:
+                conn.execute("ALTER TABLE users ADD COLUMN is_active INTEGER DEFAULT 1")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            
+            # Migrate leases table - add missing columns if they don't exist
+            migrate_leases_table(conn)
+            
+            # Notification rule that produced each notification (deduplication key)
+            try:
+                conn.execute("ALTER TABLE user_notifications ADD COLUMN rule_id INTEGER")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            refresh_schema()
+            backfill_notification_rule_ids(conn)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (SCHEMA_VERSION,))
+            logger.info(f"✅ Schema migrated from version {stored_version} to {SCHEMA_VERSION}")
+        refresh_schema()
         
         create_document_table(conn)
         create_audit_table(conn)
+        create_consolidation_job_tables(conn)
+        create_lease_schedule_table(conn)
+        create_managed_indexes(conn)
         logger.info("✅ Database initialized (users and leases tables)")
 
 
+def create_schema_version_table(conn):
+    """Create the schema_version table (one row per applied schema version)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER NOT NULL,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def get_schema_version(conn) -> int:
+    """Latest applied schema version (0 for a database that predates schema_version)"""
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+# Column names per (database path, table), loaded on first use and cleared by refresh_schema()
+_schema_columns: Dict[tuple, frozenset] = {}
+
+
+def get_table_columns(conn, table: str) -> frozenset:
+    """Cached column names of a table"""
+    key = (DATABASE_PATH, table)
+    columns = _schema_columns.get(key)
+    if columns is None:
+        columns = frozenset(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+        _schema_columns[key] = columns
+    return columns
+
+
+def backfill_notification_rule_ids(conn):
+    """
+    Set rule_id on notifications created before it was recorded: the rule whose recipient role
+    and trigger date (target_date + days_in_advance) match. Of undismissed copies of the same
+    (lease, user, target date), only the oldest is attributed, so the dedup index can be built
+    """
+    lease_columns = get_table_columns(conn, 'leases')
+    rules = conn.execute(
+        "SELECT rule_id, trigger_field, days_in_advance, recipient_role FROM notification_settings ORDER BY rule_id"
+    ).fetchall()
+    backfilled = 0
+    for rule in rules:
+        if rule['trigger_field'] not in lease_columns:
+            continue
+        cursor = conn.execute(f"""
+            UPDATE user_notifications SET rule_id = ?
+            WHERE rule_id IS NULL
+            AND user_id IN (SELECT user_id FROM users WHERE role = ?)
+            AND lease_id IN (
+                SELECT lease_id FROM leases
+                WHERE date({rule['trigger_field']}) = date(user_notifications.target_date, ?)
+            )
+            AND (is_dismissed = 1 OR notification_id IN (
+                SELECT MIN(notification_id) FROM user_notifications
+                WHERE rule_id IS NULL AND is_dismissed = 0
+                GROUP BY lease_id, user_id, target_date
+            ))
+        """, (rule['rule_id'], rule['recipient_role'], f"{rule['days_in_advance']:+d} days"))
+        backfilled += cursor.rowcount
+    if backfilled:
+        logger.info(f"✅ Backfilled rule_id on {backfilled} notification(s)")
+
+
+def refresh_schema():
+    """Forget cached table columns (call after altering a table)"""
+    _schema_columns.clear()
+
+
 def create_audit_table(conn):
     """Create the lease_data_audit table"""
     conn.execute("""
@@ -216,6 +451,185 @@ def create_document_table(conn):
     logger.info("✅ lease_documents table initialized")
 
 
+def create_consolidation_job_tables(conn):
+    """Create the consolidation_jobs and consolidation_job_results tables"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS consolidation_jobs (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            params TEXT NOT NULL,
+            total_count INTEGER DEFAULT 0,
+            processed_count INTEGER DEFAULT 0,
+            summary TEXT,
+            error TEXT,
+            cancel_requested INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            started_at TEXT,
+            finished_at TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (user_id)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS consolidation_job_results (
+            job_id INTEGER NOT NULL,
+            period_index INTEGER NOT NULL,
+            seq INTEGER NOT NULL,
+            result TEXT NOT NULL,
+            PRIMARY KEY (job_id, period_index, seq),
+            FOREIGN KEY (job_id) REFERENCES consolidation_jobs (job_id)
+        )
+    """)
+    logger.info("✅ consolidation job tables initialized")
+
+
+def create_lease_schedule_table(conn):
+    """Create the lease_schedules table (materialized schedules, one per lease)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lease_schedules (
+            lease_id INTEGER PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            row_count INTEGER,
+            schedule BLOB NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (lease_id) REFERENCES leases (lease_id)
+        )
+    """)
+    logger.info("✅ lease_schedules table initialized")
+
+
+# Secondary indexes for the hot query paths: name -> (table, columns)
+# A column may be an expression over one column, e.g. date(lease_end_date)
+# create_managed_indexes() creates missing ones, rebuilds changed ones and drops
+# indexes it created earlier that were removed from this set (recorded in managed_indexes)
+MANAGED_INDEXES = {
+    'idx_leases_user_created': ('leases', 'user_id, created_at'),
+    'idx_leases_created': ('leases', 'created_at'),
+    # Notification rule trigger fields (matched on date() so values with a time part fire)
+    'idx_leases_end_date_status': ('leases', 'date(lease_end_date), status'),
+    'idx_leases_termination_date_status': ('leases', 'date(termination_date), status'),
+    # Dashboard stats (covering GROUP BY status / company_name)
+    'idx_leases_status_end': ('leases', 'status, lease_end_date'),
+    'idx_leases_user_status_end': ('leases', 'user_id, status, lease_end_date'),
+    'idx_leases_company_end': ('leases', 'company_name, lease_end_date'),
+    'idx_leases_user_company_end': ('leases', 'user_id, company_name, lease_end_date'),
+    'idx_audit_change_timestamp': ('lease_data_audit', 'change_timestamp'),
+    'idx_audit_lease_timestamp': ('lease_data_audit', 'lease_id, change_timestamp'),
+    'idx_audit_changed_by_timestamp': ('lease_data_audit', 'changed_by_username, change_timestamp'),
+    'idx_notifications_user_dismissed': ('user_notifications', 'user_id, is_dismissed, sent_at'),
+    'idx_notifications_lease_user_target': ('user_notifications', 'lease_id, user_id, target_date'),
+    'idx_notifications_dedup': ('user_notifications', 'rule_id, lease_id, user_id, target_date'),
+    'idx_documents_lease': ('lease_documents', 'lease_id, uploaded_at'),
+    # Recipients of a notification rule
+    'idx_users_role_active': ('users', 'role, is_active'),
+    'idx_consolidation_jobs_user': ('consolidation_jobs', 'user_id'),
+}
+
+# MANAGED_INDEXES entries created as UNIQUE
+UNIQUE_INDEXES = {'idx_notifications_dedup'}
+
+# MANAGED_INDEXES entries created as partial indexes: name -> WHERE clause
+# (dismissed notifications do not block a new one for the same rule, lease, user and date)
+PARTIAL_INDEXES = {'idx_notifications_dedup': 'is_dismissed = 0'}
+
+
+def _index_sql(name: str, table: str, columns: str) -> str:
+    unique = 'UNIQUE ' if name in UNIQUE_INDEXES else ''
+    where = f" WHERE {PARTIAL_INDEXES[name]}" if name in PARTIAL_INDEXES else ''
+    return f"CREATE {unique}INDEX {name} ON {table} ({columns}){where}"
+
+
+def _index_columns(columns: str) -> list:
+    """Table columns an index column list refers to (date(x) -> x)"""
+    return [re.sub(r'^\w+\((\w+)\)$', r'\1', column.strip()) for column in columns.split(',')]
+
+
+def create_managed_indexes(conn):
+    """
+    Create/migrate the MANAGED_INDEXES set
+    Only indexes recorded in managed_indexes are ever dropped; indexes created by operators
+    or other modules are left alone
+    """
+    conn.execute("CREATE TABLE IF NOT EXISTS managed_indexes (name TEXT PRIMARY KEY)")
+    existing = {
+        row['name']: row['sql']
+        for row in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index'")
+    }
+    for row in conn.execute("SELECT name FROM managed_indexes").fetchall():
+        name = row['name']
+        if name not in MANAGED_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+            conn.execute("DELETE FROM managed_indexes WHERE name = ?", (name,))
+            logger.info(f"🗑️  Dropped retired index {name}")
+
+    created = 0
+    for name, (table, columns) in MANAGED_INDEXES.items():
+        sql = _index_sql(name, table, columns)
+        if existing.get(name) == sql:
+            continue
+        table_columns = get_table_columns(conn, table)
+        if not all(column in table_columns for column in _index_columns(columns)):
+            logger.debug(f"Skipping index {name}: {table} lacks one of ({columns})")
+            continue
+        if name in existing:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute(sql)
+        created += 1
+    conn.executemany(
+        "INSERT OR IGNORE INTO managed_indexes (name) VALUES (?)",
+        [(row['name'],) for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+         if row['name'] in MANAGED_INDEXES]
+    )
+    if created:
+        logger.info(f"✅ Created {created} index(es)")
+
+
+def _hot_queries(conn) -> list:
+    """
+    Hot queries whose plans must use an index: (name, sql, sample params), built by the
+    same helpers that run them
+    """
+    from lease_application.lease_management.notifications import notification_hot_queries
+
+    cursor = _encode_cursor('2025-01-01 00:00:00', 1)
+    queries = [
+        ('all leases', *_keyset_sql(*LEASE_LISTING, '*', *_lease_conditions(), None, None)),
+        ('leases by user', *_keyset_sql(*LEASE_LISTING, '*', *_lease_conditions(user_id=1), None, None)),
+        ('leases page', *_keyset_sql(*LEASE_LISTING, '*', *_lease_conditions(), cursor, 100)),
+        ('leases page by user', *_keyset_sql(*LEASE_LISTING, '*', *_lease_conditions(user_id=1), cursor, 100)),
+        ('audit log', *_keyset_sql(*AUDIT_LISTING, '*', *_audit_conditions(), None, None)),
+        ('lease audit log', *_keyset_sql(*AUDIT_LISTING, '*', *_audit_conditions(lease_id=1), None, None)),
+        ('audit log page', *_keyset_sql(*AUDIT_LISTING, '*', *_audit_conditions(), cursor, 100)),
+        ('audit log page by user',
+         *_keyset_sql(*AUDIT_LISTING, '*', *_audit_conditions(changed_by='admin'), cursor, 100)),
+        ('lease documents', _DOCUMENTS_BY_LEASE_SQL, (1,)),
+        ('consolidation jobs by user', _CONSOLIDATION_JOBS_BY_USER_SQL, (1, 50)),
+    ]
+    for group_column in ('status', 'company_name'):
+        queries.append((f'stats by {group_column}', *_lease_stats_sql(group_column, None)))
+        queries.append((f'stats by {group_column} for user', *_lease_stats_sql(group_column, 1)))
+    return queries + notification_hot_queries(conn)
+
+
+def check_query_plans() -> list:
+    """
+    EXPLAIN QUERY PLAN every hot query; returns (name, plan) for queries that scan a
+    whole table or sort with a temporary b-tree instead of using an index
+    """
+    problems = []
+    with get_db_connection() as conn:
+        for name, sql, params in _hot_queries(conn):
+            try:
+                plan = [row['detail'] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+            except sqlite3.OperationalError:
+                continue  # Column not present in this database (e.g. an optional trigger field)
+            if any((step.startswith('SCAN ') and 'USING' not in step) or 'TEMP B-TREE' in step for step in plan):
+                problems.append((name, plan))
+    for name, plan in problems:
+        logger.warning(f"⚠️  Query '{name}' does not use an index: {'; '.join(plan)}")
+    return problems
+
+
 def save_document_metadata(lease_id, file_name, file_path, file_size, uploaded_by, document_type=None):
     """Saves document metadata to the database."""
     with get_db_connection() as conn:
@@ -226,14 +640,16 @@ def save_document_metadata(lease_id, file_name, file_path, file_size, uploaded_b
         )
 
 
+_DOCUMENTS_BY_LEASE_SQL = """
+    SELECT document_id, lease_id, file_name, file_size, uploaded_at, uploaded_by, document_type
+    FROM lease_documents WHERE lease_id = ? ORDER BY uploaded_at DESC
+"""
+
+
 def get_documents_by_lease(lease_id):
     """Retrieves all documents for a given lease, excluding file_path."""
     with get_db_connection() as conn:
-        rows = conn.execute(
-            """SELECT document_id, lease_id, file_name, file_size, uploaded_at, uploaded_by, document_type
-               FROM lease_documents WHERE lease_id = ? ORDER BY uploaded_at DESC""",
-            (lease_id,)
-        ).fetchall()
+        rows = conn.execute(_DOCUMENTS_BY_LEASE_SQL, (lease_id,)).fetchall()
         return [dict(row) for row in rows]
 
 
@@ -353,7 +769,10 @@ def migrate_leases_table(conn):
     except Exception as e:
         logger.warning(f"⚠️ Error checking for column migration: {e}")
     
+    existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(leases)")}
     for column_name, column_def in migrations:
+        if column_name in existing_columns:
+            continue
         try:
             conn.execute(f"ALTER TABLE leases ADD COLUMN {column_name} {column_def}")
             logger.info(f"✅ Added column: {column_name}")
@@ -411,6 +830,7 @@ def submit_lease_for_review(lease_id: int, user_id: int):
             "UPDATE leases SET status = 'submitted', submitted_by = (SELECT username FROM users WHERE user_id = ?), submitted_at = CURRENT_TIMESTAMP WHERE lease_id = ? AND user_id = ?",
             (user_id, lease_id, user_id)
         )
+        _invalidate_lease_schedule(conn, lease_id)
     new_lease = get_lease(lease_id, user_id)
     user = get_user(user_id)
     username = user.get('username', str(user_id))
@@ -423,6 +843,7 @@ def approve_lease(lease_id: int, approver_user_id: int):
             "UPDATE leases SET status = 'approved', approved_by = (SELECT username FROM users WHERE user_id = ?), approved_at = CURRENT_TIMESTAMP, last_reviewed_date = CURRENT_TIMESTAMP, reviewed_by = (SELECT username FROM users WHERE user_id = ?) WHERE lease_id = ?",
             (approver_user_id, approver_user_id, lease_id)
         )
+        _invalidate_lease_schedule(conn, lease_id)
     new_lease = get_lease(lease_id)
     user = get_user(approver_user_id)
     username = user.get('username', str(approver_user_id))
@@ -435,6 +856,7 @@ def reject_lease(lease_id: int, approver_user_id: int, reason: str):
             "UPDATE leases SET status = 'rejected', rejection_reason = ?, approved_by = NULL, approved_at = NULL, last_reviewed_date = CURRENT_TIMESTAMP, reviewed_by = (SELECT username FROM users WHERE user_id = ?) WHERE lease_id = ?",
             (reason, approver_user_id, lease_id)
         )
+        _invalidate_lease_schedule(conn, lease_id)
     new_lease = get_lease(lease_id)
     user = get_user(approver_user_id)
     username = user.get('username', str(approver_user_id))
@@ -500,24 +922,35 @@ def get_user_by_username(username: str) -> Optional[Dict]:
 
 # ============ LEASE MANAGEMENT ============
 
+BULK_FETCH_CHUNK_SIZE = 500  # Ids per IN (...) query (stays under SQLITE_MAX_VARIABLE_NUMBER)
+
 def add_data_change_audit_log(lease_id, user_id, username, field_name, old_value, new_value, action='UPDATE'):
     """Logs a specific data field change for a lease."""
     with get_db_connection() as conn:
-        conn.execute(
-            """
-            INSERT INTO lease_data_audit (lease_id, changed_by_user_id, changed_by_username, field_name, old_value, new_value, action)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (lease_id, user_id, username, field_name, str(old_value), str(new_value), action)
-        )
+        _insert_audit_rows(conn, [(lease_id, user_id, username, field_name, old_value, new_value, action)])
+
+
+def _insert_audit_rows(conn, rows: list):
+    """Write (lease_id, user_id, username, field_name, old_value, new_value, action) audit rows on conn"""
+    conn.executemany(
+        """
+        INSERT INTO lease_data_audit (lease_id, changed_by_user_id, changed_by_username, field_name, old_value, new_value, action)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [(lease_id, user_id, username, field_name, str(old_value), str(new_value), action)
+         for lease_id, user_id, username, field_name, old_value, new_value, action in rows]
+    )
+
+
+def _username(conn, user_id: int) -> str:
+    row = conn.execute("SELECT username FROM users WHERE user_id = ?", (user_id,)).fetchone()
+    return row['username'] if row else str(user_id)
 
 
 def save_lease(user_id: int, lease_data: Dict, role: str = 'user') -> tuple:
-    """Save or update a lease and audit the changes."""
+    """Save or update a lease and audit the changes (lease row and audit rows in one transaction)."""
     lease_id = lease_data.get('lease_id')
     old_lease_data = None
-    if lease_id:
-        old_lease_data = get_lease(lease_id)
 
     field_mapping = {
         'agreement_title': 'agreement_title', 'company_name': 'company_name', 'escalation_percentage': 'escalation_percentage',
@@ -599,65 +1032,107 @@ def save_lease(user_id: int, lease_data: Dict, role: str = 'user') -> tuple:
 
     if lease_id:
         # Update
-        update_fields = [k for k in lease_data_to_save.keys() if k not in ['lease_id', 'user_id']]
-        if not update_fields:
-            return lease_id, old_lease_data
-        
         with get_db_connection() as conn:
-            cursor = conn.execute("PRAGMA table_info(leases)")
-            existing_columns = {row[1] for row in cursor.fetchall()}
+            row = conn.execute("SELECT * FROM leases WHERE lease_id = ?", (lease_id,)).fetchone()
+            old_lease_data = _lease_row_to_dict(row) if row else None
+            
+            update_fields = [k for k in lease_data_to_save.keys() if k not in ['lease_id', 'user_id']]
+            if not update_fields:
+                return lease_id, old_lease_data
             
-            valid_update_fields = {f for f in update_fields if f in existing_columns}
+            existing_columns = get_table_columns(conn, 'leases')
+            valid_update_fields = tuple(f for f in update_fields if f in existing_columns)
             if not valid_update_fields:
                 return lease_id, old_lease_data
 
-            set_clause = ', '.join([f"{f} = ?" for f in valid_update_fields]) + ", updated_at = CURRENT_TIMESTAMP"
             update_values = [lease_data_to_save.get(f) for f in valid_update_fields]
             update_values.append(lease_id)
-            
             if role != 'admin':
                 update_values.append(user_id)
-                conn.execute(f"UPDATE leases SET {set_clause} WHERE lease_id = ? AND user_id = ?", update_values)
-            else:
-                conn.execute(f"UPDATE leases SET {set_clause} WHERE lease_id = ?", update_values)
-        
-        if old_lease_data:
-            user = get_user(user_id)
-            username = user.get('username', str(user_id))
-            for key, new_value in lease_data_to_save.items():
-                if key in ['user_id', 'lease_id', 'created_at', 'updated_at']:
-                    continue
-                old_value = old_lease_data.get(key)
-                if str(old_value) != str(new_value):
-                    add_data_change_audit_log(lease_id, user_id, username, key, old_value, new_value, action='UPDATE')
+            cursor = conn.execute(_lease_update_sql(valid_update_fields, role != 'admin'), update_values)
+            if cursor.rowcount:
+                _invalidate_lease_schedule(conn, lease_id)
+            
+            if cursor.rowcount and old_lease_data:
+                username = _username(conn, user_id)
+                _insert_audit_rows(conn, [
+                    (lease_id, user_id, username, key, old_lease_data.get(key), new_value, 'UPDATE')
+                    for key, new_value in lease_data_to_save.items()
+                    if key not in ['user_id', 'lease_id', 'created_at', 'updated_at']
+                    and str(old_lease_data.get(key)) != str(new_value)
+                ])
         
         return lease_id, old_lease_data
     else:
         # Create
         with get_db_connection() as conn:
-            cursor = conn.execute("PRAGMA table_info(leases)")
-            existing_columns = {row[1] for row in cursor.fetchall()}
-            
-            valid_fields = {f for f in lease_data_to_save.keys() if f in existing_columns}
+            existing_columns = get_table_columns(conn, 'leases')
+            valid_fields = tuple(f for f in lease_data_to_save.keys() if f in existing_columns)
             if not valid_fields:
                 raise ValueError("No valid fields to insert")
 
-            placeholders = ', '.join(['?' for _ in valid_fields])
-            field_names = ', '.join(valid_fields)
             field_values = [lease_data_to_save.get(f) for f in valid_fields]
-            
-            cursor = conn.execute(f"INSERT INTO leases ({field_names}) VALUES ({placeholders})", field_values)
+            cursor = conn.execute(_lease_insert_sql(valid_fields), field_values)
             new_lease_id = cursor.lastrowid
 
-        user = get_user(user_id)
-        username = user.get('username', str(user_id))
-        for key, value in lease_data_to_save.items():
-            if key not in ['user_id', 'lease_id']:
-                add_data_change_audit_log(new_lease_id, user_id, username, key, None, value, action='CREATE')
+            username = _username(conn, user_id)
+            _insert_audit_rows(conn, [
+                (new_lease_id, user_id, username, key, None, value, 'CREATE')
+                for key, value in lease_data_to_save.items()
+                if key not in ['user_id', 'lease_id']
+            ])
         
         return new_lease_id, old_lease_data
 
 
+# Statement text per column tuple: identical saves reuse one SQL string, so sqlite3's
+# statement cache keeps them prepared
+@lru_cache(maxsize=256)
+def _lease_insert_sql(fields: tuple) -> str:
+    placeholders = ', '.join('?' for _ in fields)
+    return f"INSERT INTO leases ({', '.join(fields)}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=256)
+def _lease_update_sql(fields: tuple, check_owner: bool) -> str:
+    set_clause = ', '.join(f"{f} = ?" for f in fields) + ", updated_at = CURRENT_TIMESTAMP"
+    where = "lease_id = ? AND user_id = ?" if check_owner else "lease_id = ?"
+    return f"UPDATE leases SET {set_clause} WHERE {where}"
+
+
+def _lease_row_to_dict(row) -> Dict:
+    """Lease row as a dict with IBR as a float and JSON columns parsed back to objects"""
+    # Use column names as keys to ensure correct field names
+    lease_dict = {key: row[key] for key in row.keys()}
+    
+    # Ensure IBR is properly converted to a number if it exists
+    ibr_value = lease_dict.get('ibr')
+    if ibr_value is not None and ibr_value != '':
+        try:
+            lease_dict['ibr'] = float(ibr_value)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"⚠️ Could not convert IBR to float: {e}")
+    
+    # Parse JSON fields back to objects for form auto-population
+    import json
+    if lease_dict.get('rental_schedule'):
+        try:
+            if isinstance(lease_dict['rental_schedule'], str):
+                lease_dict['rental_schedule'] = json.loads(lease_dict['rental_schedule'])
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"⚠️ Error parsing rental_schedule: {e}")
+            pass  # Keep as string if parsing fails
+    
+    if lease_dict.get('sublease_payment_details'):
+        try:
+            if isinstance(lease_dict['sublease_payment_details'], str):
+                lease_dict['sublease_payment_details'] = json.loads(lease_dict['sublease_payment_details'])
+        except (json.JSONDecodeError, TypeError):
+            pass  # Keep as string if parsing fails
+    
+    return lease_dict
+
+
 def get_lease(lease_id: int, user_id: Optional[int] = None) -> Optional[Dict]:
     """Get lease by ID. If user_id is provided, check for ownership."""
     with get_db_connection() as conn:
@@ -675,43 +1150,45 @@ def get_lease(lease_id: int, user_id: Optional[int] = None) -> Optional[Dict]:
         if not row:
             return None
         
-        # Convert sqlite3.Row to dict properly
-        # Use column names as keys to ensure correct field names
-        lease_dict = {key: row[key] for key in row.keys()}
-        
-        # Log IBR value for debugging
-        ibr_value = lease_dict.get('ibr')
-        logger.info(f"📋 Retrieved lease {lease_id}: IBR = {ibr_value} (type: {type(ibr_value)})")
-        # Ensure IBR is properly converted to a number if it exists
-        if ibr_value is not None and ibr_value != '':
-            try:
-                lease_dict['ibr'] = float(ibr_value)
-                logger.info(f"📋 Converted IBR to float: {lease_dict['ibr']}")
-            except (ValueError, TypeError) as e:
-                logger.warning(f"⚠️ Could not convert IBR to float: {e}")
-        
-        # Parse JSON fields back to objects for form auto-population
-        import json
-        if lease_dict.get('rental_schedule'):
-            try:
-                if isinstance(lease_dict['rental_schedule'], str):
-                    lease_dict['rental_schedule'] = json.loads(lease_dict['rental_schedule'])
-                    logger.debug(f"✅ Parsed rental_schedule from JSON string to list with {len(lease_dict['rental_schedule'])} entries")
-            except (json.JSONDecodeError, TypeError) as e:
-                logger.warning(f"⚠️ Error parsing rental_schedule: {e}")
-                pass  # Keep as string if parsing fails
-        
-        if lease_dict.get('sublease_payment_details'):
-            try:
-                if isinstance(lease_dict['sublease_payment_details'], str):
-                    lease_dict['sublease_payment_details'] = json.loads(lease_dict['sublease_payment_details'])
-            except (json.JSONDecodeError, TypeError):
-                pass  # Keep as string if parsing fails
-        
+        lease_dict = _lease_row_to_dict(row)
+        logger.info(f"📋 Retrieved lease {lease_id}: IBR = {lease_dict.get('ibr')}")
         logger.debug(f"📋 Returning lease_dict with rental_schedule: {type(lease_dict.get('rental_schedule'))}, value: {lease_dict.get('rental_schedule')}")
         return lease_dict
 
 
+def get_leases_bulk(lease_ids: list, user_id: Optional[int] = None) -> Dict[int, Dict]:
+    """
+    Fetch many leases on one connection with chunked IN (...) queries
+    Returns raw rows keyed by lease_id (JSON columns are left as stored); ids that are
+    missing, not owned by user_id or not integers are simply absent
+    """
+    wanted = []
+    for lease_id in lease_ids:
+        try:
+            wanted.append(int(lease_id))
+        except (ValueError, TypeError):
+            continue
+    wanted = list(dict.fromkeys(wanted))
+
+    leases = {}
+    with get_db_connection() as conn:
+        for start in range(0, len(wanted), BULK_FETCH_CHUNK_SIZE):
+            chunk = wanted[start:start + BULK_FETCH_CHUNK_SIZE]
+            placeholders = ', '.join('?' for _ in chunk)
+            if user_id:
+                rows = conn.execute(
+                    f"SELECT * FROM leases WHERE lease_id IN ({placeholders}) AND user_id = ?",
+                    (*chunk, user_id)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT * FROM leases WHERE lease_id IN ({placeholders})", chunk
+                ).fetchall()
+            for row in rows:
+                leases[row['lease_id']] = dict(row)
+    return leases
+
+
 def get_leases_by_user(user_id: int) -> list:
     """Get all leases for a specific user"""
     with get_db_connection() as conn:
@@ -729,6 +1206,200 @@ def get_all_leases() -> list:
         return [dict(row) for row in rows]
 
 
+def _lease_stats_sql(group_column: str, user_id: Optional[int]) -> tuple:
+    """(sql, params) of _lease_stats_rows"""
+    sql = f"""
+        SELECT {group_column} AS grp, COUNT(*) AS total,
+               SUM(CASE WHEN lease_end_date = date(lease_end_date) AND lease_end_date >= ? THEN 1 ELSE 0 END) AS active,
+               SUM(CASE WHEN lease_end_date = date(lease_end_date) AND lease_end_date < ? THEN 1 ELSE 0 END) AS expired
+        FROM leases
+    """
+    today = date.today().isoformat()
+    params = [today, today]
+    if user_id is not None:
+        sql += " WHERE user_id = ?"
+        params.append(user_id)
+    sql += f" GROUP BY {group_column}"
+    return sql, params
+
+
+def _lease_stats_rows(group_column: str, user_id: Optional[int]) -> list:
+    """
+    (group value, total, active, expired) per group_column value; a lease counts as active/expired
+    only when lease_end_date is a valid YYYY-MM-DD date (expired = before today)
+    """
+    sql, params = _lease_stats_sql(group_column, user_id)
+    with get_db_connection() as conn:
+        return [(row['grp'], row['total'], row['active'], row['expired']) for row in conn.execute(sql, params)]
+
+
+def get_lease_stats(user_id: Optional[int] = None) -> Dict:
+    """Lease count, active/expired counts and per-status counts (all leases when user_id is None)"""
+    stats = {'total': 0, 'active': 0, 'expired': 0, 'counts': {}}
+    for status, total, active, expired in _lease_stats_rows('status', user_id):
+        stats['total'] += total
+        stats['active'] += active
+        stats['expired'] += expired
+        stats['counts'][status] = total
+    return stats
+
+
+def get_lease_stats_by_company(user_id: Optional[int] = None) -> Dict:
+    """{company_name: {'total', 'active', 'expired'}} (all leases when user_id is None)"""
+    return {
+        company: {'total': total, 'active': active, 'expired': expired}
+        for company, total, active, expired in _lease_stats_rows('company_name', user_id)
+    }
+
+
+MAX_PAGE_SIZE = 500
+
+# Column projection for list views (GET /api/leases?view=list)
+LEASE_LIST_COLUMNS = (
+    'lease_id', 'user_id', 'agreement_title', 'company_name', 'asset_class', 'lease_start_date',
+    'lease_end_date', 'status', 'rejection_reason', 'created_at',
+)
+
+
+def _encode_cursor(order_value, key) -> str:
+    """Opaque page cursor holding the last row's (order_column, key_column) values"""
+    return base64.urlsafe_b64encode(json.dumps([order_value, key]).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """(order value, key) of a page cursor; ValueError if it was not produced by _encode_cursor"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        order_value, key = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return order_value, key
+
+
+# Keyset listings: (table, key_column, order_column)
+LEASE_LISTING = ('leases', 'lease_id', 'created_at')
+AUDIT_LISTING = ('lease_data_audit', 'audit_id', 'change_timestamp')
+
+
+def _keyset_sql(table: str, key_column: str, order_column: str, select: str, conditions: list,
+                params: list, after: Optional[str], limit: Optional[int]) -> tuple:
+    """(sql, params) of a _keyset_page listing; a limited page fetches one extra row"""
+    conditions, params = list(conditions), list(params)
+    if after is not None:
+        conditions.append(f"({order_column}, {key_column}) < (?, ?)")
+        params.extend(_decode_cursor(after))
+
+    sql = f"SELECT {select} FROM {table}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {order_column} DESC, {key_column} DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit + 1)
+    return sql, params
+
+
+def _keyset_page(conn, table: str, key_column: str, order_column: str, select: str, conditions: list,
+                 params: list, after: Optional[str], limit: Optional[int]) -> tuple:
+    """
+    Run a listing ordered by (order_column, key_column) descending
+    With a limit, returns at most limit rows after the `after` cursor plus the cursor of the last
+    row (None on the last page). The cursor carries the row's sort values, so it stays valid when
+    that row is deleted; ValueError if `after` is not a cursor
+    """
+    if limit is not None:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+    sql, params = _keyset_sql(table, key_column, order_column, select, conditions, params, after, limit)
+    rows = [dict(row) for row in conn.execute(sql, params)]
+    if limit is not None and len(rows) > limit:
+        last = rows[limit - 1]
+        return rows[:limit], _encode_cursor(last[order_column], last[key_column])
+    return rows, None
+
+
+def list_leases(user_id: Optional[int] = None, after: Optional[str] = None, limit: Optional[int] = None,
+                fields: Optional[list] = None, status: Optional[str] = None, entity: Optional[str] = None,
+                asset_class: Optional[str] = None, from_date: Optional[str] = None,
+                to_date: Optional[str] = None) -> tuple:
+    """
+    Filtered, keyset-paginated lease listing, newest first: returns (leases, next_cursor)
+    user_id restricts to a user's leases (None = all); from_date/to_date keep leases whose
+    term overlaps the range; fields projects columns (lease_id is always included)
+    """
+    with get_db_connection() as conn:
+        if fields:
+            columns = get_table_columns(conn, 'leases')
+            unknown = [f for f in fields if f not in columns]
+            if unknown:
+                raise ValueError(f"Unknown lease fields: {', '.join(unknown)}")
+            select = ', '.join(dict.fromkeys(['lease_id', 'created_at', *fields]))
+        else:
+            select = '*'
+
+        conditions, params = _lease_conditions(user_id, status, entity, asset_class, from_date, to_date)
+        return _keyset_page(conn, *LEASE_LISTING, select, conditions, params, after, limit)
+
+
+def _lease_conditions(user_id: Optional[int] = None, status: Optional[str] = None, entity: Optional[str] = None,
+                      asset_class: Optional[str] = None, from_date: Optional[str] = None,
+                      to_date: Optional[str] = None) -> tuple:
+    """(conditions, params) of the list_leases filters"""
+    conditions, params = [], []
+    if user_id is not None:
+        conditions.append("user_id = ?")
+        params.append(user_id)
+    for column, value in (('status', status), ('company_name', entity), ('asset_class', asset_class)):
+        if value:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    if from_date:
+        conditions.append("(lease_end_date IS NULL OR lease_end_date >= ?)")
+        params.append(from_date)
+    if to_date:
+        conditions.append("lease_start_date <= ?")
+        params.append(to_date)
+    return conditions, params
+
+
+def list_audit_logs(after: Optional[str] = None, limit: Optional[int] = None, lease_id: Optional[int] = None,
+                    changed_by: Optional[str] = None, action: Optional[str] = None,
+                    from_date: Optional[str] = None, to_date: Optional[str] = None) -> tuple:
+    """
+    Filtered, keyset-paginated lease_data_audit listing, newest first: returns (logs, next_cursor)
+    changed_by matches the username (or the user id when numeric); dates bound change_timestamp
+    """
+    conditions, params = _audit_conditions(lease_id, changed_by, action, from_date, to_date)
+    with get_db_connection() as conn:
+        return _keyset_page(conn, *AUDIT_LISTING, '*', conditions, params, after, limit)
+
+
+def _audit_conditions(lease_id: Optional[int] = None, changed_by: Optional[str] = None,
+                      action: Optional[str] = None, from_date: Optional[str] = None,
+                      to_date: Optional[str] = None) -> tuple:
+    """(conditions, params) of the list_audit_logs filters"""
+    conditions, params = [], []
+    if lease_id is not None:
+        conditions.append("lease_id = ?")
+        params.append(lease_id)
+    if changed_by:
+        if str(changed_by).isdigit():
+            conditions.append("changed_by_user_id = ?")
+            params.append(int(changed_by))
+        else:
+            conditions.append("changed_by_username = ?")
+            params.append(changed_by)
+    if action:
+        conditions.append("action = ?")
+        params.append(action)
+    if from_date:
+        conditions.append("change_timestamp >= ?")
+        params.append(from_date)
+    if to_date:
+        conditions.append("change_timestamp < date(?, '+1 day')")
+        params.append(to_date)
+    return conditions, params
+
+
 def delete_lease(lease_id: int, user_id: int) -> bool:
     """Delete a lease (only if owned by user)"""
     with get_db_connection() as conn:
@@ -736,9 +1407,45 @@ def delete_lease(lease_id: int, user_id: int) -> bool:
             "DELETE FROM leases WHERE lease_id = ? AND user_id = ?",
             (lease_id, user_id)
         )
+        if cursor.rowcount:
+            _invalidate_lease_schedule(conn, lease_id)
         return cursor.rowcount > 0
 
 
+# ============ MATERIALIZED SCHEDULES ============
+
+def get_lease_schedule(lease_id: int, content_hash: str) -> Optional[bytes]:
+    """Stored schedule blob of a lease, if it was materialized for this content hash"""
+    with get_db_connection() as conn:
+        row = conn.execute(
+            "SELECT schedule FROM lease_schedules WHERE lease_id = ? AND content_hash = ?",
+            (lease_id, content_hash)
+        ).fetchone()
+        return row['schedule'] if row else None
+
+
+def save_lease_schedule(lease_id: int, content_hash: str, row_count: int, schedule: bytes):
+    """Store (or replace) the materialized schedule of a lease"""
+    with get_db_connection() as conn:
+        conn.execute(
+            """INSERT INTO lease_schedules (lease_id, content_hash, row_count, schedule, created_at)
+               SELECT ?, ?, ?, ?, CURRENT_TIMESTAMP WHERE EXISTS (SELECT 1 FROM leases WHERE lease_id = ?)
+               ON CONFLICT(lease_id) DO UPDATE SET content_hash = excluded.content_hash,
+                   row_count = excluded.row_count, schedule = excluded.schedule, created_at = excluded.created_at""",
+            (lease_id, content_hash, row_count, sqlite3.Binary(schedule), lease_id)
+        )
+
+
+def invalidate_lease_schedule(lease_id: int):
+    """Drop the materialized schedule of a lease"""
+    with get_db_connection() as conn:
+        _invalidate_lease_schedule(conn, lease_id)
+
+
+def _invalidate_lease_schedule(conn, lease_id: int):
+    conn.execute("DELETE FROM lease_schedules WHERE lease_id = ?", (lease_id,))
+
+
 # ============ NOTIFICATION SETTINGS ============
 
 def get_notification_settings() -> list:
@@ -778,5 +1485,128 @@ def get_notification_setting(rule_id: int) -> Optional[Dict]:
         return dict(row) if row else None
 
 
+# ============ CONSOLIDATION JOBS ============
+
+def create_consolidation_job(user_id: int, params: str, total_count: int) -> int:
+    """Queue a consolidation job (params is the JSON request body)"""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO consolidation_jobs (user_id, params, total_count) VALUES (?, ?, ?)",
+            (user_id, params, total_count)
+        )
+        return cursor.lastrowid
+
+def get_consolidation_job(job_id: int, user_id: Optional[int] = None) -> Optional[Dict]:
+    """Get a consolidation job. If user_id is provided, check for ownership."""
+    with get_db_connection() as conn:
+        if user_id:
+            row = conn.execute(
+                "SELECT * FROM consolidation_jobs WHERE job_id = ? AND user_id = ?", (job_id, user_id)
+            ).fetchone()
+        else:
+            row = conn.execute("SELECT * FROM consolidation_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+_CONSOLIDATION_JOBS_BY_USER_SQL = """
+    SELECT job_id, status, total_count, processed_count, error, cancel_requested,
+           created_at, started_at, finished_at
+    FROM consolidation_jobs WHERE user_id = ? ORDER BY job_id DESC LIMIT ?
+"""
+
+
+def get_consolidation_jobs_by_user(user_id: int, limit: int = 50) -> list:
+    """Most recent consolidation jobs of a user (without params/summary payloads)"""
+    with get_db_connection() as conn:
+        rows = conn.execute(_CONSOLIDATION_JOBS_BY_USER_SQL, (user_id, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+def start_consolidation_job(job_id: int) -> bool:
+    """Mark a queued job running; False if it was cancelled before starting"""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "UPDATE consolidation_jobs SET status = 'running', started_at = CURRENT_TIMESTAMP "
+            "WHERE job_id = ? AND status = 'queued' AND cancel_requested = 0",
+            (job_id,)
+        )
+        if cursor.rowcount == 0:
+            conn.execute(
+                "UPDATE consolidation_jobs SET status = 'cancelled', finished_at = CURRENT_TIMESTAMP "
+                "WHERE job_id = ? AND status = 'queued'",
+                (job_id,)
+            )
+        return cursor.rowcount > 0
+
+def update_consolidation_job_progress(job_id: int, processed_count: int, total_count: Optional[int] = None) -> bool:
+    """Record progress; returns True if cancellation has been requested"""
+    with get_db_connection() as conn:
+        if total_count is not None:
+            conn.execute(
+                "UPDATE consolidation_jobs SET processed_count = ?, total_count = ? WHERE job_id = ?",
+                (processed_count, total_count, job_id)
+            )
+        else:
+            conn.execute(
+                "UPDATE consolidation_jobs SET processed_count = ? WHERE job_id = ?", (processed_count, job_id)
+            )
+        row = conn.execute("SELECT cancel_requested FROM consolidation_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return bool(row and row['cancel_requested'])
+
+def add_consolidation_job_results(job_id: int, results: list):
+    """Append a batch of a running job's result rows: (period_index, seq, result JSON) tuples"""
+    with get_db_connection() as conn:
+        conn.executemany(
+            "INSERT INTO consolidation_job_results (job_id, period_index, seq, result) VALUES (?, ?, ?, ?)",
+            [(job_id, period_index, seq, result) for period_index, seq, result in results]
+        )
+
+def finish_consolidation_job(job_id: int, status: str, summary: Optional[str] = None,
+                             error: Optional[str] = None):
+    """
+    Store the outcome of a job: status and summary JSON
+    Result rows stored so far are dropped unless the job completed
+    """
+    with get_db_connection() as conn:
+        if status != 'completed':
+            conn.execute("DELETE FROM consolidation_job_results WHERE job_id = ?", (job_id,))
+        conn.execute(
+            "UPDATE consolidation_jobs SET status = ?, summary = ?, error = ?, finished_at = CURRENT_TIMESTAMP "
+            "WHERE job_id = ?",
+            (status, summary, error, job_id)
+        )
+
+def cancel_consolidation_job(job_id: int, user_id: int) -> bool:
+    """Request cancellation of a queued or running job (only if owned by user)"""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "UPDATE consolidation_jobs SET cancel_requested = 1 "
+            "WHERE job_id = ? AND user_id = ? AND status IN ('queued', 'running')",
+            (job_id, user_id)
+        )
+        return cursor.rowcount > 0
+
+def get_consolidation_job_results(job_id: int, period_index: int = 0, offset: int = 0, limit: int = 500) -> tuple:
+    """Page of stored result rows (JSON strings) for one period, plus the period's row count"""
+    with get_db_connection() as conn:
+        rows = conn.execute(
+            "SELECT result FROM consolidation_job_results WHERE job_id = ? AND period_index = ? "
+            "ORDER BY seq LIMIT ? OFFSET ?",
+            (job_id, period_index, limit, offset)
+        ).fetchall()
+        total = conn.execute(
+            "SELECT COUNT(*) AS n FROM consolidation_job_results WHERE job_id = ? AND period_index = ?",
+            (job_id, period_index)
+        ).fetchone()['n']
+        return [row['result'] for row in rows], total
+
+def fail_interrupted_consolidation_jobs() -> int:
+    """Mark jobs left queued/running by a previous process as failed"""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "UPDATE consolidation_jobs SET status = 'failed', error = 'Interrupted by application restart', "
+            "finished_at = CURRENT_TIMESTAMP WHERE status IN ('queued', 'running')"
+        )
+        return cursor.rowcount
+
+
 # Initialize database on import
 init_database()
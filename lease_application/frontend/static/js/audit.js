@@ -1,6 +1,11 @@
-document.addEventListener('DOMContentLoaded', loadAuditLogs);
+document.addEventListener('DOMContentLoaded', () => loadAuditLogs());
 
 const auditLogsUrl = '/api/audit_logs';
+const AUDIT_PAGE_SIZE = 500;
+
+// Logs loaded so far and the cursor of the next page (null when everything is loaded)
+let loadedLogs = [];
+let nextCursor = null;
 
 /**
  * Step 1: Groups flat audit logs into transactions based on time, user, and action.
@@ -145,18 +150,27 @@ function toggleDetails(index) {
 }
 
 /**
- * Main loading function.
+ * Main loading function (first page, or the next page when append is true).
  */
-async function loadAuditLogs() {
+async function loadAuditLogs(append = false) {
     try {
-        const response = await fetch(auditLogsUrl, { credentials: 'include' });
+        let url = `${auditLogsUrl}?limit=${AUDIT_PAGE_SIZE}`;
+        if (append && nextCursor !== null) {
+            url += `&after=${nextCursor}`;
+        }
+        const response = await fetch(url, { credentials: 'include' });
         const data = await response.json();
 
         if (data.success && data.logs) {
-            const groupedLogs = groupLogsByTransaction(data.logs);
+            loadedLogs = append ? loadedLogs.concat(data.logs) : data.logs;
+            nextCursor = data.next_cursor || null;
+            const groupedLogs = groupLogsByTransaction(loadedLogs);
             renderConsolidatedTable(groupedLogs);
+            updateLoadMoreButton();
             // Setup search listener after rendering
-            setupSearchListener(groupedLogs);
+            if (!append) {
+                setupSearchListener(groupedLogs);
+            }
         } else {
             console.error('Failed to load audit logs:', data.error);
             document.getElementById('noLogsMessage').style.display = 'block';
@@ -169,6 +183,23 @@ async function loadAuditLogs() {
 }
 
 
+/**
+ * Shows a "Load more" button under the table while older pages remain.
+ */
+function updateLoadMoreButton() {
+    let button = document.getElementById('auditLoadMore');
+    if (!button) {
+        button = document.createElement('button');
+        button.id = 'auditLoadMore';
+        button.className = 'btn-secondary';
+        button.textContent = 'Load more';
+        button.style.margin = '20px auto';
+        button.onclick = () => loadAuditLogs(true);
+        document.getElementById('noLogsMessage').insertAdjacentElement('afterend', button);
+    }
+    button.style.display = nextCursor !== null ? 'block' : 'none';
+}
+
 /**
  * Setup Search Listener
  */
@@ -209,7 +209,8 @@ async function consolidateLeases() {
                 lease_ids: selectedLeaseIds,
                 from_date: fromDate,
                 to_date: toDate,
-                gaap_standard: gaapStandard
+                gaap_standard: gaapStandard,
+                stream: true
             })
         });
         
@@ -218,11 +219,7 @@ async function consolidateLeases() {
             throw new Error(errorData.error || `Server error: ${response.status}`);
         }
         
-        const result = await response.json();
-        
-        if (result.error) {
-            throw new Error(result.error);
-        }
+        const result = await readConsolidationStream(response);
         
         // Display results
         displayResults(result);
@@ -235,6 +232,70 @@ async function consolidateLeases() {
     }
 }
 
+// Read the NDJSON stream of /api/consolidate_reports, rendering lease rows as they arrive
+async function readConsolidationStream(response) {
+    const resultsBody = document.getElementById('resultsBody');
+    const rows = [];
+    let summary = null;
+    let buffer = '';
+    
+    if (resultsBody) {
+        resultsBody.innerHTML = '';
+        document.getElementById('results').style.display = 'block';
+    }
+    
+    const handleLine = (line) => {
+        if (!line.trim()) return;
+        const message = JSON.parse(line);
+        if (message.type === 'result') {
+            if (resultsBody) {
+                resultsBody.insertAdjacentHTML('beforeend', renderResultRow(message.result, rows.length));
+            }
+            rows.push(message.result);
+        } else if (message.type === 'summary') {
+            summary = message;
+        } else if (message.type === 'error') {
+            throw new Error(message.error);
+        }
+    };
+    
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+    }
+    handleLine(buffer + decoder.decode());
+    
+    if (!summary) {
+        throw new Error('Consolidation stream ended without totals');
+    }
+    return { success: true, ...summary, results: rows };
+}
+
+function renderResultRow(row, idx) {
+    const bgColor = idx % 2 === 0 ? '#fafafa' : '#ffffff';
+    return `
+        <tr style="background-color: ${bgColor};">
+            <td style="padding: 12px; border: 1px solid #e0e0e0; color: #2c3e50; font-weight: 500;">${row.lease_id || row.auto_id || '-'}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; color: #555;">${row.description || '-'}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; color: #555;">${row.asset_class || '-'}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.opening_liability || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.opening_rou_asset || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.interest_expense || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.depreciation_expense || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.rent_paid || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; font-weight: 500; color: #2c3e50;">$${formatCurrency(row.closing_liability_total || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; font-weight: 500; color: #2c3e50;">$${formatCurrency(row.closing_rou_asset || 0)}</td>
+            <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: ${(row.gain_loss_pnl || 0) >= 0 ? '#27ae60' : '#e74c3c'}; font-weight: 500;">$${formatCurrency(row.gain_loss_pnl || 0)}</td>
+        </tr>
+    `;
+}
+
 function displayResults(result) {
     // Display statistics
     const statisticsGrid = document.getElementById('statisticsGrid');
@@ -277,24 +338,7 @@ function displayResults(result) {
     }
     
     if (result.results && Array.isArray(result.results)) {
-        resultsBody.innerHTML = result.results.map((row, idx) => {
-            const bgColor = idx % 2 === 0 ? '#fafafa' : '#ffffff';
-            return `
-                <tr style="background-color: ${bgColor};">
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; color: #2c3e50; font-weight: 500;">${row.lease_id || row.auto_id || '-'}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; color: #555;">${row.description || '-'}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; color: #555;">${row.asset_class || '-'}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.opening_liability || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.opening_rou_asset || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.interest_expense || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.depreciation_expense || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: #555;">$${formatCurrency(row.rent_paid || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; font-weight: 500; color: #2c3e50;">$${formatCurrency(row.closing_liability_total || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; font-weight: 500; color: #2c3e50;">$${formatCurrency(row.closing_rou_asset || 0)}</td>
-                    <td style="padding: 12px; border: 1px solid #e0e0e0; text-align: right; color: ${(row.gain_loss_pnl || 0) >= 0 ? '#27ae60' : '#e74c3c'}; font-weight: 500;">$${formatCurrency(row.gain_loss_pnl || 0)}</td>
-                </tr>
-            `;
-        }).join('');
+        resultsBody.innerHTML = result.results.map(renderResultRow).join('');
     } else {
         resultsBody.innerHTML = '<tr><td colspan="11" style="text-align: center; padding: 20px; color: #666;">No results available</td></tr>';
     }
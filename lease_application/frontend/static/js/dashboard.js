@@ -76,7 +76,15 @@ async function copyLease(leaseId) {
 }
 
 // Data Loading
-async function loadLeases() {
+const LEASE_PAGE_SIZE = 100;
+
+// Cursor of the next page of leases (null when everything is loaded)
+let leasesCursor = null;
+
+/**
+ * Loads the first page of leases, or the next page when append is true.
+ */
+async function loadLeases(append = false) {
     const tbody = document.getElementById('leasesTableBody');
     const noLeasesMessage = document.getElementById('noLeasesMessage');
     const leasesTable = document.querySelector('.leases-table');
@@ -86,76 +94,37 @@ async function loadLeases() {
     }
 
     try {
-        const response = await fetch('/api/leases', { credentials: 'include' });
+        let url = `/api/leases?view=list&limit=${LEASE_PAGE_SIZE}`;
+        if (append && leasesCursor !== null) {
+            url += `&after=${leasesCursor}`;
+        }
+        const response = await fetch(url, { credentials: 'include' });
         const result = await response.json();
 
-        if (!result.success || !result.leases || result.leases.length === 0) {
+        if (!append && (!result.success || !result.leases || result.leases.length === 0)) {
             tbody.innerHTML = '';
             leasesTable.style.display = 'none';
             noLeasesMessage.style.display = 'block';
+            leasesCursor = null;
+            updateLeasesLoadMoreButton();
+            return;
+        }
+        if (!result.success) {
+            showToast(result.error || 'Error loading leases', 'error');
             return;
         }
 
         leasesTable.style.display = 'table';
         noLeasesMessage.style.display = 'none';
-        
-        const user = await getCurrentUser();
-        const isReviewer = user && (user.role === 'admin' || user.role === 'reviewer');
-
-        tbody.innerHTML = result.leases.map(lease => {
-            const startDate = lease.lease_start_date ? new Date(lease.lease_start_date).toLocaleDateString() : 'N/A';
-            const endDate = lease.lease_end_date ? new Date(lease.lease_end_date).toLocaleDateString() : 'N/A';
-            const status = lease.status || 'draft';
-            const canCalculate = status === 'approved';
-            const isRejected = status === 'rejected';
-            const isApproved = status === 'approved';
-            const rejectionReason = lease.rejection_reason || '';
-            const approvalComment = lease.approval_comment || '';
-
-            let rowHtml = `
-                <tr class="${isRejected ? 'lease-rejected' : ''} ${isApproved ? 'lease-approved' : ''}">
-                    <td>${lease.lease_id}</td>
-                    <td>${lease.agreement_title || 'N/A'}</td>
-                    <td>${lease.company_name || 'N/A'}</td>
-                    <td>${lease.asset_class || 'N/A'}</td>
-                    <td>${startDate}</td>
-                    <td>${endDate}</td>
-                    <td><span class="status-badge ${status}">${status}</span></td>
-                    <td>
-                        <a href="#" class="action-link" onclick="editLease(${lease.lease_id})"><i class="fas fa-edit"></i></a>
-                        <a href="#" class="action-link" onclick="copyLease(${lease.lease_id})"><i class="fas fa-copy"></i></a>
-                        ${canCalculate ? `<a href="#" class="action-link" onclick="calculateLease(${lease.lease_id})"><i class="fas fa-calculator"></i></a>` : ''}
-                        <a href="#" class="action-link delete-link" onclick="deleteLease(${lease.lease_id})"><i class="fas fa-trash"></i></a>
-                    </td>
-                </tr>
-            `;
-
-            if (isRejected && rejectionReason) {
-                rowHtml += `
-                    <tr class="rejection-reason-row">
-                        <td colspan="8">
-                            <div class="rejection-reason">
-                                <strong>Rejection Reason:</strong> ${rejectionReason}
-                            </div>
-                        </td>
-                    </tr>
-                `;
-            }
-
-            if (isApproved && approvalComment) {
-                rowHtml += `
-                    <tr class="approval-comment-row">
-                        <td colspan="8">
-                            <div class="approval-comment">
-                                <strong>Approval Comment:</strong> ${approvalComment}
-                            </div>
-                        </td>
-                    </tr>
-                `;
-            }
 
-            return rowHtml;
-        }).join('');
+        const rowsHtml = result.leases.map(renderLeaseRow).join('');
+        if (append) {
+            tbody.insertAdjacentHTML('beforeend', rowsHtml);
+        } else {
+            tbody.innerHTML = rowsHtml;
+        }
+        leasesCursor = result.next_cursor || null;
+        updateLeasesLoadMoreButton();
     } catch (error) {
         console.error('Error loading leases:', error);
         document.getElementById('noLeasesMessage').textContent = 'Error loading leases.';
@@ -164,6 +133,81 @@ async function loadLeases() {
     }
 }
 
+/**
+ * Table row(s) for one lease (plus its rejection reason / approval comment).
+ */
+function renderLeaseRow(lease) {
+    const startDate = lease.lease_start_date ? new Date(lease.lease_start_date).toLocaleDateString() : 'N/A';
+    const endDate = lease.lease_end_date ? new Date(lease.lease_end_date).toLocaleDateString() : 'N/A';
+    const status = lease.status || 'draft';
+    const canCalculate = status === 'approved';
+    const isRejected = status === 'rejected';
+    const isApproved = status === 'approved';
+    const rejectionReason = lease.rejection_reason || '';
+    const approvalComment = lease.approval_comment || '';
+
+    let rowHtml = `
+        <tr class="${isRejected ? 'lease-rejected' : ''} ${isApproved ? 'lease-approved' : ''}">
+            <td>${lease.lease_id}</td>
+            <td>${lease.agreement_title || 'N/A'}</td>
+            <td>${lease.company_name || 'N/A'}</td>
+            <td>${lease.asset_class || 'N/A'}</td>
+            <td>${startDate}</td>
+            <td>${endDate}</td>
+            <td><span class="status-badge ${status}">${status}</span></td>
+            <td>
+                <a href="#" class="action-link" onclick="editLease(${lease.lease_id})"><i class="fas fa-edit"></i></a>
+                <a href="#" class="action-link" onclick="copyLease(${lease.lease_id})"><i class="fas fa-copy"></i></a>
+                ${canCalculate ? `<a href="#" class="action-link" onclick="calculateLease(${lease.lease_id})"><i class="fas fa-calculator"></i></a>` : ''}
+                <a href="#" class="action-link delete-link" onclick="deleteLease(${lease.lease_id})"><i class="fas fa-trash"></i></a>
+            </td>
+        </tr>
+    `;
+
+    if (isRejected && rejectionReason) {
+        rowHtml += `
+            <tr class="rejection-reason-row">
+                <td colspan="8">
+                    <div class="rejection-reason">
+                        <strong>Rejection Reason:</strong> ${rejectionReason}
+                    </div>
+                </td>
+            </tr>
+        `;
+    }
+
+    if (isApproved && approvalComment) {
+        rowHtml += `
+            <tr class="approval-comment-row">
+                <td colspan="8">
+                    <div class="approval-comment">
+                        <strong>Approval Comment:</strong> ${approvalComment}
+                    </div>
+                </td>
+            </tr>
+        `;
+    }
+
+    return rowHtml;
+}
+
+/**
+ * Shows a "Load more" button under the table while older pages remain.
+ */
+function updateLeasesLoadMoreButton() {
+    let button = document.getElementById('leasesLoadMore');
+    if (!button) {
+        button = document.createElement('button');
+        button.id = 'leasesLoadMore';
+        button.className = 'btn-secondary';
+        button.textContent = 'Load more';
+        button.style.margin = '20px auto';
+        button.onclick = () => loadLeases(true);
+        document.getElementById('noLeasesMessage').insertAdjacentElement('afterend', button);
+    }
+    button.style.display = leasesCursor !== null ? 'block' : 'none';
+}
+
 async function loadStats() {
     const statsTotal = document.getElementById('statsTotal');
     if (!statsTotal) {
@@ -140,6 +140,9 @@ class LeaseData:
     last_modified_by: str = ""
     last_reviewed_by: str = ""
     
+    # Loaded from the leases table (its schedule may be materialized in the schedule store)
+    persisted: bool = False
+    
     # Calculated fields (populated during processing)
     calculated_fields: Dict[str, Any] = field(default_factory=dict)
 
@@ -338,6 +341,7 @@ class ProcessingFilters:
     profit_center_filter: Optional[str] = None
     gaap_standard: str = "IFRS"  # IFRS, IndAS, or US-GAAP
     enable_projections: bool = True  # VBA: A3.Value = 1 (enable projections)
-    projection_periods: int = 3  # Number of periods to calculate (max 6)
+    projection_periods: int = 3  # Number of periods to calculate
     projection_period_months: int = 3  # Months per period (VBA: A4.Value)
+    max_projection_periods: Optional[int] = 6  # VBA: projectionmode < 6 (None = unbounded)
 
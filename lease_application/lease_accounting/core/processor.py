@@ -12,12 +12,14 @@ VBA Function: compu() Sub (Lines 251-624)
   - Current/Non-current split: Lines 553-566
 """
 
+from dataclasses import replace
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from dateutil.relativedelta import relativedelta
 import logging
 from .models import LeaseData, LeaseResult, ProcessingFilters, PaymentScheduleRow
-from ..schedule.generator_vba_complete import generate_complete_schedule
+from .schedule_index import ScheduleIndex
+from ..schedule.schedule_cache import get_cached_schedule
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,22 @@ class LeaseProcessor:
     def __init__(self, filters: ProcessingFilters):
         self.filters = filters
         self.lease_results = []
+        # Date index of the schedule currently being processed
+        self._indexed_schedule = None
+        self._schedule_idx: Optional[ScheduleIndex] = None
+    
+    def _schedule_index(self, schedule: List[PaymentScheduleRow]) -> ScheduleIndex:
+        """Bisect index for schedule, built once per schedule object"""
+        if self._indexed_schedule is not schedule or len(self._schedule_idx) != len(schedule):
+            self._indexed_schedule = schedule
+            self._schedule_idx = ScheduleIndex(schedule)
+        return self._schedule_idx
+    
+    @staticmethod
+    def _schedule_rate(schedule: List[PaymentScheduleRow], lease_data: LeaseData) -> Optional[float]:
+        """C7 the schedule was calculated at (GoalSeek result for FV of ROU leases), else the lease's rate"""
+        rate = getattr(schedule, 'borrowing_rate', None)
+        return rate if rate is not None else lease_data.borrowing_rate
     
     def process_all_leases(self, lease_data_list: List[LeaseData]) -> List[LeaseResult]:
         """
@@ -108,12 +126,41 @@ class LeaseProcessor:
         if not self.filters.start_date or not self.filters.end_date:
             return None
         
-        # Generate payment schedule
-        schedule = generate_complete_schedule(lease_data)
+        # Generate payment schedule (shared with other callers via the schedule cache)
+        schedule = get_cached_schedule(lease_data)
         
         if not schedule:
             return None
         
+        return self._process_schedule(lease_data, schedule)
+    
+    def process_lease_periods(self, lease_data: LeaseData,
+                              periods: Sequence[Tuple[date, date]]) -> List[Optional[LeaseResult]]:
+        """
+        Process a single lease for several reporting windows (e.g. 12 month-ends plus quarter and YTD)
+        
+        The schedule is built once and its date index / prefix sums are shared by all periods.
+        Each result equals process_single_lease with filters.start_date/end_date set to the period.
+        Returns one LeaseResult (or None) per (start_date, end_date) pair, in order.
+        """
+        schedule = get_cached_schedule(lease_data)
+        
+        base_filters = self.filters
+        results: List[Optional[LeaseResult]] = []
+        try:
+            for start_date, end_date in periods:
+                if not schedule or not start_date or not end_date:
+                    results.append(None)
+                    continue
+                self.filters = replace(base_filters, start_date=start_date, end_date=end_date)
+                results.append(self._process_schedule(lease_data, schedule))
+        finally:
+            self.filters = base_filters
+        
+        return results
+    
+    def _process_schedule(self, lease_data: LeaseData, schedule: List[PaymentScheduleRow]) -> LeaseResult:
+        """Results for lease_data over the filters' reporting period from its generated schedule"""
         # VBA Line 361: Process lease modifications if applicable
         if lease_data.modifies_this_id and lease_data.modifies_this_id > 0:
             from .lease_modifications import process_lease_modifications
@@ -168,17 +215,12 @@ class LeaseProcessor:
         twelve_months_later = self.filters.end_date + relativedelta(months=12)
         
         liacurrent = 0.0
-        for row in schedule:
-            # Get row date - PaymentScheduleRow uses 'date' attribute
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if not row_date:
-                continue
-                
-            # Check if payment is in next 12 months after balance date
-            # VBA: cell.Value > opendatep And cell.Value <= baldatep (for projection period 1, 12 months)
-            if (row_date > self.filters.end_date and 
-                row_date <= twelve_months_later and 
-                row.rental_amount and row.rental_amount > 0):
+        index = self._schedule_index(schedule)
+        # Payments in the next 12 months after balance date
+        # VBA: cell.Value > opendatep And cell.Value <= baldatep (for projection period 1, 12 months)
+        lo, hi = index.between(self.filters.end_date, twelve_months_later)
+        for row in index.rows[lo:hi]:
+            if row.rental_amount and row.rental_amount > 0:
                 # VBA Line 543: liacurrent = liacurrent + rental * pv_factor / baldatepv
                 if baldatepv > 0 and row.pv_factor:
                     liacurrent += row.rental_amount * row.pv_factor / baldatepv
@@ -206,12 +248,13 @@ class LeaseProcessor:
         # Calculate Projections (VBA Lines 510-568)
         from .projection_calculator import ProjectionCalculator
         
-        projection_calc = ProjectionCalculator(schedule, lease_data)
+        projection_calc = ProjectionCalculator(schedule, lease_data, self._schedule_index(schedule))
         projections = projection_calc.calculate_projections(
             balance_date=self.filters.end_date,
             projection_periods=self.filters.projection_periods,
             period_months=self.filters.projection_period_months,
-            enable_projections=self.filters.enable_projections
+            enable_projections=self.filters.enable_projections,
+            max_periods=self.filters.max_projection_periods
         )
         
         # Log for debugging
@@ -242,19 +285,16 @@ class LeaseProcessor:
                     first_projection_date = datetime.fromisoformat(first_projection_date_str).date() if isinstance(first_projection_date_str, str) else first_projection_date_str
                     
                     # Find security deposit PV at projection date
+                    # (exact row, else the row before the first later row)
                     sec_current_at_projection = 0.0
-                    for row in schedule:
-                        row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-                        if row_date and row_date == first_projection_date:
-                            sec_current_at_projection = row.security_deposit_pv or 0.0
-                            break
-                        elif row_date and row_date > first_projection_date:
-                            # Use previous row's value (interpolation)
-                            if len(schedule) > 0:
-                                prev_idx = schedule.index(row) - 1
-                                if prev_idx >= 0:
-                                    sec_current_at_projection = schedule[prev_idx].security_deposit_pv or 0.0
-                            break
+                    index = self._schedule_index(schedule)
+                    pos = index.find(first_projection_date)
+                    if pos is not None:
+                        sec_current_at_projection = index.rows[pos].security_deposit_pv or 0.0
+                    else:
+                        next_pos = index.first_after(first_projection_date)
+                        if 0 < next_pos < len(index):
+                            sec_current_at_projection = index.rows[next_pos - 1].security_deposit_pv or 0.0
                     
                     # VBA Line 554: If sec_current = 0 Then
                     # If security deposit at projection date is 0, all is current
@@ -294,11 +334,10 @@ class LeaseProcessor:
             self.filters.start_date and self.filters.end_date and
             self.filters.start_date < lease_data.lease_start_date <= self.filters.end_date):
             # Find initial ROU from schedule (first row after lease start = I9)
-            for row in schedule:
-                row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-                if row_date and row_date == lease_data.lease_start_date:
-                    initial_rou_asset = row.rou_asset or 0.0
-                    break
+            index = self._schedule_index(schedule)
+            pos = index.find(lease_data.lease_start_date)
+            if pos is not None:
+                initial_rou_asset = index.rows[pos].rou_asset or 0.0
         
         # BB4: Security Deposit Gross (VBA Lines 421-424, 490)
         security_deposit_gross = self._calculate_security_deposit_gross(lease_data, self.filters.end_date)
@@ -364,12 +403,11 @@ class LeaseProcessor:
                 # Find initial ROU and Liability at lease start
                 initial_rou = 0.0
                 initial_liability = 0.0
-                for row in schedule:
-                    row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-                    if row_date and row_date == lease_data.lease_start_date:
-                        initial_rou = row.rou_asset or 0.0
-                        initial_liability = row.lease_liability or 0.0
-                        break
+                index = self._schedule_index(schedule)
+                pos = index.find(lease_data.lease_start_date)
+                if pos is not None:
+                    initial_rou = index.rows[pos].rou_asset or 0.0
+                    initial_liability = index.rows[pos].lease_liability or 0.0
                 sublease_gain_loss = initial_rou - initial_liability
         
         # VBA Line 460: Sublease Modification Gain/Loss
@@ -388,11 +426,10 @@ class LeaseProcessor:
             self.filters.start_date < lease_data.termination_date <= self.filters.end_date):
             # Find termination row in schedule
             termination_row = None
-            for row in schedule:
-                row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-                if row_date and row_date == lease_data.termination_date:
-                    termination_row = row
-                    break
+            index = self._schedule_index(schedule)
+            pos = index.find(lease_data.termination_date)
+            if pos is not None:
+                termination_row = index.rows[pos]
             
             if termination_row:
                 # VBA Line 468: Termination gain = Termination_penalty + ROU - Liability - sec_grossT + Security_PV - ARO_PV + All other gains
@@ -478,7 +515,7 @@ class LeaseProcessor:
             currency=lease_data.currency,
             description=lease_data.description,
             asset_code=lease_data.asset_id_code,
-            borrowing_rate=lease_data.borrowing_rate,
+            borrowing_rate=self._schedule_rate(schedule, lease_data),
             projections=projections,
             # Missing columns
             original_lease_id=original_lease_id,
@@ -499,36 +536,26 @@ class LeaseProcessor:
         Get PV factor at balance date (baldatepv)
         VBA: Find cell.Value = baldate, get cell.Offset(0, 2).Value (PV factor)
         """
-        # First, try to find exact date match
-        for row in schedule:
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if row_date == balance_date:
-                return row.pv_factor if row.pv_factor else 1.0
-        
-        # If no exact match, interpolate between surrounding rows
-        # Find the row just before and just after balance_date
-        prev_row = None
-        next_row = None
-        
-        for i, row in enumerate(schedule):
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if not row_date:
-                continue
-            if row_date < balance_date:
-                prev_row = row
-            elif row_date > balance_date:
-                next_row = row
-                break
+        index = self._schedule_index(schedule)
         
-        # If we have both, interpolate (simplified - use previous row's PV factor)
-        if prev_row:
+        # First, try to find exact date match
+        pos = index.find(balance_date)
+        if pos is not None:
+            row = index.rows[pos]
+            return row.pv_factor if row.pv_factor else 1.0
+        
+        # If no exact match, use the row just before balance_date (simplified interpolation)
+        prev_pos = index.last_before(balance_date)
+        if prev_pos >= 0:
+            prev_row = index.rows[prev_pos]
             return prev_row.pv_factor if prev_row.pv_factor else 1.0
         
         # Fallback: calculate PV factor directly
         if schedule:
-            if lease_data.borrowing_rate is None:
+            borrowing_rate = self._schedule_rate(schedule, lease_data)
+            if borrowing_rate is None:
                 raise ValueError("borrowing_rate is required but was not provided in the lease data")
-            discount_rate = lease_data.borrowing_rate / 100
+            discount_rate = borrowing_rate / 100
             # icompound should be compound_months if provided, otherwise derive from frequency
             if lease_data.compound_months and lease_data.compound_months > 0:
                 icompound = lease_data.compound_months
@@ -567,60 +594,28 @@ class LeaseProcessor:
              INSERT row with opendate and COPY values from previous row (columns E-O) (Lines 374-380)
         Returns: (liability, rou, aro, security_deposit)
         """
-        # VBA logic: find exact match or interpolate by inserting row
-        for i, row in enumerate(schedule):
-            # Get date from row
-            row_date = row.payment_date
-            if hasattr(row_date, 'date'):
-                row_date = row_date.date()
-            elif not isinstance(row_date, date):
-                row_date = getattr(row, 'date', row_date)
-            
-            # Exact match (VBA: If cell.Value = opendate)
-            if row_date == balance_date:
-                return (row.lease_liability or 0.0, row.rou_asset or 0.0,
-                       getattr(row, 'aro_provision', 0.0) or 0.0,
-                       getattr(row, 'security_deposit_pv', 0.0) or 0.0)
-            
-            # Interpolation logic (VBA: If cell.Value < opendate And cell.Offset(1, 0).Value > opendate)
-            # If balance_date falls between this row and next row
-            if i < len(schedule) - 1:
-                next_row = schedule[i + 1]
-                next_date = next_row.payment_date
-                if hasattr(next_date, 'date'):
-                    next_date = next_date.date()
-                elif not isinstance(next_date, date):
-                    next_date = getattr(next_row, 'date', next_date)
-                
-                # VBA: inserts row and copies values from current row (columns E-O)
-                # In Python: use current row's values (simulates copy)
-                if row_date < balance_date < next_date:
-                    return (row.lease_liability or 0.0, row.rou_asset or 0.0,
-                           getattr(row, 'aro_provision', 0.0) or 0.0,
-                           getattr(row, 'security_deposit_pv', 0.0) or 0.0)
-        
-        # If balance_date is before first row or after last row
-        if schedule:
-            first_row = schedule[0]
-            first_date = first_row.date  # Use .date property directly
-            if isinstance(first_date, datetime):
-                first_date = first_date.date()
-            
-            if balance_date < first_date:
+        if not schedule:
+            return (0.0, 0.0, 0.0, 0.0)
+        
+        index = self._schedule_index(schedule)
+        
+        # Exact match (VBA: If cell.Value = opendate)
+        pos = index.find(balance_date)
+        if pos is None:
+            # Interpolation (VBA: If cell.Value < opendate And cell.Offset(1, 0).Value > opendate):
+            # VBA inserts a row copying the previous row (columns E-O); use that row's values.
+            # After lease end this is the last row.
+            pos = index.last_before(balance_date)
+            if pos < 0:
                 # VBA Line 364: If lease_start_date > opendate, skip opening balance calculation
                 # But if opendate is between lease_start and first payment, use first row values
                 # For now, return first row's values (which represents opening balances at lease start)
-                return (first_row.lease_liability or 0.0, first_row.rou_asset or 0.0,
-                       getattr(first_row, 'aro_provision', 0.0) or 0.0,
-                       getattr(first_row, 'security_deposit_pv', 0.0) or 0.0)
-            else:
-                # After lease end - use last row
-                last_row = schedule[-1]
-                return (last_row.lease_liability or 0.0, last_row.rou_asset or 0.0,
-                       getattr(last_row, 'aro_provision', 0.0) or 0.0,
-                       getattr(last_row, 'security_deposit_pv', 0.0) or 0.0)
+                pos = 0
         
-        return (0.0, 0.0, 0.0, 0.0)
+        row = index.rows[pos]
+        return (row.lease_liability or 0.0, row.rou_asset or 0.0,
+               getattr(row, 'aro_provision', 0.0) or 0.0,
+               getattr(row, 'security_deposit_pv', 0.0) or 0.0)
     
     def get_closing_balances(self, schedule: List[PaymentScheduleRow],
                             balance_date: date) -> tuple:
@@ -635,58 +630,26 @@ class LeaseProcessor:
              INSERT row with baldate and COPY values from previous row (columns E-O) (Lines 413-418)
         Returns: (liability, rou, aro, security_deposit)
         """
-        closing_liability = 0.0
-        closing_rou = 0.0
-        closing_aro = 0.0
-        closing_security = 0.0
-        
-        for i, row in enumerate(schedule):
-            # Get date from row
-            row_date = row.payment_date
-            if hasattr(row_date, 'date'):
-                row_date = row_date.date()
-            elif not isinstance(row_date, date):
-                row_date = getattr(row, 'date', row_date)
-            
-            # Exact match (VBA: If cell.Value = baldate)
-            if row_date == balance_date:
-                return (row.lease_liability, row.rou_asset, 
-                       getattr(row, 'aro_provision', 0.0) or 0.0,
-                       getattr(row, 'security_deposit_pv', 0.0) or 0.0)
-            
+        if not schedule:
+            return (0.0, 0.0, 0.0, 0.0)
+        
+        index = self._schedule_index(schedule)
+        
+        # Exact match (VBA: If cell.Value = baldate)
+        pos = index.find(balance_date)
+        if pos is None:
             # Interpolation logic (VBA lines 413-418):
             # If cell.Value < baldate And cell.Offset(1, 0).Value > baldate
-            # INSERT row with baldate and COPY values from current row
-            if i < len(schedule) - 1:
-                next_row = schedule[i + 1]
-                next_date = next_row.payment_date
-                if hasattr(next_date, 'date'):
-                    next_date = next_date.date()
-                elif not isinstance(next_date, date):
-                    next_date = getattr(next_row, 'date', next_date)
-                
-                # Balance date falls between two payment dates
-                # VBA copies values from current row (simulated here)
-                if row_date < balance_date < next_date:
-                    return (row.lease_liability, row.rou_asset,
-                           getattr(row, 'aro_provision', 0.0) or 0.0,
-                           getattr(row, 'security_deposit_pv', 0.0) or 0.0)
-            
-            # Track last row up to balance_date (for dates after lease end)
-            if row_date <= balance_date:
-                closing_liability = row.lease_liability or 0.0
-                closing_rou = row.rou_asset or 0.0
-                closing_aro = getattr(row, 'aro_provision', 0.0) or 0.0
-                closing_security = getattr(row, 'security_deposit_pv', 0.0) or 0.0
-        
-        # Return last tracked values (if balance_date is after all rows)
-        # If no values were set, return first row's values as fallback
-        if closing_liability == 0 and closing_rou == 0 and schedule:
-            first_row = schedule[0]
-            closing_liability = first_row.lease_liability or 0.0
-            closing_rou = first_row.rou_asset or 0.0
-            closing_aro = getattr(first_row, 'aro_provision', 0.0) or 0.0
-            closing_security = getattr(first_row, 'security_deposit_pv', 0.0) or 0.0
+            # INSERT row with baldate and COPY values from current row.
+            # A balance date after all rows (after lease end) uses the last row.
+            pos = index.last_before(balance_date)
+        
+        # Balance date before the first row: first row's values as fallback
+        row = index.rows[pos] if pos >= 0 else index.rows[0]
+        closing_liability = row.lease_liability or 0.0
+        closing_rou = row.rou_asset or 0.0
+        closing_aro = getattr(row, 'aro_provision', 0.0) or 0.0
+        closing_security = getattr(row, 'security_deposit_pv', 0.0) or 0.0
         
         return (closing_liability, closing_rou, closing_aro, closing_security)
     
@@ -706,60 +669,32 @@ class LeaseProcessor:
           - Lines 462-474: Termination gain/loss calculation
         Returns: dict with 'depreciation', 'interest', 'rent_paid', 'aro_interest', 'security_change'
         """
-        depreciation = 0.0
-        interest = 0.0
-        rent_paid = 0.0
-        aro_interest = 0.0
-        security_change = 0.0
-        change_rou = 0.0
-        
-        prev_security_pv = 0.0
-        
-        for i, row in enumerate(schedule):
-            # Skip opening row
-            if row.is_opening:
-                # Track opening security deposit for delta calculation
-                prev_security_pv = row.security_deposit_pv or 0.0
-                continue
-                
-            # Get date from row
-            row_date = row.payment_date
-            if hasattr(row_date, 'date'):
-                row_date = row_date.date()
-            elif not isinstance(row_date, date):
-                row_date = getattr(row, 'date', row_date)
-            
-            # VBA Line 438: cell.Value > opendate And cell.Value <= closedate
-            # start_date is already opendate (from_date - 1), end_date is closedate (to_date)
-            # CRITICAL: VBA uses > (greater than) not >=, so opendate is EXCLUDED
-            # Python condition must match: row_date > start_date AND row_date <= end_date
-            if start_date < row_date <= end_date:  # Same as: row_date > start_date AND row_date <= end_date
-                # VBA Line 432-437: If openinsert_Flag = 1, subtract values
-                # (handled separately in get_opening_balances)
-                
-                # VBA Line 439: Not_modified flag
-                Not_modified = 1
-                if date_modified and row_date == date_modified:
-                    Not_modified = 0
-                
-                # VBA Line 440-444: Accumulate period activity
-                depreciation += abs(row.depreciation or 0.0)
-                interest += abs(row.interest or 0.0)
-                rent_paid += (row.rental_amount or 0.0) * Not_modified  # CRITICAL: Exclude date_modified
-                change_rou += row.change_in_rou or 0.0
-                
-                if row.aro_interest:
-                    aro_interest += row.aro_interest
-                
-                # VBA Line 445: Security deposit change (delta calculation)
-                if i > 0:  # cell.Row > 9
-                    curr_security_pv = row.security_deposit_pv or 0.0
-                    security_change += curr_security_pv - prev_security_pv
-                    
-                    # VBA Line 446-450: Special handling for security increase formulas
-                    # (Complex formula parsing - simplified here)
-                
-                prev_security_pv = row.security_deposit_pv or 0.0
+        index = self._schedule_index(schedule)
+        
+        # VBA Line 438: cell.Value > opendate And cell.Value <= closedate
+        # start_date is already opendate (from_date - 1), end_date is closedate (to_date)
+        # CRITICAL: VBA uses > (greater than) not >=, so opendate is EXCLUDED
+        # VBA Line 440-444: Accumulate period activity (prefix sums; opening rows are skipped)
+        depreciation = index.window_sum('activity_depreciation', start_date, end_date)
+        interest = index.window_sum('activity_interest', start_date, end_date)
+        rent_paid = index.window_sum('activity_rent', start_date, end_date)
+        change_rou = index.window_sum('activity_change_rou', start_date, end_date)
+        aro_interest = index.window_sum('activity_aro_interest', start_date, end_date)
+        
+        # VBA Line 439: Not_modified flag - rent on date_modified is excluded from rent_paid
+        if date_modified and start_date < date_modified <= end_date:
+            pos = index.find(date_modified)
+            while pos is not None and pos < len(index) and index.ordinals[pos] == date_modified.toordinal():
+                row = index.rows[pos]
+                if not row.is_opening:
+                    rent_paid -= row.rental_amount or 0.0
+                pos += 1
+        
+        # VBA Line 445: Security deposit change (delta calculation)
+        # VBA Line 446-450: Special handling for security increase formulas
+        # (Complex formula parsing - simplified here)
+        lo, hi = index.between(start_date, end_date)
+        security_change = index.security_change(lo, hi)
         
         return {
             'depreciation': depreciation,
@@ -834,17 +769,9 @@ class LeaseProcessor:
         if not first_date:
             return 0.0
         
-        accumulated_dep = 0.0
-        
         # VBA Line 583: For cell.Value > Firstdate And cell.Value <= opendate
-        for row in schedule:
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if not row_date:
-                continue
-            
-            # Accumulate depreciation from Firstdate to opendate (start_date)
-            if first_date < row_date <= start_date:
-                accumulated_dep += abs(row.depreciation or 0.0)
+        # Accumulate depreciation from Firstdate to opendate (start_date)
+        accumulated_dep = self._schedule_index(schedule).window_sum('abs_depreciation', first_date, start_date)
         
         # Add period depreciation (already calculated in period_activity)
         # This would be added in results_processor when building the row
@@ -8,6 +8,9 @@ VBA Projection Loop:
   - Lines 526-533: Find closing balances at projection date (pfindclosing)
   - Lines 537-546: Calculate period activity (pfindPL): depreciation, interest, rent
   - Lines 548-550: Store in AD4, AC4, AE4, AF4, AG4 columns
+
+Projection dates only move forward, so all periods are computed in one forward
+sweep of the schedule; the VBA cap of 6 periods is kept as the default horizon.
 """
 
 from datetime import date
@@ -15,10 +18,14 @@ from typing import List, Dict, Optional
 from dateutil.relativedelta import relativedelta
 import logging
 from .models import LeaseData, PaymentScheduleRow
+from .schedule_index import ScheduleIndex
 from ..utils.date_utils import eomonth
 
 logger = logging.getLogger(__name__)
 
+# VBA: projectionmode < 6
+VBA_MAX_PROJECTIONS = 6
+
 
 class ProjectionCalculator:
     """
@@ -26,16 +33,20 @@ class ProjectionCalculator:
     VBA Source: Lines 510-568 (Projections loop)
     """
     
-    def __init__(self, schedule: List[PaymentScheduleRow], lease_data: LeaseData):
+    def __init__(self, schedule: List[PaymentScheduleRow], lease_data: LeaseData,
+                 index: Optional[ScheduleIndex] = None):
         self.schedule = schedule
         self.lease_data = lease_data
+        # Date index with prefix-sum columns (shared with LeaseProcessor when given)
+        self.index = index if index is not None else ScheduleIndex(schedule)
         
     def calculate_projections(
         self, 
         balance_date: date,
         projection_periods: int = 3,
         period_months: int = 3,
-        enable_projections: bool = True
+        enable_projections: bool = True,
+        max_periods: Optional[int] = VBA_MAX_PROJECTIONS
     ) -> List[Dict[str, any]]:
         """
         Calculate projection periods
@@ -43,13 +54,14 @@ class ProjectionCalculator:
         
         Args:
             balance_date: Current balance date (to_date)
-            projection_periods: Number of periods to calculate (max 6, like VBA)
+            projection_periods: Number of periods to calculate
             period_months: Months per period (from A4 in VBA)
             enable_projections: Whether projections are enabled (A3 in VBA)
+            max_periods: Cap on projection_periods (6 like VBA, None for unbounded)
         
         Returns:
             List of projection dicts, each containing:
-            - projection_mode: 1-6
+            - projection_mode: 1-N
             - projection_date: Future date
             - closing_liability: Liability at projection date
             - closing_rou_asset: ROU Asset at projection date
@@ -63,7 +75,7 @@ class ProjectionCalculator:
         projections = []
         baldatep = balance_date  # VBA: baldatep = baldate
         projectionmode = 0
-        max_projections = min(projection_periods, 6)  # VBA: projectionmode < 6
+        max_projections = projection_periods if max_periods is None else min(projection_periods, max_periods)
         
         # Sublease multiplier (VBA Line 362)
         subl = -1 if self.lease_data.sublease == "Yes" else 1
@@ -84,20 +96,16 @@ class ProjectionCalculator:
         # VBA Line 511: If forceenddate <= baldate And forceenddate <> 0 Then GoTo skip_projections
         # However, if schedule data exists beyond termination_date AND beyond balance_date, allow projections
         # This handles cases where lease was modified but schedule continues
+        # Schedule is in date order: the last row has the max schedule date
+        index = self.index
+        max_schedule_date = date.fromordinal(index.ordinals[-1]) if len(index) else None
+        
         if forceenddate:
-            # Find max schedule date
-            max_schedule_check = None
-            for row in self.schedule:
-                row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-                if row_date:
-                    if max_schedule_check is None or row_date > max_schedule_check:
-                        max_schedule_check = row_date
-            
             # VBA Line 511: If forceenddate <= balance_date, skip projections
             # BUT: If schedule extends beyond balance_date, we can still project forward
             if forceenddate <= balance_date:
                 # Only skip if max schedule date is at or before balance_date (no future to project)
-                if not max_schedule_check or max_schedule_check <= balance_date:
+                if not max_schedule_date or max_schedule_date <= balance_date:
                     return []
         
         # If forceenddate is after balance_date (future modification), can't project into that period
@@ -105,15 +113,6 @@ class ProjectionCalculator:
             # Can't project into a future modification - return empty
             return []
         
-        # Check if there's any schedule data after balance_date for projections
-        # If balance_date is beyond all schedule dates, we can't project forward
-        max_schedule_date = None
-        for row in self.schedule:
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if row_date:
-                if max_schedule_date is None or row_date > max_schedule_date:
-                    max_schedule_date = row_date
-        
         # If balance_date is beyond max_schedule_date, start from max_schedule_date
         # This ensures we can still calculate projections even when to_date extends beyond lease end
         if max_schedule_date and balance_date > max_schedule_date:
@@ -121,14 +120,12 @@ class ProjectionCalculator:
         
         # If balance_date equals lease end exactly, find the last date before lease end to project from
         if self.lease_data.end_date and balance_date == self.lease_data.end_date:
-            dates_before_end = [row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None) 
-                               for row in self.schedule 
-                               if (row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)) 
-                               and (row.date if hasattr(row, 'date') else row.payment_date) < self.lease_data.end_date]
-            if dates_before_end:
-                balance_date = max(dates_before_end)
+            last_pos = index.last_before(self.lease_data.end_date)
+            if last_pos >= 0:
+                balance_date = date.fromordinal(index.ordinals[last_pos])
         
         baldatep = balance_date
+        cursor = 0  # Sweep position: first schedule row not yet consumed
         
         while projectionmode < max_projections:
             projectionmode += 1  # VBA Line 513
@@ -153,12 +150,9 @@ class ProjectionCalculator:
                 break
             
             # VBA Lines 526-533: pfindclosing - Find closing balances at baldatep
-            closing_liability_p, closing_rou_p = self._find_closing_at_date(baldatep)
-            
-            # VBA Lines 537-546: pfindPL - Calculate period activity
-            # Sum depreciation, interest, rent between opendatep and baldatep
-            deprp, inttp, RentPaidp = self._calculate_period_activity(
-                opendatep, baldatep
+            # VBA Lines 537-546: pfindPL - Sum depreciation, interest, rent between opendatep and baldatep
+            cursor, (closing_liability_p, closing_rou_p), (deprp, inttp, RentPaidp) = self._sweep_period(
+                cursor, opendatep, baldatep
             )
             
             # VBA Lines 548-550: Store results
@@ -199,77 +193,40 @@ class ProjectionCalculator:
         # Use the date_utils.eomonth function which correctly ports Excel EOMONTH
         return eomonth(date_val, months)
     
-    def _find_closing_at_date(self, target_date: date) -> tuple:
-        """
-        Find closing liability and ROU asset at projection date
-        VBA Lines 526-533: pfindclosing
-        VBA: For Each cell In Range("C9:C" & endrow)
-             If cell.Value = baldatep Then
-                 AD4 = cell.Offset(0, 4).Value (liability)
-                 AC4 = cell.Offset(0, 6).Value (ROU)
-        Returns: (liability, rou_asset)
+    def _sweep_period(self, cursor: int, from_date: date, to_date: date) -> tuple:
         """
-        closing_liability = 0.0
-        closing_rou = 0.0
-        
-        # Try exact date match first
-        for row in self.schedule:
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if not row_date:
-                continue
-            
-            if row_date == target_date:
-                closing_liability = row.lease_liability or 0.0
-                closing_rou = row.rou_asset or 0.0
-                return (closing_liability, closing_rou)
-            
-            # Track last row up to target_date
-            if row_date <= target_date:
-                closing_liability = row.lease_liability or 0.0
-                closing_rou = row.rou_asset or 0.0
-            elif row_date > target_date:
-                # Interpolate - use previous row's values (VBA copies from previous row)
-                break
+        pfindclosing and pfindPL for one projection period in a single forward pass
+        Rows before cursor were consumed by earlier periods (all dated <= from_date)
         
-        return (closing_liability, closing_rou)
-    
-    def _calculate_period_activity(
-        self, 
-        from_date: date, 
-        to_date: date
-    ) -> tuple:
+        Returns: (next cursor, (liability, rou_asset), (depreciation, interest, rent_paid))
         """
-        Calculate period activity between from_date and to_date
-        VBA Lines 537-546: pfindPL
-        VBA: For cell.Value > opendatep And cell.Value <= baldatep
-             deprp = deprp + cell.Offset(0, 7).Value (depreciation)
-             inttp = inttp + cell.Offset(0, 3).Value (interest)
-             RentPaidp = RentPaidp + cell.Offset(0, 1).Value (rental)
+        rows = self.index.rows
+        ordinals = self.index.ordinals
+        open_ordinal = from_date.toordinal()
+        close_ordinal = to_date.toordinal()
         
-        Returns: (depreciation, interest, rent_paid)
-        """
         deprp = 0.0
         inttp = 0.0
         RentPaidp = 0.0
+        exact_pos = None
         
-        # Handle case where from_date and to_date are same (no period to calculate)
-        if from_date >= to_date:
-            return (0.0, 0.0, 0.0)
-        
-        for row in self.schedule:
-            row_date = row.date if hasattr(row, 'date') else (row.payment_date if hasattr(row, 'payment_date') else None)
-            if not row_date:
-                continue
-            
+        while cursor < len(rows) and ordinals[cursor] <= close_ordinal:
+            row = rows[cursor]
             # VBA: cell.Value > opendatep And cell.Value <= baldatep
-            if row_date > from_date and row_date <= to_date:
+            if ordinals[cursor] > open_ordinal:
                 deprp += row.depreciation or 0.0  # Column J (offset 7 from C)
                 inttp += row.interest or 0.0  # Column F (offset 3 from C)
                 RentPaidp += row.rental_amount or 0.0  # Column D (offset 1 from C)
-            
-            # VBA Line 545: If cell.Value > baldatep Then Exit For
-            if row_date > to_date:
-                break
-        
-        return (deprp, inttp, RentPaidp)
-
+            # VBA: If cell.Value = baldatep (first exact match wins)
+            if exact_pos is None and ordinals[cursor] == close_ordinal:
+                exact_pos = cursor
+            cursor += 1
+        
+        # Exact match, otherwise the last row up to to_date (VBA copies from previous row)
+        closing_pos = exact_pos if exact_pos is not None else cursor - 1
+        if closing_pos >= 0:
+            closing = (rows[closing_pos].lease_liability or 0.0, rows[closing_pos].rou_asset or 0.0)
+        else:
+            closing = (0.0, 0.0)
+        
+        return cursor, closing, (deprp, inttp, RentPaidp)
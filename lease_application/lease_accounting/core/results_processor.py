@@ -6,15 +6,126 @@ VBA Source: VB script/Code, compu() Sub (Lines 316-605)
 VBA Results Sheet: Columns D4-AG4 (and beyond) for lease results
 """
 
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
 from datetime import date
-from typing import List, Dict, Optional
+from typing import Any, Callable, Iterator, List, Dict, Optional, Sequence, Tuple
 import logging
+import multiprocessing.context
+import os
 from .models import LeaseData, LeaseResult, ProcessingFilters
 from .processor import LeaseProcessor
+from ..schedule.generator_vba_complete import get_calculation_engine, set_calculation_engine
 from ..utils.journal_generator import JournalGenerator
 
 logger = logging.getLogger(__name__)
 
+# Bulk processing defaults (see configure_bulk_processing)
+DEFAULT_BULK_WORKERS = 1  # 1 = serial
+DEFAULT_BULK_CHUNK_SIZE = 50
+DEFAULT_BULK_LEASE_TIMEOUT = 30.0  # Seconds per lease in a chunk
+DEFAULT_BULK_PARALLEL_THRESHOLD = 200  # Smaller batches run serially
+
+_bulk_settings = {
+    'workers': DEFAULT_BULK_WORKERS,
+    'chunk_size': DEFAULT_BULK_CHUNK_SIZE,
+    'lease_timeout': DEFAULT_BULK_LEASE_TIMEOUT,
+    'parallel_threshold': DEFAULT_BULK_PARALLEL_THRESHOLD,
+}
+
+# Per-period outcome of a lease that was skipped (filters, short-term or error)
+_SKIPPED = 'skipped'
+
+# Aggregated totals: (totals key, results row key) summed across leases
+AGGREGATED_TOTAL_FIELDS = (
+    ('total_closing_liability', 'closing_liability_total'),
+    ('total_closing_liability_current', 'closing_liability_current'),
+    ('total_closing_liability_non_current', 'closing_liability_non_current'),
+    ('total_closing_rou_asset', 'closing_rou_asset'),
+    ('total_closing_security_deposit', 'closing_security_deposit'),
+    ('total_closing_aro_liability', 'closing_aro_liability'),
+    ('total_interest_expense', 'interest_expense'),
+    ('total_depreciation_expense', 'depreciation_expense'),
+    ('total_aro_interest', 'aro_interest'),
+    ('total_rent_paid', 'rent_paid'),
+    ('total_opening_liability', 'opening_liability'),
+    ('total_opening_rou_asset', 'opening_rou_asset'),
+    ('total_gain_loss_pnl', 'gain_loss_pnl'),
+)
+
+
+def configure_bulk_processing(workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                              lease_timeout: Optional[float] = None,
+                              parallel_threshold: Optional[int] = None) -> None:
+    """Set process-pool defaults for ResultsProcessor (workers <= 0 uses os.cpu_count())"""
+    if workers is not None:
+        _bulk_settings['workers'] = workers if workers > 0 else (os.cpu_count() or 1)
+    if chunk_size is not None:
+        _bulk_settings['chunk_size'] = max(chunk_size, 1)
+    if lease_timeout is not None:
+        _bulk_settings['lease_timeout'] = lease_timeout
+    if parallel_threshold is not None:
+        _bulk_settings['parallel_threshold'] = parallel_threshold
+
+
+def _init_bulk_worker(engine: str) -> None:
+    """Process-pool initializer: use the parent's basic_calc() engine"""
+    set_calculation_engine(engine)
+
+
+class _TrackingSpawnContext(multiprocessing.context.SpawnContext):
+    """spawn start method that keeps a handle on every process it starts"""
+
+    def __init__(self):
+        self.processes: List[multiprocessing.context.SpawnProcess] = []
+
+    def Process(self, *args, **kwargs):
+        process = multiprocessing.context.SpawnProcess(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+
+class _BulkPool(ProcessPoolExecutor):
+    """
+    Process pool for bulk chunks that can be terminated with tasks still running
+    Workers are spawned rather than forked so they don't inherit the server's threads and open connections
+    """
+
+    def __init__(self, workers: int):
+        self._worker_context = _TrackingSpawnContext()
+        super().__init__(max_workers=workers, mp_context=self._worker_context,
+                         initializer=_init_bulk_worker, initargs=(get_calculation_engine(),))
+
+    def terminate(self) -> None:
+        """Shut down without waiting for running tasks (their worker processes are killed)"""
+        self.shutdown(wait=False, cancel_futures=True)
+        for process in self._worker_context.processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
+def _start_bulk_pool(workers: int) -> Optional[_BulkPool]:
+    """Process pool for bulk chunks (None if processes cannot be started)"""
+    try:
+        return _BulkPool(workers)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️  Process pool unavailable ({e}); processing serially")
+        return None
+
+
+def _completed(future) -> bool:
+    """Whether a work unit's future finished with a result"""
+    return future.done() and not future.cancelled() and future.exception() is None
+
+
+def _process_lease_chunk(filters: ProcessingFilters, periods: Sequence[Tuple[date, date]],
+                         lease_data_list: List[LeaseData]) -> List[List[Any]]:
+    """Process-pool task: per-period outcomes for each lease of a chunk"""
+    processor = ResultsProcessor(filters, workers=1)
+    return [processor._evaluate_lease(lease_data, periods) for lease_data in lease_data_list]
+
 # Import JournalEntry from journal_generator
 try:
     from ..utils.journal_generator import JournalEntry
@@ -52,11 +163,19 @@ class ResultsProcessor:
     Equivalent to VBA compu() loop: For ai = G2 To G3
     """
     
-    def __init__(self, filters: ProcessingFilters):
+    def __init__(self, filters: ProcessingFilters, workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, lease_timeout: Optional[float] = None,
+                 parallel_threshold: Optional[int] = None):
         self.filters = filters
         self.lease_processor = LeaseProcessor(filters)
         self.results: List[Dict] = []
         self.aggregated_totals: Dict = {}
+        # Process-pool settings (module defaults from configure_bulk_processing)
+        self.workers = workers if workers is not None else _bulk_settings['workers']
+        self.chunk_size = max(chunk_size or _bulk_settings['chunk_size'], 1)
+        self.lease_timeout = lease_timeout if lease_timeout is not None else _bulk_settings['lease_timeout']
+        self.parallel_threshold = (parallel_threshold if parallel_threshold is not None
+                                   else _bulk_settings['parallel_threshold'])
     
     def process_bulk_leases(self, lease_data_list: List[LeaseData]) -> Dict:
         """
@@ -72,129 +191,264 @@ class ResultsProcessor:
                 'skipped_count': int
             }
         """
-        logger.info(f"🔄 Starting bulk processing: {len(lease_data_list)} leases")
+        return self.process_bulk_lease_periods(
+            lease_data_list, [(self.filters.start_date, self.filters.end_date)]
+        )[0]
+    
+    def process_bulk_lease_periods(self, lease_data_list: List[LeaseData],
+                                   periods: Sequence[Tuple[date, date]],
+                                   progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """
+        Process multiple leases for several reporting periods
+        Each lease's schedule is built once and evaluated for every period it passes the filters for.
+        Large batches are fanned out in chunks to a process pool (see configure_bulk_processing);
+        results and journals are merged in lease order either way.
+        progress(done, total) is called after each lease; an exception raised there aborts the run.
         
-        processed_count = 0
-        skipped_count = 0
-        individual_results = []
-        consolidated_journals_dict: Dict[str, JournalEntry] = {}
+        Returns:
+            One process_bulk_leases result dict per (start_date, end_date) period, in order
+        """
+        individual_results: List[List[Dict]] = [[] for _ in periods]
+        bulk_results: List[Dict] = [{} for _ in periods]
+        
+        for kind, k, payload in self.iter_bulk_lease_periods(lease_data_list, periods, progress):
+            if kind == 'result':
+                individual_results[k].append(payload)
+            else:
+                bulk_results[k] = {'results': individual_results[k], **payload}
+        
+        return bulk_results
+    
+    def iter_bulk_lease_periods(self, lease_data_list: List[LeaseData],
+                                periods: Sequence[Tuple[date, date]],
+                                progress: Optional[Callable[[int, int], None]] = None
+                                ) -> Iterator[Tuple[str, int, Dict]]:
+        """
+        Streaming form of process_bulk_lease_periods: results rows are not kept in memory
+        
+        Yields:
+            ('result', period_index, results_row) as soon as each lease is processed, then
+            ('summary', period_index, bulk result without 'results') for every period
+        """
+        logger.info(f"🔄 Starting bulk processing: {len(lease_data_list)} leases, {len(periods)} period(s)")
         
-        # Process each lease (VBA: For ai = G2 To G3)
-        for lease_data in lease_data_list:
+        processed_count = [0] * len(periods)
+        skipped_count = [0] * len(periods)
+        aggregated_totals: List[Dict] = [{} for _ in periods]
+        consolidated_journals_dict: List[Dict[str, JournalEntry]] = [{} for _ in periods]
+        
+        # Merge per-lease outcomes in lease order (same totals and journal order as serial)
+        for done, outcomes in enumerate(self._lease_outcomes(lease_data_list, periods), start=1):
+            for k, outcome in enumerate(outcomes):
+                if outcome == _SKIPPED:
+                    skipped_count[k] += 1
+                elif outcome is not None:
+                    result_row, journals = outcome
+                    processed_count[k] += 1
+                    self._add_to_totals(aggregated_totals[k], result_row)
+                    self._consolidate_journals(consolidated_journals_dict[k], journals)
+                    yield 'result', k, result_row
+            if progress:
+                progress(done, len(lease_data_list))
+        
+        logger.info(f"✅ Bulk processing complete: {sum(processed_count)} processed, {sum(skipped_count)} skipped")
+        
+        for k in range(len(periods)):
+            # Convert consolidated journals to list
+            consolidated_journals = list(consolidated_journals_dict[k].values())
+            
+            yield 'summary', k, {
+                'aggregated_totals': aggregated_totals[k],
+                'consolidated_journals': [j.to_dict() for j in consolidated_journals],
+                'success': True,
+                'processed_count': processed_count[k],
+                'skipped_count': skipped_count[k],
+                'total_count': len(lease_data_list)
+            }
+    
+    def _lease_outcomes(self, lease_data_list: List[LeaseData], periods: Sequence[Tuple[date, date]]):
+        """
+        Per-period outcomes for each lease, in lease order
+        Serial for small batches; otherwise chunks go to a ProcessPoolExecutor
+        """
+        if self.workers <= 1 or len(lease_data_list) < max(self.parallel_threshold, 2):
+            for lease_data in lease_data_list:
+                yield self._evaluate_lease(lease_data, periods)
+            return
+        
+        chunks = [lease_data_list[i:i + self.chunk_size]
+                  for i in range(0, len(lease_data_list), self.chunk_size)]
+        logger.info(f"⚡ Parallel bulk processing: {len(chunks)} chunks on {self.workers} workers")
+        
+        # Work units collected in order: chunks, or single leases of a chunk that timed out
+        units: List[List[LeaseData]] = chunks
+        futures: List[Any] = [None] * len(units)
+        done = 0  # Units already yielded
+        executor = _start_bulk_pool(self.workers)
+        try:
+            while executor is not None and done < len(units):
+                # (Re)submit every unit not yet collected, reusing results a replaced pool already returned
+                for i in range(done, len(units)):
+                    if futures[i] is None or not _completed(futures[i]):
+                        futures[i] = executor.submit(_process_lease_chunk, self.filters, periods, units[i])
+                for i in range(done, len(units)):
+                    unit = units[i]
+                    try:
+                        # Units are collected in order, so each wait covers its own unit's work
+                        unit_outcomes = futures[i].result(timeout=self.lease_timeout * len(unit))
+                    except FutureTimeoutError:
+                        if len(unit) > 1:
+                            # Retry the chunk one lease at a time so only the lease that hangs is skipped
+                            logger.warning(f"⚠️  Timed out processing a chunk of {len(unit)} leases; "
+                                           f"retrying them one at a time")
+                            units[i:i + 1] = [[lease_data] for lease_data in unit]
+                            futures[i:i + 1] = [None] * len(unit)
+                        else:
+                            logger.error(f"❌ Timed out processing lease {unit[0].auto_id}")
+                            yield [_SKIPPED] * len(periods)
+                            done += 1
+                        # A running task cannot be cancelled: replace the pool so it can't hold a worker
+                        executor.terminate()
+                        executor = _start_bulk_pool(self.workers)
+                        break
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.error(f"❌ Error processing lease chunk: {e}", exc_info=True)
+                        unit_outcomes = [[_SKIPPED] * len(periods) for _ in unit]
+                    yield from unit_outcomes
+                    done += 1
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️  Process pool failed ({e}); processing remaining leases serially")
+        finally:
+            if executor is not None:
+                executor.terminate()
+        
+        # Serial fallback (no pool or a failed pool); units the pool already finished aren't recomputed
+        for i in range(done, len(units)):
+            if futures[i] is not None and _completed(futures[i]):
+                yield from futures[i].result()
+                continue
+            for lease_data in units[i]:
+                yield self._evaluate_lease(lease_data, periods)
+    
+    def _evaluate_lease(self, lease_data: LeaseData, periods: Sequence[Tuple[date, date]]) -> List[Any]:
+        """
+        Process one lease for every period
+        Returns per period: _SKIPPED, None (no result) or (results row, journal entries)
+        """
+        outcomes: List[Any] = [_SKIPPED] * len(periods)
+        due = []  # Positions of the periods this lease is processed for
+        for k, (start_date, end_date) in enumerate(periods):
+            filters = replace(self.filters, start_date=start_date, end_date=end_date)
             # Check if lease should be processed (VBA Lines 330-337: Filter checks)
-            if not self._should_process_lease(lease_data):
-                skipped_count += 1
+            if not self._should_process_lease(lease_data, filters):
                 logger.debug(f"⏭️  Skipping lease {lease_data.auto_id}: Failed filters")
                 continue
             
             # Skip short-term leases (VBA Lines 340-345)
             if self._is_short_term_lease(lease_data):
-                skipped_count += 1
                 logger.debug(f"⏭️  Skipping lease {lease_data.auto_id}: Short-term lease")
                 continue
             
-            try:
-                # Process single lease (VBA: Calls modify_calc, then processes)
-                result = self.lease_processor.process_single_lease(lease_data)
-                
+            due.append(k)
+        
+        if not due:
+            return outcomes
+        
+        try:
+            # Process single lease for all its periods (VBA: Calls modify_calc, then processes)
+            lease_results = self.lease_processor.process_lease_periods(
+                lease_data, [periods[k] for k in due]
+            )
+            
+            for k, result in zip(due, lease_results):
+                outcome = None
                 if result:
-                    processed_count += 1
-                    
                     # Convert result to Results table row format (VBA Lines 485-499)
                     result_row = self._convert_to_results_row(lease_data, result)
-                    individual_results.append(result_row)
                     
-                    # Generate journals for this lease and consolidate
+                    # Generate journals for this lease (consolidated by the caller)
                     journal_gen = JournalGenerator(gaap_standard=self.filters.gaap_standard)
                     journals = journal_gen.generate_journals(result, [], None)  # No schedule needed for journals
-                    
-                    # Consolidate journal entries (sum by account)
-                    for journal in journals:
-                        account_key = f"{journal.account_code}_{journal.account_name}"
-                        if account_key not in consolidated_journals_dict:
-                            consolidated_journals_dict[account_key] = JournalEntry(
-                                bs_pl=journal.bs_pl,
-                                account_code=journal.account_code,
-                                account_name=journal.account_name,
-                                result_period=0.0,
-                                previous_period=0.0,
-                                ifrs_adjustment=0.0,
-                                incremental_adjustment=0.0,
-                                usgaap_entry=0.0
-                            )
-                        
-                        consolidated_journals_dict[account_key].result_period += journal.result_period
-                        consolidated_journals_dict[account_key].previous_period += journal.previous_period
-                        consolidated_journals_dict[account_key].ifrs_adjustment += journal.ifrs_adjustment
-                        consolidated_journals_dict[account_key].incremental_adjustment += journal.incremental_adjustment
+                    outcome = (result_row, journals)
                     
                     logger.info(f"✅ Processed lease {lease_data.auto_id}: {lease_data.description}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing lease {lease_data.auto_id}: {e}", exc_info=True)
-                skipped_count += 1
-        
-        # Calculate aggregated totals (sum all results)
-        aggregated_totals = self._calculate_aggregated_totals(individual_results)
-        
-        # Convert consolidated journals to list
-        consolidated_journals = list(consolidated_journals_dict.values())
-        
-        logger.info(f"✅ Bulk processing complete: {processed_count} processed, {skipped_count} skipped")
+                outcomes[k] = outcome
+            
+        except Exception as e:
+            logger.error(f"❌ Error processing lease {lease_data.auto_id}: {e}", exc_info=True)
         
-        return {
-            'results': individual_results,
-            'aggregated_totals': aggregated_totals,
-            'consolidated_journals': [j.to_dict() for j in consolidated_journals],
-            'success': True,
-            'processed_count': processed_count,
-            'skipped_count': skipped_count,
-            'total_count': len(lease_data_list)
-        }
+        return outcomes
     
-    def _should_process_lease(self, lease_data: LeaseData) -> bool:
+    def _consolidate_journals(self, consolidated_journals_dict: Dict[str, JournalEntry],
+                              journals: List[JournalEntry]) -> None:
+        """Add one lease's journal entries into the consolidated journals (sum by account)"""
+        for journal in journals:
+            account_key = f"{journal.account_code}_{journal.account_name}"
+            if account_key not in consolidated_journals_dict:
+                consolidated_journals_dict[account_key] = JournalEntry(
+                    bs_pl=journal.bs_pl,
+                    account_code=journal.account_code,
+                    account_name=journal.account_name,
+                    result_period=0.0,
+                    previous_period=0.0,
+                    ifrs_adjustment=0.0,
+                    incremental_adjustment=0.0,
+                    usgaap_entry=0.0
+                )
+            
+            consolidated_journals_dict[account_key].result_period += journal.result_period
+            consolidated_journals_dict[account_key].previous_period += journal.previous_period
+            consolidated_journals_dict[account_key].ifrs_adjustment += journal.ifrs_adjustment
+            consolidated_journals_dict[account_key].incremental_adjustment += journal.incremental_adjustment
+    
+    def _should_process_lease(self, lease_data: LeaseData,
+                              filters: Optional[ProcessingFilters] = None) -> bool:
         """
-        Check if lease passes all filters
+        Check if lease passes all filters (self.filters unless a period's filters are given)
         VBA Lines 330-337: Filter validation
         """
+        filters = filters or self.filters
+        
         # Cost center filter (VBA Line 330)
-        if self.filters.cost_center_filter and \
-           lease_data.cost_centre != self.filters.cost_center_filter:
+        if filters.cost_center_filter and \
+           lease_data.cost_centre != filters.cost_center_filter:
             return False
         
         # Entity filter (VBA Line 331)
-        if self.filters.entity_filter and \
-           lease_data.group_entity_name != self.filters.entity_filter:
+        if filters.entity_filter and \
+           lease_data.group_entity_name != filters.entity_filter:
             return False
         
         # Asset class filter (VBA Line 332)
-        if self.filters.asset_class_filter and \
-           lease_data.asset_class != self.filters.asset_class_filter:
+        if filters.asset_class_filter and \
+           lease_data.asset_class != filters.asset_class_filter:
             return False
         
         # Profit center filter (VBA Line 333)
-        if self.filters.profit_center_filter and \
-           lease_data.profit_center != self.filters.profit_center_filter:
+        if filters.profit_center_filter and \
+           lease_data.profit_center != filters.profit_center_filter:
             return False
         
         # Date modified filter (VBA Line 334)
-        if self.filters.start_date and lease_data.date_modified and \
-           lease_data.date_modified < self.filters.start_date:
+        if filters.start_date and lease_data.date_modified and \
+           lease_data.date_modified < filters.start_date:
             return False
         
         # Termination date filter (VBA Line 335)
-        if self.filters.end_date and lease_data.termination_date and \
-           lease_data.termination_date < self.filters.start_date:
+        if filters.end_date and lease_data.termination_date and \
+           lease_data.termination_date < filters.start_date:
             return False
         
         # End date filter (VBA Line 336)
-        if self.filters.start_date and lease_data.end_date and \
-           lease_data.end_date < self.filters.start_date:
+        if filters.start_date and lease_data.end_date and \
+           lease_data.end_date < filters.start_date:
             return False
         
         # Lease start date filter (VBA Line 337)
-        if self.filters.end_date and lease_data.lease_start_date and \
-           lease_data.lease_start_date > self.filters.end_date:
+        if filters.end_date and lease_data.lease_start_date and \
+           lease_data.lease_start_date > filters.end_date:
             return False
         
         return True
@@ -345,25 +599,19 @@ class ResultsProcessor:
         Calculate aggregated totals across all leases
         Equivalent to sum formulas in Excel Results sheet
         """
-        if not results:
-            return {}
-        
-        totals = {
-            'total_leases': len(results),
-            'total_closing_liability': sum(r.get('closing_liability_total', 0) for r in results),
-            'total_closing_liability_current': sum(r.get('closing_liability_current', 0) for r in results),
-            'total_closing_liability_non_current': sum(r.get('closing_liability_non_current', 0) for r in results),
-            'total_closing_rou_asset': sum(r.get('closing_rou_asset', 0) for r in results),
-            'total_closing_security_deposit': sum(r.get('closing_security_deposit', 0) for r in results),
-            'total_closing_aro_liability': sum(r.get('closing_aro_liability', 0) for r in results),
-            'total_interest_expense': sum(r.get('interest_expense', 0) for r in results),
-            'total_depreciation_expense': sum(r.get('depreciation_expense', 0) for r in results),
-            'total_aro_interest': sum(r.get('aro_interest', 0) for r in results),
-            'total_rent_paid': sum(r.get('rent_paid', 0) for r in results),
-            'total_opening_liability': sum(r.get('opening_liability', 0) for r in results),
-            'total_opening_rou_asset': sum(r.get('opening_rou_asset', 0) for r in results),
-            'total_gain_loss_pnl': sum(r.get('gain_loss_pnl', 0) for r in results),
-        }
+        totals: Dict = {}
+        for row in results:
+            self._add_to_totals(totals, row)
         
         return totals
-
+    
+    def _add_to_totals(self, totals: Dict, row: Dict) -> None:
+        """Add one results row to running aggregated totals (empty dict until the first row)"""
+        if not totals:
+            totals['total_leases'] = 0
+            for total_key, _ in AGGREGATED_TOTAL_FIELDS:
+                totals[total_key] = 0
+        
+        totals['total_leases'] += 1
+        for total_key, row_key in AGGREGATED_TOTAL_FIELDS:
+            totals[total_key] += row.get(row_key, 0)
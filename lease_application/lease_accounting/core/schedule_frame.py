@@ -0,0 +1,291 @@
+"""
+Columnar Schedule Storage
+Struct-of-arrays container for payment schedules (Excel Compute sheet columns C-O)
+
+Each column is an array.array (date ordinals, floats, flags) instead of one
+PaymentScheduleRow object per row. ScheduleRowView exposes a row with the same
+attributes as PaymentScheduleRow, so code iterating a schedule keeps working.
+Frozen frames (shared cached schedules) reject writes; copy() gives an editable frame.
+"""
+
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+import struct
+import sys
+from .models import PaymentScheduleRow
+
+
+# Float columns (Compute sheet D-O plus derived fields); None is stored as NaN
+FLOAT_COLUMNS = (
+    'rental_amount',        # Column D
+    'pv_factor',            # Column E
+    'interest',             # Column F
+    'lease_liability',      # Column G
+    'pv_of_rent',           # Column H
+    'rou_asset',            # Column I
+    'depreciation',         # Column J
+    'change_in_rou',        # Column K
+    'security_deposit_pv',  # Column L
+    'aro_gross',            # Column M
+    'aro_interest',         # Column N
+    'aro_provision',        # Column O
+    'principal',
+    'remaining_balance',
+)
+
+FLAG_COLUMNS = ('is_opening', 'is_closing')
+
+_NAN = float('nan')
+
+# to_bytes() layout: magic, byte order, row/column counts, borrowing rate (NaN for None),
+# then raw column arrays
+_BLOB_MAGIC = b'LSF2'
+_BLOB_HEADER = struct.Struct('<4sBIHHd')
+
+
+def _check_writable(frame: 'ScheduleFrame') -> None:
+    if frame._read_only:
+        raise TypeError("schedule is read-only (shared by the schedule cache); use copy() to edit it")
+
+
+class ScheduleFrame:
+    """
+    Payment schedule stored column by column
+    Behaves like a read/write sequence of PaymentScheduleRow-compatible row views
+    (read-only once frozen)
+    """
+
+    def __init__(self):
+        self._ordinals = array('q')  # Column C as date ordinals
+        self._columns: Dict[str, array] = {name: array('d') for name in FLOAT_COLUMNS}
+        self._flags: Dict[str, array] = {name: array('b') for name in FLAG_COLUMNS}
+        self._dates: Optional[List[date]] = None
+        # C7 the schedule was calculated at (the GoalSeek result for FV of ROU leases)
+        self.borrowing_rate: Optional[float] = None
+        self._read_only = False
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[PaymentScheduleRow]) -> 'ScheduleFrame':
+        """Build a frame from PaymentScheduleRow objects (or row views)"""
+        frame = cls()
+        for row in rows:
+            frame.append(row)
+        return frame
+
+    def freeze(self) -> 'ScheduleFrame':
+        """Make the frame and its row views read-only; returns the frame"""
+        self._read_only = True
+        return self
+
+    @property
+    def read_only(self) -> bool:
+        """True once freeze() was called"""
+        return self._read_only
+
+    def copy(self) -> 'ScheduleFrame':
+        """Editable copy of the frame"""
+        frame = ScheduleFrame()
+        frame._ordinals = array('q', self._ordinals)
+        frame._columns = {name: array('d', values) for name, values in self._columns.items()}
+        frame._flags = {name: array('b', values) for name, values in self._flags.items()}
+        frame.borrowing_rate = self.borrowing_rate
+        return frame
+
+    def append(self, row: PaymentScheduleRow) -> None:
+        """Append one row"""
+        _check_writable(self)
+        self._ordinals.append(row.date.toordinal())
+        for name, values in self._columns.items():
+            value = getattr(row, name)
+            values.append(_NAN if value is None else value)
+        for name, values in self._flags.items():
+            values.append(1 if getattr(row, name) else 0)
+        self._dates = None
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self) -> Iterator['ScheduleRowView']:
+        for i in range(len(self._ordinals)):
+            yield ScheduleRowView(self, i)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [ScheduleRowView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("schedule row index out of range")
+        return ScheduleRowView(self, index)
+
+    def index(self, row: 'ScheduleRowView') -> int:
+        """Position of a row view belonging to this frame"""
+        if isinstance(row, ScheduleRowView) and row._frame is self:
+            return row._index
+        raise ValueError("row is not in this schedule")
+
+    def __contains__(self, row) -> bool:
+        return isinstance(row, ScheduleRowView) and row._frame is self
+
+    @property
+    def date_ordinals(self) -> Union[array, memoryview]:
+        """Column C as ascending date ordinals (a read-only view once frozen)"""
+        return memoryview(self._ordinals).toreadonly() if self._read_only else self._ordinals
+
+    @property
+    def dates(self) -> List[date]:
+        """Column C as date objects (built once, cached until a date changes)"""
+        if self._dates is None:
+            self._dates = [date.fromordinal(ordinal) for ordinal in self._ordinals]
+        return self._dates
+
+    def column(self, name: str) -> Union[array, memoryview]:
+        """Raw float column (None values are NaN; a read-only view once frozen)"""
+        values = self._columns[name]
+        return memoryview(values).toreadonly() if self._read_only else values
+
+    def column_sum(self, name: str) -> float:
+        """Sum of a float column, treating None as 0"""
+        return sum(value for value in self._columns[name] if value == value)
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form (date ordinals, float and flag columns as raw arrays)"""
+        header = _BLOB_HEADER.pack(_BLOB_MAGIC, 1 if sys.byteorder == 'little' else 0,
+                                   len(self), len(FLOAT_COLUMNS), len(FLAG_COLUMNS),
+                                   _NAN if self.borrowing_rate is None else self.borrowing_rate)
+        parts = [header, self._ordinals.tobytes()]
+        parts.extend(self._columns[name].tobytes() for name in FLOAT_COLUMNS)
+        parts.extend(self._flags[name].tobytes() for name in FLAG_COLUMNS)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> 'ScheduleFrame':
+        """Rebuild a frame from to_bytes() output; ValueError if the layout does not match"""
+        if len(blob) < _BLOB_HEADER.size:
+            raise ValueError("schedule blob is truncated")
+        magic, little_endian, rows, float_count, flag_count, borrowing_rate = _BLOB_HEADER.unpack_from(blob)
+        if magic != _BLOB_MAGIC or float_count != len(FLOAT_COLUMNS) or flag_count != len(FLAG_COLUMNS):
+            raise ValueError("schedule blob has an unknown layout")
+        if len(blob) != _BLOB_HEADER.size + rows * (8 + 8 * float_count + flag_count):
+            raise ValueError("schedule blob is truncated")
+
+        swap = bool(little_endian) != (sys.byteorder == 'little')
+        frame = cls()
+        frame.borrowing_rate = None if borrowing_rate != borrowing_rate else borrowing_rate
+        offset = _BLOB_HEADER.size
+
+        def read(values: array, width: int) -> None:
+            nonlocal offset
+            values.frombytes(blob[offset:offset + rows * width])
+            if swap and width > 1:
+                values.byteswap()
+            offset += rows * width
+
+        read(frame._ordinals, 8)
+        for name in FLOAT_COLUMNS:
+            read(frame._columns[name], 8)
+        for name in FLAG_COLUMNS:
+            read(frame._flags[name], 1)
+        return frame
+
+    def to_rows(self) -> List[PaymentScheduleRow]:
+        """Materialize PaymentScheduleRow objects"""
+        return [view.to_row() for view in self]
+
+    def to_dicts(self) -> List[dict]:
+        """Rows as dictionaries for JSON serialization"""
+        return [view.to_dict() for view in self]
+
+
+def _float_property(name: str) -> property:
+    def getter(view: 'ScheduleRowView'):
+        value = view._frame._columns[name][view._index]
+        return None if value != value else value
+
+    def setter(view: 'ScheduleRowView', value):
+        _check_writable(view._frame)
+        view._frame._columns[name][view._index] = _NAN if value is None else value
+
+    return property(getter, setter)
+
+
+def _flag_property(name: str) -> property:
+    def getter(view: 'ScheduleRowView') -> bool:
+        return bool(view._frame._flags[name][view._index])
+
+    def setter(view: 'ScheduleRowView', value) -> None:
+        _check_writable(view._frame)
+        view._frame._flags[name][view._index] = 1 if value else 0
+
+    return property(getter, setter)
+
+
+class ScheduleRowView:
+    """
+    Row adapter over a ScheduleFrame
+    Same attributes, payment_date alias and to_dict() as PaymentScheduleRow; writes go to the frame
+    """
+    __slots__ = ('_frame', '_index')
+
+    def __init__(self, frame: ScheduleFrame, index: int):
+        self._frame = frame
+        self._index = index
+
+    @property
+    def date(self) -> date:
+        return self._frame.dates[self._index]
+
+    @date.setter
+    def date(self, value: date) -> None:
+        _check_writable(self._frame)
+        self._frame._ordinals[self._index] = value.toordinal()
+        self._frame._dates = None
+
+    @property
+    def payment_date(self) -> date:
+        """Return date as payment_date for compatibility"""
+        return self.date
+
+    def to_row(self) -> PaymentScheduleRow:
+        """Detached PaymentScheduleRow copy of this row"""
+        values = {name: getattr(self, name) for name in FLOAT_COLUMNS + FLAG_COLUMNS}
+        return PaymentScheduleRow(date=self.date, **values)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'date': self.date.isoformat(),
+            'rental_amount': self.rental_amount,
+            'pv_factor': self.pv_factor,
+            'interest': self.interest,
+            'lease_liability': self.lease_liability,
+            'pv_of_rent': self.pv_of_rent,
+            'rou_asset': self.rou_asset,
+            'depreciation': self.depreciation,
+            'change_in_rou': self.change_in_rou,
+            'security_deposit_pv': self.security_deposit_pv,
+            'aro_gross': self.aro_gross,
+            'aro_interest': self.aro_interest,
+            'aro_provision': self.aro_provision,
+            'principal': self.principal,
+            'remaining_balance': self.remaining_balance,
+        }
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ScheduleRowView):
+            return self._frame is other._frame and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._frame), self._index))
+
+    def __repr__(self) -> str:
+        return f"ScheduleRowView({self._index}, date={self.date.isoformat()})"
+
+
+for _name in FLOAT_COLUMNS:
+    setattr(ScheduleRowView, _name, _float_property(_name))
+for _name in FLAG_COLUMNS:
+    setattr(ScheduleRowView, _name, _flag_property(_name))
+del _name
@@ -0,0 +1,142 @@
+"""
+Schedule Date Index
+Sorted date-ordinal index over a payment schedule for bisect lookups
+
+Schedules produced by generate_complete_schedule are in ascending date order, so
+"row at date X", "last row before X" and "rows in (X, Y]" are answered with
+bisect instead of scanning every row. Activity columns are kept as cumulative
+prefix sums, so the total over any (X, Y] window is two bisects and a subtraction.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from .models import PaymentScheduleRow
+from .schedule_frame import ScheduleFrame
+
+
+def row_date(row) -> Optional[date]:
+    """Column C of a schedule row as a date (accepts payment_date-only rows and datetimes)"""
+    value = getattr(row, 'date', None)
+    if value is None:
+        value = getattr(row, 'payment_date', None)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _activity(value: Callable) -> Callable:
+    """Row value counted in processor period activity (opening rows are skipped)"""
+    return lambda row: 0.0 if row.is_opening else value(row)
+
+
+# Prefix-sum columns available through ScheduleIndex.window_sum()
+PREFIX_COLUMNS: Dict[str, Callable] = {
+    # Accumulated depreciation (VBA Line 583)
+    'abs_depreciation': lambda row: abs(row.depreciation or 0.0),
+    # LeaseProcessor findPL (VBA Lines 440-444), opening rows excluded
+    'activity_depreciation': _activity(lambda row: abs(row.depreciation or 0.0)),
+    'activity_interest': _activity(lambda row: abs(row.interest or 0.0)),
+    'activity_rent': _activity(lambda row: row.rental_amount or 0.0),
+    'activity_change_rou': _activity(lambda row: row.change_in_rou or 0.0),
+    'activity_aro_interest': _activity(lambda row: row.aro_interest or 0.0),
+}
+
+
+class ScheduleIndex:
+    """
+    Bisect index over a schedule sorted by date
+    Positions returned are indexes into `rows` (the schedule as a list)
+    """
+
+    def __init__(self, schedule: Sequence[PaymentScheduleRow]):
+        self.rows: List[PaymentScheduleRow] = list(schedule)
+        if isinstance(schedule, ScheduleFrame):
+            self.ordinals: List[int] = list(schedule.date_ordinals)
+        else:
+            self.ordinals = [row_date(row).toordinal() for row in self.rows]
+        self._prefixes: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def find(self, target: date) -> Optional[int]:
+        """Position of the first row dated exactly target, or None"""
+        ordinal = target.toordinal()
+        pos = bisect_left(self.ordinals, ordinal)
+        if pos < len(self.ordinals) and self.ordinals[pos] == ordinal:
+            return pos
+        return None
+
+    def last_before(self, target: date) -> int:
+        """Position of the last row dated before target (-1 if none)"""
+        return bisect_left(self.ordinals, target.toordinal()) - 1
+
+    def last_at_or_before(self, target: date) -> int:
+        """Position of the last row dated on or before target (-1 if none)"""
+        return bisect_right(self.ordinals, target.toordinal()) - 1
+
+    def first_after(self, target: date) -> int:
+        """Position of the first row dated after target (len(rows) if none)"""
+        return bisect_right(self.ordinals, target.toordinal())
+
+    def between(self, after: date, until: date) -> Tuple[int, int]:
+        """Slice bounds (lo, hi) of rows with after < date <= until"""
+        lo = bisect_right(self.ordinals, after.toordinal())
+        hi = bisect_right(self.ordinals, until.toordinal())
+        return lo, max(lo, hi)
+
+    def prefix(self, name: str) -> List[float]:
+        """Cumulative column: prefix[k] = sum of the column over rows[:k] (built once per name)"""
+        cumulative = self._prefixes.get(name)
+        if cumulative is None:
+            value = PREFIX_COLUMNS[name]
+            cumulative = list(accumulate((value(row) for row in self.rows), initial=0.0))
+            self._prefixes[name] = cumulative
+        return cumulative
+
+    def window_sum(self, name: str, after: date, until: date) -> float:
+        """Sum of a PREFIX_COLUMNS column over rows with after < date <= until"""
+        lo, hi = self.between(after, until)
+        if lo >= hi:
+            return 0.0
+        cumulative = self.prefix(name)
+        return cumulative[hi] - cumulative[lo]
+
+    def security_change(self, lo: int, hi: int) -> float:
+        """
+        Security deposit change over rows[lo:hi] as accumulated by LeaseProcessor (VBA Line 445):
+        each non-opening row adds L(row) - L(previous row), where the row before the window
+        is the last opening row before it (0 if none)
+        """
+        if lo >= hi:
+            return 0.0
+        deltas = self._prefixes.get('_security_delta')
+        if deltas is None:
+            deltas = [0.0, 0.0]
+            total = 0.0
+            prev = (self.rows[0].security_deposit_pv or 0.0) if self.rows else 0.0
+            for row in self.rows[1:]:
+                curr = row.security_deposit_pv or 0.0
+                if not row.is_opening:
+                    total += curr - prev
+                deltas.append(total)
+                prev = curr
+            # Last opening row at or before each position
+            last_opening: List[int] = []
+            current = -1
+            for i, row in enumerate(self.rows):
+                if row.is_opening:
+                    current = i
+                last_opening.append(current)
+            self._prefixes['_security_delta'] = deltas
+            self._last_opening = last_opening
+
+        change = deltas[hi] - deltas[lo + 1]
+        first = self.rows[lo]
+        if lo > 0 and not first.is_opening:
+            opening_pos = self._last_opening[lo - 1]
+            prev = (self.rows[opening_pos].security_deposit_pv or 0.0) if opening_pos >= 0 else 0.0
+            change += (first.security_deposit_pv or 0.0) - prev
+        return change
@@ -11,29 +11,65 @@ VBA Functions:
 """
 
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Iterator
 from ..core.models import LeaseData, PaymentScheduleRow
+from ..core.schedule_frame import ScheduleFrame
 from ..utils.date_utils import eomonth, edate
 from ..utils.finance import present_value
-from ..utils.rfr_rates import get_aro_rate
+from ..utils.rfr_rates import get_aro_rate, get_aro_rates
 from dateutil.relativedelta import relativedelta
+from bisect import bisect_left, bisect_right
+import calendar
+import copy
 import math
 import logging
 
+# Try to import numpy (vectorized basic_calc engine)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow]:
+
+# basic_calc() engines: "scalar" is the row-by-row VBA port, "vectorized" computes the
+# PV factor / interest / liability columns with NumPy (falls back to scalar without NumPy)
+ENGINE_SCALAR = "scalar"
+ENGINE_VECTORIZED = "vectorized"
+CALCULATION_ENGINES = (ENGINE_SCALAR, ENGINE_VECTORIZED)
+
+_calculation_engine = ENGINE_VECTORIZED
+
+
+def set_calculation_engine(engine: str) -> None:
+    """Select the basic_calc() engine used by the schedule generator"""
+    global _calculation_engine
+    if engine not in CALCULATION_ENGINES:
+        raise ValueError(f"Unknown calculation engine '{engine}'. Expected one of: {', '.join(CALCULATION_ENGINES)}")
+    _calculation_engine = engine
+
+
+def get_calculation_engine() -> str:
+    """Return the active basic_calc() engine (scalar when NumPy is unavailable)"""
+    return _calculation_engine if HAS_NUMPY else ENGINE_SCALAR
+
+
+def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> Tuple[List[PaymentScheduleRow], Optional[float]]:
     """
     Generate payment schedule from rental_schedule provided in form.
     Uses the start_date, end_date, rental_count, and amount directly from form
     instead of recalculating dates and amounts.
+    
+    Returns: (schedule, discount rate basic_calc ran at)
     """
     if not lease_data.rental_schedule or not isinstance(lease_data.rental_schedule, list):
-        return []
+        return [], lease_data.borrowing_rate
     
     schedule: List[PaymentScheduleRow] = []
     
-    # Parse rental_schedule entries
+    # Parse rental_schedule entries once
     # Format: [{"start_date": "2025-01-01", "end_date": "2025-12-31", "rental_count": 12, "amount": 50000}, ...]
+    rental_index = _RentalScheduleIndex(lease_data.rental_schedule)
     
     # Start with lease_start_date row (no payment)
     start_row = _create_schedule_row(
@@ -41,6 +77,8 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
         lease_data.lease_start_date, lease_data.end_date, 0, schedule
     )
     schedule.append(start_row)
+    # Rows keyed by date so repeated payment dates update in place
+    rows_by_date: Dict[date, PaymentScheduleRow] = {start_row.date: start_row}
     
     # Track the last payment date from previous entries to continue payment pattern
     # CRITICAL: For subsequent rental entries, payments should continue from the previous entry's pattern,
@@ -52,27 +90,14 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
         if not isinstance(rental_entry, dict):
             continue
             
-        start_date_str = rental_entry.get('start_date')
-        end_date_str = rental_entry.get('end_date')
         rental_count = rental_entry.get('rental_count', 0)
         amount = rental_entry.get('amount', 0.0)
         
-        if not start_date_str or not end_date_str:
-            continue
-        
-        # Parse dates
-        try:
-            if isinstance(start_date_str, str):
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            else:
-                start_date = start_date_str
-                
-            if isinstance(end_date_str, str):
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-            else:
-                end_date = end_date_str
-        except (ValueError, TypeError):
+        # Dates parsed by the rental index (None when missing or invalid)
+        entry_dates = rental_index.entry_dates[entry_idx]
+        if entry_dates is None:
             continue
+        start_date, end_date = entry_dates
         
         if start_date >= end_date or rental_count <= 0:
             continue
@@ -326,34 +351,12 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
                 # Payment date is outside this entry's range - find the correct entry
                 # This can happen when continuing payment pattern beyond entry end_date
                 # Look through all rental entries to find the one that contains this date
-                found_entry = False
-                for check_entry in lease_data.rental_schedule:
-                    if not isinstance(check_entry, dict):
-                        continue
-                    check_start = check_entry.get('start_date')
-                    check_end = check_entry.get('end_date')
-                    check_amount = check_entry.get('amount', 0.0)
-                    
-                    if check_start and check_end:
-                        try:
-                            if isinstance(check_start, str):
-                                check_start_date = datetime.strptime(check_start, '%Y-%m-%d').date()
-                            else:
-                                check_start_date = check_start
-                                
-                            if isinstance(check_end, str):
-                                check_end_date = datetime.strptime(check_end, '%Y-%m-%d').date()
-                            else:
-                                check_end_date = check_end
-                            
-                            # Check if payment_date falls within this entry's range
-                            if check_start_date <= payment_date <= check_end_date:
-                                payment_rental_amount = check_amount
-                                found_entry = True
-                                logger.debug(f"📅 Payment date {payment_date} belongs to entry with range {check_start_date} to {check_end_date}, amount: {payment_rental_amount}")
-                                break
-                        except (ValueError, TypeError):
-                            continue
+                check_idx = rental_index.find(payment_date)
+                found_entry = check_idx is not None
+                if found_entry:
+                    check_start_date, check_end_date = rental_index.entry_dates[check_idx]
+                    payment_rental_amount = rental_index.amounts[check_idx]
+                    logger.debug(f"📅 Payment date {payment_date} belongs to entry with range {check_start_date} to {check_end_date}, amount: {payment_rental_amount}")
                 
                 if not found_entry:
                     # No entry found - use current entry's amount as fallback
@@ -364,13 +367,11 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
                 logger.debug(f"📅 Payment date {payment_date} is within entry {entry_idx} range ({start_date} to {end_date}), amount: {payment_rental_amount}")
             
             # Check if row already exists for this date
-            if any(row.date == payment_date for row in schedule):
+            existing_row = rows_by_date.get(payment_date)
+            if existing_row is not None:
                 # Update existing row with rental amount
-                for row in schedule:
-                    if row.date == payment_date:
-                        row.rental_amount = payment_rental_amount
-                        logger.debug(f"📅 Updated existing row for {payment_date} with amount: {payment_rental_amount}")
-                        break
+                existing_row.rental_amount = payment_rental_amount
+                logger.debug(f"📅 Updated existing row for {payment_date} with amount: {payment_rental_amount}")
             else:
                 # Create new row
                 aro_for_date = _get_aro_for_date(lease_data, payment_date)
@@ -379,6 +380,7 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
                     lease_data.lease_start_date, lease_data.end_date, 0, schedule
                 )
                 schedule.append(row)
+                rows_by_date[payment_date] = row
                 logger.debug(f"📅 Created new row for {payment_date} with amount: {payment_rental_amount}")
         
         # Update last_payment_date to the last payment date in payment_dates (if any were generated)
@@ -395,7 +397,7 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
     schedule.sort(key=lambda x: x.date)
     
     # Apply basic calculations (PV, interest, liability, ROU, depreciation)
-    schedule = _apply_basic_calculations(lease_data, schedule)
+    schedule, borrowing_rate = _apply_basic_calculations(lease_data, schedule)
     
     # Apply Security Deposit Increases
     schedule = _apply_security_deposit_increases(lease_data, schedule)
@@ -406,10 +408,10 @@ def _generate_schedule_from_rental_schedule(lease_data: LeaseData) -> List[Payme
     # Apply Manual Rental Adjustments
     schedule = _apply_manual_rental_adjustments(lease_data, schedule)
     
-    return schedule
+    return schedule, borrowing_rate
 
 
-def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow]:
+def generate_complete_schedule(lease_data: LeaseData) -> ScheduleFrame:
     """
     Generate complete lease payment schedule - FULL VBA datessrent() implementation
     Includes: ARO revisions, Security increases, Manual rentals, Impairments, etc.
@@ -417,9 +419,24 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
     VBA Source: VB script/Code, datessrent() function (Lines 16-249)
     
     If rental_schedule is provided in lease_data, use it directly instead of recalculating.
+    
+    Returns a columnar ScheduleFrame; iterating or indexing it yields row views with
+    the same attributes as PaymentScheduleRow. Its borrowing_rate is the C7 the schedule
+    was calculated at (the GoalSeek result for FV of ROU leases).
+    """
+    rows, borrowing_rate = _generate_schedule_rows(lease_data)
+    frame = ScheduleFrame.from_rows(rows)
+    frame.borrowing_rate = borrowing_rate
+    return frame
+
+
+def _generate_schedule_rows(lease_data: LeaseData) -> Tuple[List[PaymentScheduleRow], Optional[float]]:
+    """
+    Build the schedule as PaymentScheduleRow objects (datessrent + basic_calc)
+    Returns: (schedule, discount rate basic_calc ran at)
     """
     if not lease_data.lease_start_date or not lease_data.end_date:
-        return []
+        return [], lease_data.borrowing_rate
     
     # Always use rental_schedule if provided (rental schedule is the source of truth)
     # When rental_schedule exists, it determines which rental applies to each payment date
@@ -432,10 +449,12 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
     schedule: List[PaymentScheduleRow] = []
     
     # Initialize rental tracking (VBA app_rent, app_rent_date)
-    # CRITICAL: Initialize by calling findrent() first (VBA initializes before loop)
+    # CRITICAL: Initialize with findrent(1) first (VBA initializes before loop)
+    # Escalation steps findrent(1), findrent(2), ... are produced once, in order
+    escalation_steps = _iter_escalation_steps(lease_data)
     rent_no = 1  # Start with 1 for first payment (VBA uses 1-based indexing)
     # For initial lookup, use rent_no=1
-    app_rent, app_rent_date = findrent(lease_data, rent_no)
+    app_rent, app_rent_date = next(escalation_steps)
     # If no escalation, app_rent_date is end_date, so we use rental_1 for all payments starting from first_payment_date
     if app_rent_date == lease_data.end_date and (not lease_data.escalation_percent or lease_data.escalation_percent == 0):
         # No escalation - rental is constant, valid from first payment date
@@ -458,8 +477,7 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
                 lease_data.lease_start_date, enddate, 0, schedule
             )
             schedule.append(row)
-            schedule = _apply_basic_calculations(lease_data, schedule)
-            return schedule
+            return _apply_basic_calculations(lease_data, schedule)
     
     # Payment frequency
     monthof = lease_data.frequency_months
@@ -497,7 +515,7 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
                 else:
                     # VBA Lines 49-51: Increment rent_no and call findrent()
                     rent_no = rent_no + 1
-                    app_rent, app_rent_date = findrent(lease_data, rent_no)
+                    app_rent, app_rent_date = next(escalation_steps, (app_rent, app_rent_date))
             else:
                 # If loop completes without break, no valid rental found
                 first_rental = 0.0
@@ -524,12 +542,13 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
         k += 1
     
     dateo = starto  # Reset for main loop
-    
+
     # === VBA Line 83-236: Main date loop ===
-    for i in range(1, 50001):
+    # VBA walks every calendar day (For i = 1 To 50000); only the event dates can plot a row
+    # or end the loop, so iterate those directly
+    for dateo in _iter_schedule_event_dates(starto, firstpaymentDate, enddate, dayofma1):
         x = 0  # x = 1 means date is plotted
-        dateo = starto + timedelta(days=i)
-        
+
         # VBA Line 88: Finding last day of month
         if dayofm == "Last":
             dayofma = eomonth(dateo, 0).day
@@ -555,7 +574,7 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
                     else:
                         # VBA Lines 102-104: Increment rent_no and call findrent()
                         rent_no = rent_no + 1
-                        app_rent, app_rent_date = findrent(lease_data, rent_no)
+                        app_rent, app_rent_date = next(escalation_steps, (app_rent, app_rent_date))
             
             aro_value = _get_aro_for_date(lease_data, dateo)
             
@@ -622,7 +641,7 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
                         else:
                             # VBA Lines 157-159: Increment rent_no and call findrent()
                             rent_no = rent_no + 1
-                            app_rent, app_rent_date = findrent(lease_data, rent_no)
+                            app_rent, app_rent_date = next(escalation_steps, (app_rent, app_rent_date))
                 
                 # VBA Line 173-181: Find ARO
                 aro_value = _get_aro_for_date(lease_data, dateo)
@@ -661,7 +680,7 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
             break
     
     # === VBA basic_calc() logic ===
-    schedule = _apply_basic_calculations(lease_data, schedule)
+    schedule, borrowing_rate = _apply_basic_calculations(lease_data, schedule)
     
     # === Apply Security Deposit Increases ===
     schedule = _apply_security_deposit_increases(lease_data, schedule)
@@ -672,7 +691,41 @@ def generate_complete_schedule(lease_data: LeaseData) -> List[PaymentScheduleRow
     # === Apply Manual Rental Adjustments ===
     schedule = _apply_manual_rental_adjustments(lease_data, schedule)
     
-    return schedule
+    return schedule, borrowing_rate
+
+
+def _iter_schedule_event_dates(starto: date, firstpaymentDate: date, enddate: date,
+                               dayofma1: int) -> Iterator[date]:
+    """
+    Dates the datessrent() main loop can act on (VBA Lines 83-236)
+
+    The VBA loop visits every day after starto, but a day only plots a row or ends the loop
+    when it is the first payment date, a month-end, a payment day (dayofma1, or 28 in
+    February) or the end date. Those dates are computed per month index instead of scanning
+    days. The two days after the end date are included because a row plotted on the end
+    date skips the end-date exit check and the loop stops on a later day. Days before the
+    first payment date also skip that check, so the loop cannot stop before reaching it.
+    Dates are yielded in ascending order within the VBA bound of 50000 days.
+    """
+    last_day = starto + timedelta(days=50000)
+    stop = max(enddate, starto, firstpaymentDate)
+    after_stop = stop + timedelta(days=2)
+
+    events = {firstpaymentDate, stop, stop + timedelta(days=1), after_stop}
+
+    # Month-index arithmetic: index = year * 12 + (month - 1)
+    for month_index in range(starto.year * 12 + starto.month - 1,
+                             after_stop.year * 12 + after_stop.month):
+        year, month = divmod(month_index, 12)
+        month += 1
+        days_in_month = calendar.monthrange(year, month)[1]
+        for day in (dayofma1, 28, days_in_month):
+            if 1 <= day <= days_in_month:
+                events.add(date(year, month, day))
+
+    for event_date in sorted(events):
+        if starto < event_date <= last_day:
+            yield event_date
 
 
 def findrent(lease_data: LeaseData, app: int) -> Tuple[float, date]:
@@ -682,6 +735,32 @@ def findrent(lease_data: LeaseData, app: int) -> Tuple[float, date]:
     VBA Source: VB script/Code, findrent() Sub (Lines 879-958)
     Calculates rental amount with escalation for payment number 'app'
     """
+    return _findrent_step(lease_data, _findrent_setup(lease_data), app)
+
+
+def _iter_escalation_steps(lease_data: LeaseData) -> Iterator[Tuple[float, date]]:
+    """
+    Yield findrent(lease_data, 1), findrent(lease_data, 2), ... in order
+    
+    The escalation anchor (begind/startd/offse) is resolved once per lease, so each
+    step costs only its own EDate/power evaluation. Stops after rent number 200 (VBA loop bound).
+    """
+    setup = _findrent_setup(lease_data)
+    if setup is None:
+        # No escalation: every rent number maps to (rental_1, end_date)
+        no_escalation = _findrent_step(lease_data, None, 1)
+        for _ in range(200):
+            yield no_escalation
+        return
+    for app in range(1, 201):
+        yield _findrent_step(lease_data, setup, app)
+
+
+def _findrent_setup(lease_data: LeaseData) -> Optional[Tuple[int, float, int, date, date, int]]:
+    """
+    findrent() lines 884-921: escalation anchor independent of the rent number
+    Returns (fre, pre, Frequency_months, begdate, begdate1, offse), or None when no escalation applies
+    """
     # No default - if esc_freq_months is None, escalation is not applicable
     fre = lease_data.esc_freq_months if lease_data.esc_freq_months is not None else 0
     # VBA Line 884: pre = Escalation_percent * 100
@@ -708,9 +787,7 @@ def findrent(lease_data: LeaseData, app: int) -> Tuple[float, date]:
     # VBA Line 889-893: Early exit if no escalation
     # Check if escalation parameters are missing or zero (no escalation applicable)
     if fre == 0 or pre == 0 or Frequency_months == 0 or Escalation_Start is None:
-        app_rent = lease_data.rental_1 or 0.0
-        app_rent_date = lease_data.end_date or date.today()
-        return (app_rent, app_rent_date)
+        return None
     Lease_start_date = lease_data.lease_start_date
     Day_of_Month = lease_data.day_of_month
     
@@ -747,6 +824,18 @@ def findrent(lease_data: LeaseData, app: int) -> Tuple[float, date]:
     # VBA Line 921: offse calculation
     offse = (startd - Escalation_Start).days
     
+    return (fre, pre, Frequency_months, begdate, begdate1, offse)
+
+
+def _findrent_step(lease_data: LeaseData, setup: Optional[Tuple[int, float, int, date, date, int]],
+                   app: int) -> Tuple[float, date]:
+    """findrent() lines 924-956 for rent number 'app', given the _findrent_setup() anchor"""
+    if setup is None:
+        app_rent = lease_data.rental_1 or 0.0
+        app_rent_date = lease_data.end_date or date.today()
+        return (app_rent, app_rent_date)
+    fre, pre, Frequency_months, begdate, begdate1, offse = setup
+    
     # VBA Line 924-925: u and k calculations
     if app % 2 == 1:
         u = app
@@ -831,47 +920,92 @@ def _get_aro_for_date(lease_data: LeaseData, payment_date: date) -> Optional[flo
     return lease_data.aro if (lease_data.aro and lease_data.aro > 0) else None
 
 
-def _get_rental_from_schedule(lease_data: LeaseData, payment_date: date) -> float:
+def _parse_rental_entry_date(value) -> date:
+    """Parse a rental_schedule start/end value (ISO string or date)"""
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    raise TypeError(f"Unsupported rental schedule date: {value!r}")
+
+
+class _RentalScheduleIndex:
+    """
+    rental_schedule compiled once per lease for date-range lookups
+    
+    Entry dates are parsed a single time. The entries' [start_date, end_date] ranges are
+    cut into sorted, non-overlapping segments, each owned by the first entry (in table
+    order) covering it, so find() is a bisect instead of a scan over every entry.
+    """
+
+    def __init__(self, rental_schedule: List[Dict]):
+        # Per entry, aligned with rental_schedule: (start, end) or None if unusable
+        self.entry_dates: List[Optional[Tuple[date, date]]] = []
+        self.amounts: List = []
+        for rental_entry in rental_schedule:
+            parsed = None
+            amount = 0.0
+            if isinstance(rental_entry, dict):
+                amount = rental_entry.get('amount', 0.0)
+                start_value = rental_entry.get('start_date')
+                end_value = rental_entry.get('end_date')
+                if start_value and end_value:
+                    try:
+                        parsed = (_parse_rental_entry_date(start_value), _parse_rental_entry_date(end_value))
+                    except (ValueError, TypeError):
+                        parsed = None
+            self.entry_dates.append(parsed)
+            self.amounts.append(amount)
+        
+        # Segment k covers ordinals [bounds[k], bounds[k + 1])
+        bounds = set()
+        for parsed in self.entry_dates:
+            if parsed and parsed[0] <= parsed[1]:
+                bounds.add(parsed[0].toordinal())
+                bounds.add(parsed[1].toordinal() + 1)
+        self._bounds: List[int] = sorted(bounds)
+        self._owners: List[Optional[int]] = [None] * max(len(self._bounds) - 1, 0)
+        # Paint latest entries first so earlier entries win on overlaps
+        for idx in range(len(self.entry_dates) - 1, -1, -1):
+            parsed = self.entry_dates[idx]
+            if not parsed or parsed[0] > parsed[1]:
+                continue
+            lo = bisect_left(self._bounds, parsed[0].toordinal())
+            hi = bisect_left(self._bounds, parsed[1].toordinal() + 1)
+            for k in range(lo, hi):
+                self._owners[k] = idx
+
+    def find(self, payment_date: date) -> Optional[int]:
+        """Index of the first entry whose date range contains payment_date, or None"""
+        k = bisect_right(self._bounds, payment_date.toordinal()) - 1
+        if 0 <= k < len(self._owners):
+            return self._owners[k]
+        return None
+
+
+def _get_rental_from_schedule(lease_data: LeaseData, payment_date: date,
+                              rental_index: Optional[_RentalScheduleIndex] = None) -> float:
     """
     Get rental amount from rental_schedule table for a given payment date.
     VBA logic: When AutoRental = "NO" or no escalation, use rental table to determine
     which rental is effective for each payment date based on date ranges.
     
     Returns the rental amount from the rental_schedule entry whose date range contains the payment_date.
+    Pass a prebuilt rental_index when looking up many dates for the same lease.
     """
     if not lease_data.rental_schedule or not isinstance(lease_data.rental_schedule, list):
         return lease_data.rental_1 or 0.0
     
+    if rental_index is None:
+        rental_index = _RentalScheduleIndex(lease_data.rental_schedule)
+    
     # Find the rental schedule entry whose date range contains payment_date
-    # Check entries in order (earlier entries first)
-    for rental_entry in lease_data.rental_schedule:
-        if not isinstance(rental_entry, dict):
-            continue
-        
-        start_date_str = rental_entry.get('start_date')
-        end_date_str = rental_entry.get('end_date')
-        amount = rental_entry.get('amount', 0.0)
-        
-        if not start_date_str or not end_date_str:
-            continue
-        
-        # Parse dates
-        try:
-            if isinstance(start_date_str, str):
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            else:
-                start_date = start_date_str
-                
-            if isinstance(end_date_str, str):
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-            else:
-                end_date = end_date_str
-        except (ValueError, TypeError):
-            continue
-        
-        # Check if payment_date falls within this rental entry's date range
-        if start_date <= payment_date <= end_date:
-            return float(amount) if amount else 0.0
+    entry_idx = rental_index.find(payment_date)
+    if entry_idx is not None:
+        amount = rental_index.amounts[entry_idx]
+        return float(amount) if amount else 0.0
     
     # If no rental schedule entry matches, return default rental_1
     return lease_data.rental_1 or 0.0
@@ -927,7 +1061,51 @@ def _create_schedule_row(lease_data: LeaseData, payment_date: date, rental_amoun
     )
 
 
-def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentScheduleRow]) -> List[PaymentScheduleRow]:
+def _get_icompound(lease_data: LeaseData) -> int:
+    """
+    Interest compounding period in months (VBA icompound, Line 634)
+    Only use compound_months if explicitly provided and valid, otherwise derive from frequency
+    """
+    freq = lease_data.frequency_months or 1
+    if lease_data.compound_months and lease_data.compound_months > 0:
+        # Validate that compound_months matches frequency_months
+        # If mismatch, derive from frequency_months instead
+        if lease_data.compound_months == freq:
+            return lease_data.compound_months
+    # No (or mismatched) compound_months: derive from frequency: 1=monthly, 3=quarterly, 6=semi-annually, 12=annually
+    if freq == 3:
+        return 3  # Quarterly
+    elif freq == 6:
+        return 6  # Semi-annually
+    elif freq >= 12:
+        return 12  # Annually
+    else:
+        return 1  # Monthly
+
+
+def _apply_basic_calculations(lease_data: LeaseData,
+                              schedule: List[PaymentScheduleRow]) -> Tuple[List[PaymentScheduleRow], Optional[float]]:
+    """
+    VBA basic_calc() function implementation
+    Dispatches to the vectorized or scalar engine (see set_calculation_engine)
+    
+    With FV of ROU, VBA Line 685 GoalSeeks C7 (discount rate) so that G(endrow) = 0;
+    the solved rate is found first and both engines run at that rate.
+    
+    Returns: (schedule, C7 the schedule was calculated at)
+    """
+    if schedule and lease_data.fv_of_rou and lease_data.fv_of_rou != 0:
+        solved_rate = _goal_seek_fv_rate(lease_data, schedule)
+        if solved_rate is not None:
+            lease_data = copy.copy(lease_data)
+            lease_data.borrowing_rate = solved_rate
+    
+    if _calculation_engine == ENGINE_VECTORIZED and HAS_NUMPY:
+        return _apply_basic_calculations_vectorized(lease_data, schedule), lease_data.borrowing_rate
+    return _apply_basic_calculations_scalar(lease_data, schedule), lease_data.borrowing_rate
+
+
+def _apply_basic_calculations_scalar(lease_data: LeaseData, schedule: List[PaymentScheduleRow]) -> List[PaymentScheduleRow]:
     """
     VBA basic_calc() function implementation
     Calculates PV factors, interest, liability, ROU asset, depreciation for each row
@@ -952,33 +1130,7 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
     secdeprate = raw_secdeprate / 100 if raw_secdeprate > 1 else raw_secdeprate
     
     # icompound: derive from frequency_months (compound frequency should match payment frequency)
-    # Only use compound_months if explicitly provided and valid, otherwise derive from frequency
-    freq = lease_data.frequency_months or 1
-    if lease_data.compound_months and lease_data.compound_months > 0:
-        # Validate that compound_months matches frequency_months
-        # If mismatch, derive from frequency_months instead
-        if lease_data.compound_months == freq:
-            icompound = lease_data.compound_months
-        else:
-            # Mismatch: derive from frequency instead
-            if freq == 3:
-                icompound = 3  # Quarterly
-            elif freq == 6:
-                icompound = 6  # Semi-annually
-            elif freq >= 12:
-                icompound = 12  # Annually
-            else:
-                icompound = 1  # Monthly
-    else:
-        # No compound_months provided, derive from frequency: 1=monthly, 3=quarterly, 6=semi-annually, 12=annually
-        if freq == 3:
-            icompound = 3  # Quarterly
-        elif freq == 6:
-            icompound = 6  # Semi-annually
-        elif freq >= 12:
-            icompound = 12  # Annually
-        else:
-            icompound = 1  # Monthly
+    icompound = _get_icompound(lease_data)
     
     # VBA Line 636-638: Initialize first row
     schedule[0].pv_factor = 1.0
@@ -1011,6 +1163,13 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
     # VBA Line 647-659: End of life calculation
     endoflife = _calculate_end_of_life_vba(lease_data, schedule[-1].date)
     
+    # US-GAAP operating depreciation needs SUM(F10:$F$endrow); rows after the current one
+    # still hold their incoming interest during this pass
+    interest_suffix = _interest_suffix_sums(schedule) if _is_usgaap_operating(lease_data) else None
+    
+    # Columns M and O (ARO gross and provision) for all rows up front
+    aro_provisions = _aro_provision_column(lease_data, schedule, endrow)
+    
     # VBA Line 661-664: PV factor, Interest, Liability, PV of Rent formulas for rows 10+
     for i in range(1, endrow):
         prev_row = schedule[i - 1]
@@ -1038,15 +1197,8 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
         # J10 = Depreciation (calculated below)
         # K10 = O10 - N10 - O9 - Change in ROU
         
-        # Get ARO for this date (may be revised)
-        current_aro_gross = _get_aro_for_date(lease_data, curr_row.date) or 0.0
-        if current_aro_gross:
-            curr_row.aro_gross = current_aro_gross
-        
-        # Calculate ARO provision first
-        curr_row.aro_provision = _calculate_aro_provision_vba(
-            lease_data, curr_row.aro_gross or 0.0, curr_row.date, schedule[-1].date, lease_data.aro_table
-        )
+        # ARO gross (may be revised) and provision from the precomputed columns
+        curr_row.aro_provision = aro_provisions[i]
         
         prev_aro_prov = prev_row.aro_provision or 0.0
         curr_aro_prov = curr_row.aro_provision or 0.0
@@ -1062,7 +1214,8 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
         
         # J10 = Depreciation (VBA Lines 667-674)
         curr_row.depreciation = _calculate_depreciation_vba(
-            lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule
+            lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule,
+            _future_interest_sum(curr_row, interest_suffix, i)
         )
         
         # I10 = ROU Asset
@@ -1091,16 +1244,9 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
         curr_row.principal = curr_row.rental_amount - curr_row.interest
         curr_row.remaining_balance = curr_row.lease_liability
     
-    # VBA Lines 683-689: Handle FV of ROU or recalculate G7
-    if lease_data.fv_of_rou and lease_data.fv_of_rou != 0:
-        # VBA Line 685: GoalSeek - adjust C7 (discount rate) to make G(endrow) = 0
-        # This is an iterative process - simplified here
-        # Would need to adjust borrowing_rate until sum of PV of rents matches fv_of_rou
-        total_pv_rent = sum(row.pv_of_rent for row in schedule)
-        if abs(total_pv_rent - lease_data.fv_of_rou) > 0.01:
-            # Adjust discount rate (simplified - would iterate)
-            pass
-    else:
+    # VBA Lines 683-689: recalculate G7 unless FV of ROU is given (VBA Line 685: the GoalSeek
+    # on C7 in _apply_basic_calculations already started the first pass from G7 = FV of ROU)
+    if not (lease_data.fv_of_rou and lease_data.fv_of_rou != 0):
         # VBA Line 688: G7 = SUM(H9:Hendrow) - Initial liability = sum of all PV of rents
         # This must be calculated AFTER all PV factors and PV of rents are set
         # CRITICAL: Only include payments on or before the lease end date
@@ -1112,6 +1258,9 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
         # Recalculate ROU asset with correct initial liability
         schedule[0].rou_asset = _calculate_initial_rou(lease_data, total_pv_rent, ide)
         
+        # Rows after the current one hold first-pass interest while recalculating
+        interest_suffix = _interest_suffix_sums(schedule) if _is_usgaap_operating(lease_data) else None
+        
         # Now we need to recalculate the entire schedule with the correct initial liability
         # Recalculate Interest, Liability, and ROU for all rows
         for i in range(1, endrow):
@@ -1131,7 +1280,175 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
             
             # Update ROU asset
             curr_row.depreciation = _calculate_depreciation_vba(
-                lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule
+                lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule,
+                _future_interest_sum(curr_row, interest_suffix, i)
+            )
+            curr_row.rou_asset = prev_row.rou_asset - curr_row.depreciation + curr_row.change_in_rou
+    
+    # VBA Line 695-705: Transition Option 2B handling
+    if lease_data.transition_option == "2B" and lease_data.transition_date:
+        transitiondate = lease_data.transition_date - timedelta(days=1)
+        
+        for row in schedule:
+            if row.date == transitiondate:
+                # VBA Line 701: Set ROU = Liability + Prepaid_accrual
+                prepaid = lease_data.prepaid_accrual or 0.0
+                row.rou_asset = row.lease_liability + prepaid
+                break
+    
+    return schedule
+
+
+def _apply_basic_calculations_vectorized(lease_data: LeaseData, schedule: List[PaymentScheduleRow]) -> List[PaymentScheduleRow]:
+    """
+    VBA basic_calc() function - vectorized engine
+    Produces the same columns as _apply_basic_calculations_scalar:
+      - E column (PV factor) from one array expression over day offsets from C9
+      - G7 (initial liability) as a dot product of rentals and PV factors
+      - F/G columns (interest, liability) from the closed form of G10 = G9 - D10 + F10:
+        G(i) = (G7 - SUM(H10:Hi)) / E(i), so both liability passes are cumulative sums
+    ROU, depreciation and ARO columns are still filled row by row.
+    """
+    if not schedule:
+        return schedule
+    
+    if lease_data.borrowing_rate is None:
+        raise ValueError("borrowing_rate is required but was not provided in the lease data")
+    
+    endrow = len(schedule)
+    
+    # Day offsets from C9 - the closed form needs strictly increasing dates
+    start_ordinal = schedule[0].date.toordinal()
+    days_from_start = np.fromiter((row.date.toordinal() for row in schedule), dtype=np.int64, count=endrow) - start_ordinal
+    days_between = np.diff(days_from_start)
+    if np.any(days_between <= 0):
+        return _apply_basic_calculations_scalar(lease_data, schedule)
+    
+    # VBA Line 631: ide calculation
+    ide = (lease_data.initial_direct_expenditure or 0) - (lease_data.lease_incentive or 0)
+    
+    # VBA Line 633-634: secdeprate and icompound
+    raw_secdeprate = lease_data.security_discount or 0.0
+    secdeprate = raw_secdeprate / 100 if raw_secdeprate > 1 else raw_secdeprate
+    icompound = _get_icompound(lease_data)
+    discount_rate = lease_data.borrowing_rate / 100
+    compound_base = 1 + discount_rate * icompound / 12
+    
+    rentals = np.fromiter((row.rental_amount for row in schedule), dtype=np.float64, count=endrow)
+    
+    # E10 = 1/((1+r)^n) - PV factor column, E9 = 1
+    pv_factors = 1 / (compound_base ** ((days_from_start / 365) * 12 / icompound))
+    pv_factors[0] = 1.0
+    pv_of_rent = pv_factors * rentals
+    
+    # Per-row growth of the liability: (1+r)^n - 1 over days_between
+    interest_rates = compound_base ** ((days_between / 365) * 12 / icompound) - 1
+    
+    # Cumulative PV of rents paid after C9 (H10:Hi)
+    paid_pv = pv_of_rent.copy()
+    paid_pv[0] = 0.0
+    paid_pv = np.cumsum(paid_pv)
+    
+    def liability_columns(opening_liability: float):
+        liability = (opening_liability - paid_pv) / pv_factors
+        liability[0] = opening_liability
+        interest = np.zeros(endrow)
+        interest[1:] = liability[:-1] * interest_rates
+        return liability, interest
+    
+    # VBA Line 636-638: Initialize first row
+    schedule[0].pv_factor = 1.0
+    schedule[0].aro_gross = schedule[0].aro_gross or lease_data.aro or 0.0
+    schedule[0].interest = 0.0
+    schedule[0].depreciation = 0.0
+    schedule[0].aro_interest = 0.0
+    
+    # First pass uses the provisional initial liability (payments after C9 only)
+    provisional_mask = (rentals > 0) & (days_from_start > 0)
+    provisional_mask[0] = False
+    initial_liability = float(np.dot(rentals[provisional_mask], pv_factors[provisional_mask]))
+    if not provisional_mask.any() and endrow > 1:
+        logger = logging.getLogger(__name__)
+        logger.warning(f"⚠️  _calculate_initial_liability: No rental payments found in {endrow} rows. rental_1={lease_data.rental_1}")
+    initial_rou = _calculate_initial_rou(lease_data, initial_liability, ide)
+    liability_1, interest_1 = liability_columns(initial_liability)
+    
+    schedule[0].lease_liability = initial_liability
+    schedule[0].rou_asset = initial_rou
+    schedule[0].security_deposit_pv = _calculate_security_pv(lease_data, schedule[0].date, schedule[-1].date, secdeprate, schedule[0].date, None)
+    schedule[0].pv_of_rent = schedule[0].pv_factor * schedule[0].rental_amount
+    
+    # VBA Line 647-659: End of life calculation
+    endoflife = _calculate_end_of_life_vba(lease_data, schedule[-1].date)
+    
+    # L10 = L9 * PV_factor_C9 / PV_factor_C10, which telescopes to L9 / PV_factor_C10
+    if secdeprate > 0 and lease_data.security_deposit and lease_data.security_deposit > 0:
+        security_pv = schedule[0].security_deposit_pv * (1 + secdeprate / 12) ** ((days_from_start / 365) * 12)
+    else:
+        security_pv = np.zeros(endrow)
+    
+    fv_of_rou = bool(lease_data.fv_of_rou and lease_data.fv_of_rou != 0)
+    interest_suffix = _interest_suffix_sums(schedule) if _is_usgaap_operating(lease_data) else None
+    aro_provisions = _aro_provision_column(lease_data, schedule, endrow)
+    
+    for i in range(1, endrow):
+        prev_row = schedule[i - 1]
+        curr_row = schedule[i]
+        
+        curr_row.pv_factor = float(pv_factors[i])
+        curr_row.interest = float(interest_1[i])
+        curr_row.lease_liability = float(liability_1[i])
+        curr_row.pv_of_rent = float(pv_of_rent[i])
+        
+        curr_row.aro_provision = aro_provisions[i]
+        
+        prev_aro_prov = prev_row.aro_provision or 0.0
+        curr_aro_prov = curr_row.aro_provision or 0.0
+        
+        # N10 = ARO Interest, K10 = Change in ROU (VBA Line 676: =O10-N10-O9)
+        curr_row.aro_interest = curr_aro_prov - prev_aro_prov if curr_aro_prov is not None else 0.0
+        if curr_aro_prov is not None:
+            curr_row.change_in_rou = curr_aro_prov - curr_row.aro_interest - prev_aro_prov
+        else:
+            curr_row.change_in_rou = 0.0
+        
+        # Depreciation and ROU from the first pass are final only when G7 is not recalculated
+        if fv_of_rou:
+            curr_row.depreciation = _calculate_depreciation_vba(
+                lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule,
+                _future_interest_sum(curr_row, interest_suffix, i)
+            )
+            curr_row.rou_asset = prev_row.rou_asset - curr_row.depreciation + curr_row.change_in_rou
+        
+        curr_row.security_deposit_pv = float(security_pv[i])
+        
+        # Principal and remaining balance keep their first-pass values (as in the scalar engine)
+        curr_row.principal = curr_row.rental_amount - curr_row.interest
+        curr_row.remaining_balance = curr_row.lease_liability
+    
+    # VBA Lines 683-689: Handle FV of ROU or recalculate G7
+    if not fv_of_rou:
+        # VBA Line 688: G7 = SUM(H9:Hendrow) - only payments on or before the lease end date
+        if lease_data.end_date:
+            end_ordinal = lease_data.end_date.toordinal() - start_ordinal
+            total_pv_rent = float(pv_of_rent[days_from_start <= end_ordinal].sum())
+        else:
+            total_pv_rent = float(pv_of_rent.sum())
+        
+        schedule[0].lease_liability = total_pv_rent
+        schedule[0].rou_asset = _calculate_initial_rou(lease_data, total_pv_rent, ide)
+        
+        liability_2, interest_2 = liability_columns(total_pv_rent)
+        interest_suffix = _interest_suffix_sums(schedule) if _is_usgaap_operating(lease_data) else None
+        
+        for i in range(1, endrow):
+            prev_row = schedule[i - 1]
+            curr_row = schedule[i]
+            curr_row.interest = float(interest_2[i])
+            curr_row.lease_liability = float(liability_2[i])
+            curr_row.depreciation = _calculate_depreciation_vba(
+                lease_data, prev_row, curr_row, endoflife, discount_rate, icompound, schedule,
+                _future_interest_sum(curr_row, interest_suffix, i)
             )
             curr_row.rou_asset = prev_row.rou_asset - curr_row.depreciation + curr_row.change_in_rou
     
@@ -1149,6 +1466,70 @@ def _apply_basic_calculations(lease_data: LeaseData, schedule: List[PaymentSched
     return schedule
 
 
+def _goal_seek_fv_rate(lease_data: LeaseData, schedule: List[PaymentScheduleRow],
+                       tolerance: float = 1e-9, max_iterations: int = 100) -> Optional[float]:
+    """
+    VBA Line 685 GoalSeek: discount rate (C7, in percent) at which the PV of the rentals
+    equals the FV of ROU, i.e. G(endrow) = 0 when G7 = FV of ROU
+    
+    Solves SUM(D * (1 + x)^-n) = FV for x = rate * icompound / 12, with
+    n = ((C - C9) / 365) * 12 / icompound precomputed once. Newton steps on the
+    convex, decreasing NPV, falling back to bisection whenever a step leaves the
+    bracket. Returns None when no positive-rent root exists (rate left unchanged).
+    """
+    fv = lease_data.fv_of_rou
+    icompound = _get_icompound(lease_data)
+    start_date = schedule[0].date
+    
+    rents: List[float] = []
+    exponents: List[float] = []
+    for row in schedule[1:]:
+        if row.rental_amount:
+            rents.append(row.rental_amount)
+            exponents.append(((row.date - start_date).days / 365) * 12 / icompound)
+    if fv <= 0 or not rents or sum(rents) <= fv or min(rents) < 0:
+        logger = logging.getLogger(__name__)
+        logger.warning(f"⚠️  FV of ROU goal seek skipped: no rate gives PV of rents = {fv}")
+        return None
+    
+    if HAS_NUMPY:
+        rent_arr = np.array(rents, dtype=float)
+        exp_arr = np.array(exponents, dtype=float)
+        
+        def npv_and_slope(x: float) -> Tuple[float, float]:
+            discounted = rent_arr * (1 + x) ** -exp_arr
+            return float(discounted.sum()) - fv, float(-(discounted * exp_arr).sum()) / (1 + x)
+    else:
+        def npv_and_slope(x: float) -> Tuple[float, float]:
+            discounted = [d * (1 + x) ** -n for d, n in zip(rents, exponents)]
+            return sum(discounted) - fv, -sum(v * n for v, n in zip(discounted, exponents)) / (1 + x)
+    
+    # Bracket: NPV(lo) > FV > NPV(hi); NPV(0) = SUM(D) > FV
+    lo, hi = 0.0, 0.01
+    value_hi, _ = npv_and_slope(hi)
+    while value_hi > 0:
+        lo, hi = hi, hi * 2
+        if hi > 1e6:
+            return None
+        value_hi, _ = npv_and_slope(hi)
+    
+    x = (lo + hi) / 2
+    for _ in range(max_iterations):
+        value, slope = npv_and_slope(x)
+        if abs(value) <= tolerance * fv:
+            break
+        if value > 0:
+            lo = x
+        else:
+            hi = x
+        step = x - value / slope if slope else None
+        x = step if step is not None and lo < step < hi else (lo + hi) / 2
+        if hi - lo <= 1e-15:
+            break
+    
+    return x * 12 / icompound * 100
+
+
 def _calculate_initial_liability(lease_data: LeaseData, schedule: List[PaymentScheduleRow]) -> float:
     """Calculate initial lease liability as sum of PV of all payments"""
     if not schedule:
@@ -1158,33 +1539,7 @@ def _calculate_initial_liability(lease_data: LeaseData, schedule: List[PaymentSc
         raise ValueError("borrowing_rate is required but was not provided in the lease data")
     discount_rate = lease_data.borrowing_rate / 100
     # icompound: derive from frequency_months (compound frequency should match payment frequency)
-    # Only use compound_months if explicitly provided and valid, otherwise derive from frequency
-    freq = lease_data.frequency_months or 1
-    if lease_data.compound_months and lease_data.compound_months > 0:
-        # Validate that compound_months matches frequency_months
-        # If mismatch, derive from frequency_months instead
-        if lease_data.compound_months == freq:
-            icompound = lease_data.compound_months
-        else:
-            # Mismatch: derive from frequency instead
-            if freq == 3:
-                icompound = 3  # Quarterly
-            elif freq == 6:
-                icompound = 6  # Semi-annually
-            elif freq >= 12:
-                icompound = 12  # Annually
-            else:
-                icompound = 1  # Monthly
-    else:
-        # No compound_months provided, derive from frequency: 1=monthly, 3=quarterly, 6=semi-annually, 12=annually
-        if freq == 3:
-            icompound = 3  # Quarterly
-        elif freq == 6:
-            icompound = 6  # Semi-annually
-        elif freq >= 12:
-            icompound = 12  # Annually
-        else:
-            icompound = 1  # Monthly
+    icompound = _get_icompound(lease_data)
     start_date = schedule[0].date
     
     total_pv = 0.0
@@ -1274,25 +1629,102 @@ def _calculate_aro_provision_vba(lease_data: LeaseData, aro_gross: float, curren
     return aro_gross * pv_factor
 
 
+def _aro_provision_column(lease_data: LeaseData, schedule: List[PaymentScheduleRow],
+                          endrow: int) -> List[Optional[float]]:
+    """
+    ARO gross (column M) and provision (column O) for rows 1..endrow-1 in one pass
+    Sets aro_gross on the rows and returns provisions indexed like the schedule (row 0 unused).
+    Rates come from one batched RFR lookup; discounting is vectorized when NumPy is active.
+    """
+    provisions: List[Optional[float]] = [None] * endrow
+    if endrow <= 1:
+        return provisions
+    
+    # Get ARO for each date (may be revised)
+    for curr_row in schedule[1:endrow]:
+        current_aro_gross = _get_aro_for_date(lease_data, curr_row.date) or 0.0
+        if current_aro_gross:
+            curr_row.aro_gross = current_aro_gross
+    
+    table = lease_data.aro_table
+    if table <= 0:
+        return provisions
+    
+    end_date = schedule[-1].date
+    rows = [(i, schedule[i]) for i in range(1, endrow) if (schedule[i].aro_gross or 0.0) > 0]
+    if not rows:
+        return provisions
+    rates = get_aro_rates([row.date for _, row in rows], table)
+    
+    if get_calculation_engine() == ENGINE_VECTORIZED:
+        gross = np.array([row.aro_gross for _, row in rows], dtype=float)
+        rate_arr = np.array(rates, dtype=float)
+        days_remaining = np.array([(end_date - row.date).days for _, row in rows], dtype=float)
+        discount = rate_arr > 0
+        discount &= days_remaining > 0
+        values = gross.copy()
+        values[discount] = gross[discount] / (
+            (1 + rate_arr[discount] / 12) ** ((days_remaining[discount] / 365) * 12))
+        for (i, _), value in zip(rows, values.tolist()):
+            provisions[i] = value
+        return provisions
+    
+    # VBA Lines 679-680, row by row
+    for (i, row), aro_rate in zip(rows, rates):
+        aro_gross = row.aro_gross
+        days_remaining = (end_date - row.date).days
+        if aro_rate <= 0 or days_remaining <= 0:
+            provisions[i] = aro_gross
+        else:
+            provisions[i] = aro_gross * (1 / ((1 + aro_rate / 12) ** ((days_remaining / 365) * 12)))
+    return provisions
+
+
+def _is_usgaap_operating(lease_data: LeaseData) -> bool:
+    """US-GAAP operating lease - uses the straight-line cost depreciation formula (VBA Lines 670-671)"""
+    return getattr(lease_data, 'gaap_standard', 'IFRS') == "US-GAAP" and lease_data.finance_lease_usgaap != "Yes"
+
+
+def _interest_suffix_sums(schedule: List[PaymentScheduleRow]) -> List[float]:
+    """
+    Suffix sums of abs(interest): result[i] = SUM(ABS(F(i):F(endrow))), result[len] = 0
+    Lets each row read Sum(F10:$F$endrow) in O(1) instead of rescanning the schedule
+    """
+    suffix = [0.0] * (len(schedule) + 1)
+    for i in range(len(schedule) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + abs(schedule[i].interest or 0.0)
+    return suffix
+
+
+def _future_interest_sum(curr_row: PaymentScheduleRow, interest_suffix: Optional[List[float]],
+                         row_index: int) -> Optional[float]:
+    """Sum(F10:$F$endrow) for curr_row: its current interest plus the precomputed later rows"""
+    if interest_suffix is None:
+        return None
+    return abs(curr_row.interest or 0.0) + interest_suffix[row_index + 1]
+
+
 def _calculate_depreciation_vba(lease_data: LeaseData, prev_row: PaymentScheduleRow,
                                 curr_row: PaymentScheduleRow, endoflife: date,
                                 discount_rate: float, icompound: int, 
-                                schedule: List[PaymentScheduleRow] = None) -> float:
+                                schedule: List[PaymentScheduleRow] = None,
+                                future_interest_sum: Optional[float] = None) -> float:
     """
     Calculate Depreciation (VBA Lines 667-674)
     US-GAAP vs IFRS/Ind-AS differences
     
     US-GAAP Operating Lease (Line 670-671): Complex formula
     IFRS/Ind-AS (Line 673): Simple straight-line
-    """
-    gaap_standard = getattr(lease_data, 'gaap_standard', 'IFRS')
     
+    future_interest_sum: precomputed Sum(F10:$F$endrow) (see _interest_suffix_sums);
+    when omitted it is summed from schedule
+    """
     # US-GAAP Operating Lease (VBA Lines 670-671)
-    if gaap_standard == "US-GAAP" and lease_data.finance_lease_usgaap != "Yes":
+    if _is_usgaap_operating(lease_data):
         # Full formula: MIN(MAX((I9+Sum(F10:$F$endrow))*(DAYS(C10,C9-1)/DAY(EOMONTH(C10,0)))/
         #    ((YEAR($J$6+1)-YEAR(C9))*12+MONTH($J$6+1)-MONTH(C9)+((DAY($J$6+1)-DAY(C9))/DAY(EOMONTH(C9,0)))))-F10,0),I9),0)
         
-        if not schedule:
+        if not schedule and future_interest_sum is None:
             # Fallback to simplified
             total_days = (endoflife - prev_row.date).days
             if total_days <= 0:
@@ -1301,22 +1733,23 @@ def _calculate_depreciation_vba(lease_data: LeaseData, prev_row: PaymentSchedule
             return max(0.0, min(prev_row.rou_asset * days_diff / total_days, prev_row.rou_asset))
         
         # Calculate Sum(F10:$F$endrow) - sum of future interest from this row onwards
-        future_interest_sum = 0.0
-        curr_idx = schedule.index(curr_row) if curr_row in schedule else len(schedule)
-        for i in range(curr_idx, len(schedule)):
-            future_interest_sum += abs(schedule[i].interest or 0.0)
+        if future_interest_sum is None:
+            future_interest_sum = 0.0
+            curr_idx = schedule.index(curr_row) if curr_row in schedule else len(schedule)
+            for i in range(curr_idx, len(schedule)):
+                future_interest_sum += abs(schedule[i].interest or 0.0)
         
         # Days calculation: DAYS(C10,C9-1)
         days_in_period = (curr_row.date - (prev_row.date - timedelta(days=1))).days
         
         # DAY(EOMONTH(C10,0)) - days in current month
-        days_in_curr_month = eomonth(curr_row.date, 0).day
+        days_in_curr_month = calendar.monthrange(curr_row.date.year, curr_row.date.month)[1]
         
         # Calculate remaining period denominator
         # ((YEAR($J$6+1)-YEAR(C9))*12+MONTH($J$6+1)-MONTH(C9)+((DAY($J$6+1)-DAY(C9))/DAY(EOMONTH(C9,0))))
         end_life_plus_one = endoflife + timedelta(days=1)
         months_diff = (end_life_plus_one.year - prev_row.date.year) * 12 + (end_life_plus_one.month - prev_row.date.month)
-        days_in_prev_month = eomonth(prev_row.date, 0).day
+        days_in_prev_month = calendar.monthrange(prev_row.date.year, prev_row.date.month)[1]
         day_adjustment = (end_life_plus_one.day - prev_row.date.day) / days_in_prev_month
         remaining_period_months = months_diff + day_adjustment
         
@@ -0,0 +1,190 @@
+"""
+Schedule Cache
+Bounded LRU of generated schedules keyed on a hash of the schedule-relevant LeaseData fields
+
+calculate_lease and LeaseProcessor both go through get_cached_schedule(), so a
+request (or a repeat calculation of an unchanged lease) generates each schedule once.
+Cached schedules are shared, so they are frozen: writes through their row views
+raise TypeError and callers that need to edit a schedule take a copy().
+
+An optional ScheduleStore backs the LRU for persisted leases: on a miss the
+materialized schedule is loaded by (lease_id, key) before falling back to generation,
+and newly generated schedules are saved to it.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Dict, Optional
+import hashlib
+import json
+import threading
+
+from ..core.models import LeaseData
+from ..core.schedule_frame import ScheduleFrame
+from ..utils.rfr_rates import get_rfr_table_version
+from .generator_vba_complete import generate_complete_schedule, get_calculation_engine
+
+
+# LeaseData attributes read by generate_complete_schedule (datessrent + basic_calc)
+SCHEDULE_FIELDS = (
+    'lease_start_date', 'first_payment_date', 'end_date', 'transition_date', 'transition_option',
+    'frequency_months', 'day_of_month', 'accrual_day',
+    'manual_adj', 'rental_1', 'rental_2', 'rental_dates', 'rental_schedule', 'rental_amounts_by_date',
+    'escalation_start', 'escalation_start_date', 'escalation_percent', 'esc_freq_months',
+    'borrowing_rate', 'compound_months', 'fv_of_rou',
+    'bargain_purchase', 'purchase_option_price', 'title_transfer', 'useful_life',
+    'security_deposit', 'security_discount', 'security_dates',
+    'increase_security_1', 'increase_security_2', 'increase_security_3', 'increase_security_4',
+    'aro', 'aro_table', 'aro_revisions', 'aro_dates',
+    'initial_direct_expenditure', 'prepaid_accrual', 'lease_incentive',
+    'sublease', 'sublease_rou',
+    'impairment1', 'impairment2', 'impairment3', 'impairment4', 'impairment5', 'impairment_dates',
+    'finance_lease_usgaap', 'gaap_standard',
+)
+
+DEFAULT_CACHE_SIZE = 256
+
+
+def _canonical(value):
+    """JSON encoder fallback for dates and decimals"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return repr(value)
+
+
+def schedule_cache_key(lease_data: LeaseData) -> str:
+    """
+    Canonical hash of everything that determines the generated schedule:
+    the schedule fields, the calculation engine and the RFR table version
+    """
+    payload = {name: getattr(lease_data, name, None) for name in SCHEDULE_FIELDS}
+    payload['_engine'] = get_calculation_engine()
+    payload['_rfr_version'] = get_rfr_table_version()
+    encoded = json.dumps(payload, sort_keys=True, default=_canonical, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ScheduleStore:
+    """
+    Persistent schedule storage consulted on cache misses (see configure_schedule_cache)
+    Implementations must not raise: failures are reported as a miss
+    """
+
+    def load(self, lease_id: int, key: str) -> Optional[ScheduleFrame]:
+        """Materialized schedule of lease_id if it was stored for this key"""
+        return None
+
+    def save(self, lease_id: int, key: str, schedule: ScheduleFrame) -> None:
+        """Materialize the schedule of lease_id for this key"""
+
+
+class ScheduleCache:
+    """Thread-safe LRU of ScheduleFrame objects with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, store: Optional[ScheduleStore] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self._entries: 'OrderedDict[str, ScheduleFrame]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.store_hits = 0
+
+    def get_or_generate(self, lease_data: LeaseData,
+                        generate: Callable[[LeaseData], ScheduleFrame] = generate_complete_schedule) -> ScheduleFrame:
+        """
+        Return the cached schedule for lease_data, generating and storing it on a miss
+        The returned frame is frozen whenever it is (or may be) shared
+        """
+        use_store = self.store is not None and lease_data.persisted and bool(lease_data.auto_id)
+        if self.maxsize <= 0 and not use_store:
+            return generate(lease_data)
+
+        key = schedule_cache_key(lease_data)
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return schedule
+            self.misses += 1
+
+        # Load or generate outside the lock; a concurrent miss on the same key just does the work twice
+        schedule = self.store.load(lease_data.auto_id, key) if use_store else None
+        if schedule is not None:
+            with self._lock:
+                self.store_hits += 1
+        else:
+            schedule = generate(lease_data)
+            if use_store:
+                self.store.save(lease_data.auto_id, key, schedule)
+        schedule.freeze()
+
+        if self.maxsize <= 0:
+            return schedule
+
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return schedule
+
+    def resize(self, maxsize: int) -> None:
+        """Change capacity, evicting least recently used entries if needed"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and current size"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'store_hits': self.store_hits,
+            }
+
+
+# Global instance shared by calculate_lease and LeaseProcessor
+_schedule_cache = ScheduleCache()
+
+
+def get_cached_schedule(lease_data: LeaseData) -> ScheduleFrame:
+    """
+    Convenience function: generate_complete_schedule through the global cache
+    """
+    return _schedule_cache.get_or_generate(lease_data)
+
+
+def configure_schedule_cache(maxsize: Optional[int] = None, store: Optional[ScheduleStore] = None) -> None:
+    """Set the global cache capacity (0 disables caching) and/or its backing schedule store"""
+    if maxsize is not None:
+        _schedule_cache.resize(maxsize)
+    if store is not None:
+        _schedule_cache.store = store
+
+
+def get_schedule_cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counters of the global cache"""
+    return _schedule_cache.stats()
+
+
+def clear_schedule_cache() -> None:
+    """Empty the global cache"""
+    _schedule_cache.clear()
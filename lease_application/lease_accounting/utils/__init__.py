@@ -20,6 +20,7 @@ from .finance import (
 from .rfr_rates import (
     RFRRateTable,
     get_aro_rate,
+    get_aro_rates,
     update_rfr_table
 )
 
@@ -46,6 +47,7 @@ __all__ = [
     # RFR rates
     'RFRRateTable',
     'get_aro_rate',
+    'get_aro_rates',
     'update_rfr_table',
     
     # Journal generation
@@ -3,15 +3,23 @@ Risk-Free Rate (RFR) Rate Tables
 Ports VBA arorate() function for ARO discount rate calculations
 """
 
+from bisect import bisect_right
 from datetime import date
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 import csv
 
+# Cached (date, table) lookups per table instance
+RATE_CACHE_SIZE = 4096
+
 
 class RFRRateTable:
     """
     Risk-Free Rate lookup table
     Ports VBA arorate() function logic
+    
+    rate_tables holds (date, rate) pairs sorted descending; lookups use an ascending
+    date-ordinal index built by reindex(), searched with bisect and cached.
     """
     
     def __init__(self):
@@ -20,6 +28,9 @@ class RFRRateTable:
             2: [],  # Table 2
             3: []   # Table 3
         }
+        self._index: Dict[int, Tuple[List[int], List[float]]] = {}
+        self._lookup_cached = lru_cache(maxsize=RATE_CACHE_SIZE)(self._lookup_rate)
+        self.version = 0  # Incremented on every reindex (used by schedule caches)
         self._initialize_default_rates()
     
     def _initialize_default_rates(self):
@@ -77,6 +88,35 @@ class RFRRateTable:
         # Sort by date descending
         for table_num in self.rate_tables:
             self.rate_tables[table_num].sort(key=lambda x: x[0], reverse=True)
+        self.reindex()
+    
+    def reindex(self):
+        """
+        Rebuild the bisect index from rate_tables and clear cached lookups
+        Call after changing rate_tables directly
+        """
+        index: Dict[int, Tuple[List[int], List[float]]] = {}
+        for table_num, entries in self.rate_tables.items():
+            # rate_tables is newest first; for duplicate dates the first listed rate wins
+            rates_by_ordinal: Dict[int, float] = {}
+            for table_date, rate in entries:
+                rates_by_ordinal.setdefault(table_date.toordinal(), rate)
+            ordinals = sorted(rates_by_ordinal)
+            index[table_num] = (ordinals, [rates_by_ordinal[o] for o in ordinals])
+        self._index = index
+        self._lookup_cached.cache_clear()
+        self.version += 1
+    
+    def _lookup_rate(self, ordinal: int, table: int) -> float:
+        """Rate in effect on a date ordinal: latest table date <= ordinal"""
+        ordinals, rates = self._index.get(table, ([], []))
+        if not ordinals:
+            return 0.0
+        pos = bisect_right(ordinals, ordinal)
+        if pos == 0:
+            # If no rate found for that date, return the most recent available rate
+            return rates[-1]
+        return rates[pos - 1]
     
     def get_rate(self, rate_date: date, table: int) -> float:
         """
@@ -93,16 +133,14 @@ class RFRRateTable:
         if table == 0 or table not in self.rate_tables:
             return 0.0
         
-        # Find the rate for the given date
-        for table_date, rate in self.rate_tables[table]:
-            if table_date <= rate_date:
-                return rate
-        
-        # If no rate found for that date, return the most recent available rate
-        if self.rate_tables[table]:
-            return self.rate_tables[table][0][1]
-        
-        return 0.0
+        return self._lookup_cached(rate_date.toordinal(), table)
+    
+    def get_rates(self, rate_dates: Iterable[date], table: int) -> List[float]:
+        """Rates for a sequence of dates (e.g. a schedule's date column) from one table"""
+        if table == 0 or table not in self.rate_tables:
+            return [0.0 for _ in rate_dates]
+        lookup = self._lookup_cached
+        return [lookup(rate_date.toordinal(), table) for rate_date in rate_dates]
     
     def load_from_file(self, filename: str):
         """Load RFR rates from CSV file"""
@@ -128,6 +166,7 @@ class RFRRateTable:
         # Sort by date descending
         for table_num in self.rate_tables:
             self.rate_tables[table_num].sort(key=lambda x: x[0], reverse=True)
+        self.reindex()
 
 
 # Global instance
@@ -142,10 +181,24 @@ def get_aro_rate(rate_date: date, table: int) -> float:
     return _rfr_table.get_rate(rate_date, table)
 
 
+def get_aro_rates(rate_dates: Iterable[date], table: int) -> List[float]:
+    """
+    ARO rates for many dates at once
+    Uses global RFR table instance
+    """
+    return _rfr_table.get_rates(rate_dates, table)
+
+
+def get_rfr_table_version() -> int:
+    """Version of the global RFR table; changes whenever its rates are reloaded"""
+    return _rfr_table.version
+
+
 def update_rfr_table(rates: Dict[int, List[Tuple[date, float]]]):
     """Update the global RFR table with new rates"""
     global _rfr_table
     _rfr_table.rate_tables = rates
     for table_num in _rfr_table.rate_tables:
         _rfr_table.rate_tables[table_num].sort(key=lambda x: x[0], reverse=True)
+    _rfr_table.reindex()
 
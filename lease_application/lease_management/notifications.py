@@ -3,8 +3,8 @@ Notification Service for Critical Date Notifications
 """
 
 import logging
-from datetime import datetime, timedelta
-from lease_application.database import get_db_connection
+from datetime import date, datetime, timedelta
+from lease_application.database import get_db_connection, get_table_columns
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ def run_daily_date_check(db_conn=None):
     Evaluates all active leases against all active notification rules and creates new
     entries in user_notifications if the trigger date matches today.
 
+    Each rule is one INSERT ... SELECT: leases whose trigger date equals today + days_in_advance,
+    joined with the active users of the recipient role. The unique (rule_id, lease_id, user_id,
+    target_date) index over undismissed notifications makes re-runs on the same day insert nothing
+    unless the earlier notification was dismissed.
+
     Args:
         db_conn: Optional database connection. If None, creates a new connection.
     """
@@ -27,6 +32,83 @@ def run_daily_date_check(db_conn=None):
         return _run_check_with_connection(db_conn)
 
 
+def _format_notification(template, lease_id, agreement_title, company_name, days_in_advance,
+                         target_date, trigger_date):
+    """SQL function: the rule's message for one lease (NULL if the template cannot be formatted)"""
+    try:
+        return template.format(
+            lease_id=lease_id,
+            agreement_title=agreement_title or f"Lease #{lease_id}",
+            company_name=company_name or "Unknown Company",
+            days_in_advance=days_in_advance,
+            target_date=target_date,
+            trigger_date=trigger_date
+        )
+    except (KeyError, IndexError, ValueError, TypeError):
+        return None
+
+
+def _rule_notifications_sql(trigger_field):
+    """INSERT ... SELECT creating one rule's notifications (params: _rule_notifications_params)"""
+    return f"""
+        INSERT OR IGNORE INTO user_notifications (lease_id, user_id, message, target_date, rule_id)
+        SELECT lease_id, user_id, message, ?, ?
+        FROM (
+            SELECT l.lease_id, u.user_id,
+                   format_notification(?, l.lease_id, l.agreement_title, l.company_name, ?, ?, ?) AS message
+            FROM leases l
+            JOIN users u ON u.role = ? AND u.is_active = 1
+            WHERE date(l.{trigger_field}) = ?
+            AND l.status IN ('approved', 'submitted')
+        )
+        WHERE message IS NOT NULL
+    """
+
+
+def _rule_notifications_params(rule, today, trigger_date):
+    return (today.isoformat(), rule['rule_id'], rule['message_template'], rule['days_in_advance'],
+            today.isoformat(), trigger_date.isoformat(), rule['recipient_role'], trigger_date.isoformat())
+
+
+def _user_notifications_sql(include_read, include_dismissed):
+    """get_user_notifications query (param: user_id)"""
+    query = """
+        SELECT n.*, l.agreement_title, l.company_name
+        FROM user_notifications n
+        JOIN leases l ON n.lease_id = l.lease_id
+        WHERE n.user_id = ?
+    """
+
+    conditions = []
+    if not include_read:
+        conditions.append("n.is_read = 0")
+    if not include_dismissed:
+        conditions.append("n.is_dismissed = 0")
+
+    if conditions:
+        query += " AND " + " AND ".join(conditions)
+
+    return query + " ORDER BY n.sent_at DESC"
+
+
+def notification_hot_queries(conn):
+    """
+    database.check_query_plans entries for the daily check and the inbox
+    Registers format_notification on conn so the rule inserts can be planned
+    """
+    conn.create_function('format_notification', 7, _format_notification, deterministic=True)
+    rule = {'rule_id': 1, 'message_template': '', 'days_in_advance': 30, 'recipient_role': 'approver'}
+    today = date(2025, 1, 1)
+    lease_columns = get_table_columns(conn, 'leases')
+    queries = [
+        (f'{trigger_field} rule', _rule_notifications_sql(trigger_field),
+         _rule_notifications_params(rule, today, today + timedelta(days=30)))
+        for trigger_field in ('lease_end_date', 'termination_date') if trigger_field in lease_columns
+    ]
+    queries.append(('notification inbox', _user_notifications_sql(False, False), (1,)))
+    return queries
+
+
 def _run_check_with_connection(conn):
     """Internal function to run the check with a database connection."""
     try:
@@ -46,6 +128,8 @@ def _run_check_with_connection(conn):
 
         logger.info(f"📋 Found {len(rules)} active notification rules")
 
+        conn.create_function('format_notification', 7, _format_notification, deterministic=True)
+        lease_columns = get_table_columns(conn, 'leases')
         notifications_created = 0
 
         for rule in rules:
@@ -53,87 +137,21 @@ def _run_check_with_connection(conn):
             trigger_field = rule['trigger_field']
             days_in_advance = rule['days_in_advance']
             recipient_role = rule['recipient_role']
-            message_template = rule['message_template']
-
-            logger.debug(f"🔍 Processing rule {rule_id}: {trigger_field} - {days_in_advance} days - {recipient_role}")
-
-            # Get all active leases with the trigger field
-            leases = conn.execute(f"""
-                SELECT lease_id, {trigger_field}, agreement_title, company_name
-                FROM leases
-                WHERE {trigger_field} IS NOT NULL
-                AND status IN ('approved', 'submitted')
-            """).fetchall()
-
-            logger.debug(f"🏢 Found {len(leases)} leases with {trigger_field}")
-
-            for lease in leases:
-                lease_id = lease['lease_id']
-                trigger_date_str = lease[trigger_field]
-                agreement_title = lease['agreement_title'] or f"Lease #{lease_id}"
-                company_name = lease['company_name'] or "Unknown Company"
-
-                try:
-                    # Parse the trigger date
-                    if isinstance(trigger_date_str, str):
-                        trigger_date = datetime.strptime(trigger_date_str, '%Y-%m-%d').date()
-                    else:
-                        # Assume it's already a date object
-                        trigger_date = trigger_date_str
-
-                    # Calculate the target notification date
-                    target_date = trigger_date - timedelta(days=days_in_advance)
-
-                    # Check if today matches the target date
-                    if target_date == today:
-                        logger.info(f"🎯 Match found: Lease {lease_id} ({agreement_title}) - {trigger_field} on {trigger_date} - notify {days_in_advance} days in advance")
-
-                        # Get users with the recipient role
-                        users = conn.execute("""
-                            SELECT user_id, username
-                            FROM users
-                            WHERE role = ? AND is_active = 1
-                        """, (recipient_role,)).fetchall()
-
-                        logger.debug(f"👥 Found {len(users)} users with role '{recipient_role}'")
-
-                        for user in users:
-                            user_id = user['user_id']
-                            username = user['username']
-
-                            # Check for existing notification to prevent duplicates
-                            existing = conn.execute("""
-                                SELECT notification_id FROM user_notifications
-                                WHERE lease_id = ? AND user_id = ? AND target_date = ? AND message LIKE ?
-                                AND is_dismissed = 0
-                            """, (lease_id, user_id, target_date.isoformat(), message_template[:50] + '%')).fetchone()
-
-                            if existing:
-                                logger.debug(f"⏭️ Skipping duplicate notification for user {username} on lease {lease_id}")
-                                continue
-
-                            # Create the notification message
-                            message = message_template.format(
-                                lease_id=lease_id,
-                                agreement_title=agreement_title,
-                                company_name=company_name,
-                                days_in_advance=days_in_advance,
-                                target_date=target_date.isoformat(),
-                                trigger_date=trigger_date.isoformat()
-                            )
-
-                            # Insert the notification
-                            conn.execute("""
-                                INSERT INTO user_notifications (lease_id, user_id, message, target_date)
-                                VALUES (?, ?, ?, ?)
-                            """, (lease_id, user_id, message, target_date.isoformat()))
-
-                            notifications_created += 1
-                            logger.info(f"✅ Created notification for user {username}: {message[:100]}...")
-
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"⚠️ Error processing lease {lease_id} for rule {rule_id}: {e}")
-                    continue
+
+            if trigger_field not in lease_columns:
+                logger.warning(f"⚠️ Skipping rule {rule_id}: leases has no column '{trigger_field}'")
+                continue
+
+            # Leases notify today when their trigger date is days_in_advance from now
+            trigger_date = today + timedelta(days=days_in_advance)
+            logger.debug(f"🔍 Processing rule {rule_id}: {trigger_field} = {trigger_date} - {recipient_role}")
+
+            cursor = conn.execute(_rule_notifications_sql(trigger_field),
+                                  _rule_notifications_params(rule, today, trigger_date))
+
+            if cursor.rowcount > 0:
+                notifications_created += cursor.rowcount
+                logger.info(f"✅ Rule {rule_id}: created {cursor.rowcount} notification(s) for {trigger_field} on {trigger_date}")
 
         logger.info(f"🎉 Daily date check completed. Created {notifications_created} notifications.")
         return notifications_created
@@ -156,25 +174,7 @@ def get_user_notifications(user_id, include_read=False, include_dismissed=False)
         List of notification dictionaries
     """
     with get_db_connection() as conn:
-        query = """
-            SELECT n.*, l.agreement_title, l.company_name
-            FROM user_notifications n
-            JOIN leases l ON n.lease_id = l.lease_id
-            WHERE n.user_id = ?
-        """
-
-        conditions = []
-        if not include_read:
-            conditions.append("n.is_read = 0")
-        if not include_dismissed:
-            conditions.append("n.is_dismissed = 0")
-
-        if conditions:
-            query += " AND " + " AND ".join(conditions)
-
-        query += " ORDER BY n.sent_at DESC"
-
-        rows = conn.execute(query, (user_id,)).fetchall()
+        rows = conn.execute(_user_notifications_sql(include_read, include_dismissed), (user_id,)).fetchall()
         return [dict(row) for row in rows]
 
 
@@ -0,0 +1,36 @@
+"""
+Materialized Schedule Store
+Persists generated schedules in the lease_schedules table
+
+Backs the shared schedule cache (configure_schedule_cache(store=...)) for leases
+loaded from the database: each lease keeps its latest ScheduleFrame as a compact
+binary blob keyed by the schedule content hash, so a restarted or cold process
+reads it back instead of regenerating. database.save_lease, status changes and
+delete_lease drop the stored row; a stale hash is simply a miss.
+"""
+
+from typing import Optional
+import logging
+from . import database
+from .lease_accounting.core.schedule_frame import ScheduleFrame
+from .lease_accounting.schedule.schedule_cache import ScheduleStore
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseScheduleStore(ScheduleStore):
+    """ScheduleStore over database.get_lease_schedule / save_lease_schedule"""
+
+    def load(self, lease_id: int, key: str) -> Optional[ScheduleFrame]:
+        try:
+            blob = database.get_lease_schedule(lease_id, key)
+            return ScheduleFrame.from_bytes(blob) if blob is not None else None
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load stored schedule for lease {lease_id}: {e}")
+            return None
+
+    def save(self, lease_id: int, key: str, schedule: ScheduleFrame) -> None:
+        try:
+            database.save_lease_schedule(lease_id, key, len(schedule), schedule.to_bytes())
+        except Exception as e:
+            logger.warning(f"⚠️  Could not store schedule for lease {lease_id}: {e}")
@@ -0,0 +1,48 @@
+"""
+Shared fixtures
+
+lease_application.database initializes lease_management.db in the working directory
+on import, so the session runs from a scratch directory to keep the repo's database
+untouched; the `db` fixture then points the module at a fresh file per test.
+"""
+
+import logging
+import os
+import tempfile
+
+import pytest
+
+os.chdir(tempfile.mkdtemp(prefix='lease-tests-'))
+logging.disable(logging.WARNING)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """lease_application.database bound to an initialized, empty temp database"""
+    from lease_application import database
+    monkeypatch.setattr(database, 'DATABASE_PATH', str(tmp_path / 'test.db'))
+    database.init_database()
+    yield database
+    database._pool.clear()
+
+
+@pytest.fixture
+def engine(request):
+    """
+    engine(name) switches the schedule calculation engine and clears the schedule cache;
+    indirect parametrization switches up front. The previous engine is restored afterwards
+    """
+    from lease_application.lease_accounting.schedule import generator_vba_complete as generator
+    from lease_application.lease_accounting.schedule.schedule_cache import clear_schedule_cache
+
+    def use(name):
+        if name == generator.ENGINE_VECTORIZED and not generator.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        generator.set_calculation_engine(name)
+        clear_schedule_cache()
+
+    previous = generator.get_calculation_engine()
+    if hasattr(request, 'param'):
+        use(request.param)
+    yield use
+    use(previous)
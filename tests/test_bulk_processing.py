@@ -0,0 +1,40 @@
+"""
+Process-pool bulk processing (ResultsProcessor._lease_outcomes)
+"""
+
+from datetime import date
+
+import pytest
+
+from lease_application.lease_accounting.core.models import LeaseData, ProcessingFilters
+from lease_application.lease_accounting.core.results_processor import ResultsProcessor
+
+FILTERS = ProcessingFilters(start_date=date(2021, 12, 31), end_date=date(2022, 12, 31))
+
+
+def _leases(count: int) -> list:
+    return [
+        LeaseData(auto_id=i, description=f'Lease {i}', lease_start_date=date(2019 + i % 4, 1 + i % 12, 1),
+                  end_date=date(2026 + i % 3, 12, 31), frequency_months=(1, 3, 12)[i % 3], day_of_month="1",
+                  rental_1=1000.0 + 250 * i, borrowing_rate=5.0 + i % 4)
+        for i in range(count)
+    ]
+
+
+def test_parallel_matches_serial():
+    leases = _leases(20)
+    serial = ResultsProcessor(FILTERS, workers=1).process_bulk_leases(leases)
+    parallel = ResultsProcessor(FILTERS, workers=2, chunk_size=3, parallel_threshold=0).process_bulk_leases(leases)
+
+    assert serial['processed_count'] == 20
+    assert parallel == serial
+
+
+def test_timed_out_leases_are_skipped():
+    leases = _leases(4)
+    result = ResultsProcessor(FILTERS, workers=2, chunk_size=2, lease_timeout=0,
+                              parallel_threshold=0).process_bulk_leases(leases)
+
+    assert result['processed_count'] == 0
+    assert result['skipped_count'] == 4
+    assert result['results'] == []
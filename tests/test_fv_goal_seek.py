@@ -0,0 +1,102 @@
+"""
+FV of ROU goal seek (VBA Line 685): discount rate at which the PV of the rents equals the FV
+"""
+
+from datetime import date
+
+import pytest
+
+from lease_application.lease_accounting.core.models import LeaseData, ProcessingFilters
+from lease_application.lease_accounting.core.processor import LeaseProcessor
+from lease_application.lease_accounting.core.schedule_frame import ScheduleFrame
+from lease_application.lease_accounting.schedule import generator_vba_complete as generator
+
+RATE = 8.0
+# 60 monthly rents of 2,000; the first is paid at C9 and is not discounted by the goal seek
+RENTS_AFTER_START = 59 * 2000.0
+PV_AT_RATE = 97287.76
+
+
+def _lease(fv_of_rou: float, frequency_months: int = 1, rental: float = 2000.0) -> LeaseData:
+    return LeaseData(auto_id=1, lease_start_date=date(2024, 1, 1), end_date=date(2028, 12, 31),
+                     first_payment_date=date(2024, 1, 1), frequency_months=frequency_months,
+                     day_of_month="1", rental_1=rental, borrowing_rate=RATE, fv_of_rou=fv_of_rou)
+
+
+# Runs a test once per schedule engine (conftest engine fixture)
+ENGINES = pytest.mark.parametrize('engine', [generator.ENGINE_SCALAR, generator.ENGINE_VECTORIZED], indirect=True)
+
+
+def _pv_of_rents(schedule, rate: float, icompound: int = 1) -> float:
+    x = rate / 100 * icompound / 12
+    start = schedule[0].date
+    return sum(row.rental_amount * (1 + x) ** -(((row.date - start).days / 365) * 12 / icompound)
+               for row in schedule[1:] if row.rental_amount)
+
+
+@ENGINES
+@pytest.mark.parametrize('fv', [50000.0, 90000.0, 110000.0, 10000.0])
+def test_liability_starts_at_fv_and_runs_off(engine, fv):
+    lease = _lease(fv)
+    schedule = generator.generate_complete_schedule(lease)
+
+    assert schedule[0].lease_liability == pytest.approx(fv, abs=0.005)
+    assert abs(schedule[-1].lease_liability) < 0.005
+    # The lease's own rate is left untouched; the frame records the solved rate it ran at
+    assert lease.borrowing_rate == RATE
+    assert schedule.borrowing_rate == pytest.approx(generator._goal_seek_fv_rate(lease, schedule))
+
+
+@ENGINES
+def test_result_reports_solved_rate(engine):
+    lease = _lease(50000.0)
+    schedule = generator.generate_complete_schedule(lease)
+    result = LeaseProcessor(ProcessingFilters(start_date=date(2024, 12, 31), end_date=date(2025, 12, 31))
+                            ).process_single_lease(lease)
+
+    assert schedule.borrowing_rate != RATE
+    assert result.borrowing_rate == schedule.borrowing_rate
+    # Stored schedules keep the rate
+    assert ScheduleFrame.from_bytes(schedule.to_bytes()).borrowing_rate == schedule.borrowing_rate
+
+
+@pytest.mark.parametrize('frequency_months', [1, 3, 12])
+def test_solved_rate_discounts_rents_to_fv(frequency_months):
+    lease = _lease(60000.0, frequency_months, rental=2000.0 * frequency_months)
+    schedule = generator.generate_complete_schedule(lease)
+
+    rate = generator._goal_seek_fv_rate(lease, schedule)
+    icompound = generator._get_icompound(lease)
+    assert _pv_of_rents(schedule, rate, icompound) == pytest.approx(60000.0, rel=1e-8)
+
+
+def test_pure_python_fallback_matches_numpy(monkeypatch):
+    if not generator.HAS_NUMPY:
+        pytest.skip("NumPy not installed")
+    lease = _lease(50000.0)
+    schedule = generator.generate_complete_schedule(lease)
+    with_numpy = generator._goal_seek_fv_rate(lease, schedule)
+
+    monkeypatch.setattr(generator, 'HAS_NUMPY', False)
+    assert generator._goal_seek_fv_rate(lease, schedule) == pytest.approx(with_numpy, rel=1e-9)
+
+
+@ENGINES
+@pytest.mark.parametrize('fv', [RENTS_AFTER_START, RENTS_AFTER_START + 1000.0])
+def test_no_root_leaves_rate_unchanged(engine, fv):
+    lease = _lease(fv)
+    schedule = generator.generate_complete_schedule(lease)
+
+    assert generator._goal_seek_fv_rate(lease, schedule) is None
+    assert schedule.borrowing_rate == RATE
+    assert schedule[0].lease_liability == pytest.approx(PV_AT_RATE, abs=0.005)
+
+
+@ENGINES
+def test_no_rents_after_start(engine):
+    lease = _lease(50000.0)
+    schedule = generator.generate_complete_schedule(lease).copy()
+    for row in schedule[1:]:
+        row.rental_amount = 0.0
+
+    assert generator._goal_seek_fv_rate(lease, schedule) is None
@@ -0,0 +1,108 @@
+"""
+Daily critical-date check (set-based notification insert)
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from lease_application.lease_management import notifications
+
+TEMPLATE = "{agreement_title} ({company_name}) ends {trigger_date}, {days_in_advance} days from {target_date}"
+
+
+@pytest.fixture
+def setup(db):
+    """Two active approvers, one inactive approver, one user and a 30-day lease end rule"""
+    approvers = []
+    for name in ('approver1', 'approver2', 'approver3'):
+        user_id = db.create_user(name, 'secret')
+        db.set_user_role(user_id, 'approver')
+        approvers.append(user_id)
+    db.set_user_active(approvers[2], False)
+    owner = db.create_user('owner', 'secret')
+    rule_id = db.create_notification_setting('lease_end_date', 30, 'approver', TEMPLATE)
+    return owner, approvers[:2], rule_id
+
+
+def _lease(db, owner, end_date, status='approved', title='Warehouse'):
+    lease_id, _ = db.save_lease(owner, {'agreement_title': title, 'company_name': 'Acme',
+                                        'lease_end_date': end_date, 'status': status})
+    return lease_id
+
+
+def _notifications(db):
+    with db.get_db_connection() as conn:
+        return [dict(row) for row in conn.execute(
+            "SELECT * FROM user_notifications ORDER BY notification_id")]
+
+
+def test_notifies_active_recipients_once(db, setup):
+    owner, approvers, rule_id = setup
+    today = date.today()
+    trigger = today + timedelta(days=30)
+    lease_id = _lease(db, owner, trigger.isoformat())
+    _lease(db, owner, trigger.isoformat(), status='draft')
+    _lease(db, owner, (trigger + timedelta(days=1)).isoformat())
+
+    assert notifications.run_daily_date_check() == 2
+    rows = _notifications(db)
+    assert sorted(row['user_id'] for row in rows) == approvers
+    for row in rows:
+        assert row['lease_id'] == lease_id
+        assert row['rule_id'] == rule_id
+        assert row['target_date'] == today.isoformat()
+        assert row['message'] == f"Warehouse (Acme) ends {trigger}, 30 days from {today}"
+
+    # Same-day re-run inserts nothing
+    assert notifications.run_daily_date_check() == 0
+    assert len(_notifications(db)) == 2
+
+
+def test_dismissed_notification_is_recreated(db, setup):
+    owner, approvers, _ = setup
+    _lease(db, owner, (date.today() + timedelta(days=30)).isoformat())
+    notifications.run_daily_date_check()
+    first = next(row for row in _notifications(db) if row['user_id'] == approvers[0])
+
+    assert notifications.dismiss_notification(first['notification_id'], approvers[0])
+    assert notifications.run_daily_date_check() == 1
+    inbox = notifications.get_user_notifications(approvers[0])
+    assert len(inbox) == 1
+    assert inbox[0]['notification_id'] != first['notification_id']
+
+
+def test_trigger_date_with_time_part(db, setup):
+    owner, approvers, _ = setup
+    _lease(db, owner, f"{date.today() + timedelta(days=30)} 00:00:00")
+
+    assert notifications.run_daily_date_check() == len(approvers)
+
+
+def test_unformattable_template_and_unknown_field_are_skipped(db, setup):
+    owner, _, rule_id = setup
+    _lease(db, owner, (date.today() + timedelta(days=30)).isoformat())
+    db.update_notification_setting(rule_id, 'lease_end_date', 30, 'approver', "{missing}", True)
+    db.create_notification_setting('no_such_column', 30, 'approver', TEMPLATE)
+
+    assert notifications.run_daily_date_check() == 0
+
+
+def test_notifications_from_before_rule_id_are_backfilled(db, setup):
+    owner, approvers, rule_id = setup
+    today = date.today().isoformat()
+    lease_id = _lease(db, owner, (date.today() + timedelta(days=30)).isoformat())
+    with db.get_db_connection() as conn:
+        # As left by the per-lease check: no rule_id, one duplicate, one dismissed
+        conn.executemany(
+            "INSERT INTO user_notifications (lease_id, user_id, message, target_date, is_dismissed) "
+            "VALUES (?, ?, 'Warehouse ends soon', ?, ?)",
+            [(lease_id, approvers[0], today, 0), (lease_id, approvers[0], today, 0),
+             (lease_id, approvers[1], today, 1)])
+        conn.execute("DELETE FROM schema_version")
+    db.init_database()
+
+    assert [row['rule_id'] for row in _notifications(db)] == [rule_id, None, rule_id]
+    # Only the approver whose notification was dismissed gets a new one
+    assert notifications.run_daily_date_check() == 1
+    assert [row['user_id'] for row in _notifications(db)][3:] == [approvers[1]]
@@ -0,0 +1,119 @@
+"""
+Keyset pagination of the lease and audit listings (database._keyset_page)
+"""
+
+import pytest
+
+
+@pytest.fixture
+def leases(db):
+    """25 leases for two users, created in three batches that share a created_at timestamp"""
+    alice = db.create_user('alice', 'secret')
+    bob = db.create_user('bob', 'secret')
+    for i in range(25):
+        db.save_lease(alice if i % 3 else bob, {
+            'agreement_title': f'Lease {i}',
+            'company_name': 'Acme' if i % 2 else 'Globex',
+            'status': 'approved' if i % 4 else 'draft',
+            'lease_start_date': f'{2020 + i % 5}-01-01',
+            'lease_end_date': f'{2022 + i % 5}-12-31',
+        })
+    with db.get_db_connection() as conn:
+        conn.execute("UPDATE leases SET created_at = '2025-0' || (1 + lease_id % 3) || '-01 09:00:00'")
+    return alice, bob
+
+
+def _all_pages(listing, limit, **filters):
+    rows, cursor = listing(limit=limit, **filters)
+    pages = [rows]
+    while cursor is not None:
+        rows, cursor = listing(after=cursor, limit=limit, **filters)
+        pages.append(rows)
+    return pages
+
+
+def _ids(rows, key='lease_id'):
+    return [row[key] for row in rows]
+
+
+@pytest.mark.parametrize('limit', [1, 7, 25, 100])
+def test_lease_pages_concatenate_to_full_listing(db, leases, limit):
+    full, cursor = db.list_leases()
+    assert cursor is None
+    assert len(full) == 25
+    assert _ids(full) == _ids(sorted(full, key=lambda row: (row['created_at'], row['lease_id']), reverse=True))
+
+    pages = _all_pages(db.list_leases, limit)
+    assert all(len(page) == limit for page in pages[:-1])
+    assert [lease_id for page in pages for lease_id in _ids(page)] == _ids(full)
+
+
+def test_lease_filters(db, leases):
+    alice, _ = leases
+    full, _ = db.list_leases(user_id=alice, status='approved', entity='Acme')
+    assert full
+    assert all(row['user_id'] == alice and row['status'] == 'approved' and row['company_name'] == 'Acme'
+               for row in full)
+    pages = _all_pages(db.list_leases, 2, user_id=alice, status='approved', entity='Acme')
+    assert [lease_id for page in pages for lease_id in _ids(page)] == _ids(full)
+
+    # Term overlaps [from_date, to_date]
+    overlapping, _ = db.list_leases(from_date='2025-06-30', to_date='2022-06-30')
+    everything, _ = db.list_leases()
+    assert _ids(overlapping) == [row['lease_id'] for row in everything
+                                 if row['lease_end_date'] >= '2025-06-30' and row['lease_start_date'] <= '2022-06-30']
+
+
+def test_lease_field_projection(db, leases):
+    rows, _ = db.list_leases(limit=3, fields=['agreement_title'])
+    assert set(rows[0]) == {'lease_id', 'created_at', 'agreement_title'}
+    with pytest.raises(ValueError):
+        db.list_leases(fields=['no_such_column'])
+
+
+def test_cursor_survives_inserts(db, leases):
+    alice, _ = leases
+    first, cursor = db.list_leases(limit=10)
+    db.save_lease(alice, {'agreement_title': 'Newest'})
+    second, _ = db.list_leases(after=cursor, limit=10)
+
+    full, _ = db.list_leases()
+    assert _ids(first + second) == _ids(full)[1:21]
+
+
+def test_cursor_survives_deleting_its_row(db, leases):
+    first, cursor = db.list_leases(limit=10)
+    last = first[-1]
+    assert db.delete_lease(last['lease_id'], last['user_id'])
+    second, _ = db.list_leases(after=cursor, limit=10)
+
+    full, _ = db.list_leases()
+    assert _ids(first[:-1] + second) == _ids(full)[:19]
+
+
+@pytest.mark.parametrize('cursor', ['9999', 'not a cursor', 'bnVsbA'])
+def test_invalid_cursor(db, leases, cursor):
+    with pytest.raises(ValueError):
+        db.list_leases(after=cursor, limit=5)
+    with pytest.raises(ValueError):
+        db.list_audit_logs(after=cursor, limit=5)
+
+
+@pytest.mark.parametrize('limit', [1, 9, 50])
+def test_audit_pages_concatenate_to_full_listing(db, leases, limit):
+    _, bob = leases
+    with db.get_db_connection() as conn:
+        conn.execute("UPDATE lease_data_audit SET change_timestamp = '2025-03-0' || (1 + audit_id % 4) || ' 12:00:00'")
+
+    for filters in ({}, {'changed_by': 'bob'}, {'changed_by': str(bob)}, {'lease_id': 4, 'action': 'CREATE'},
+                    {'from_date': '2025-03-02', 'to_date': '2025-03-03'}):
+        full, cursor = db.list_audit_logs(**filters)
+        assert full and cursor is None
+        pages = _all_pages(db.list_audit_logs, limit, **filters)
+        assert [audit_id for page in pages for audit_id in _ids(page, 'audit_id')] == _ids(full, 'audit_id')
+
+    by_name, _ = db.list_audit_logs(changed_by='bob')
+    assert {row['changed_by_username'] for row in by_name} == {'bob'}
+    assert _ids(by_name, 'audit_id') == _ids(db.list_audit_logs(changed_by=str(bob))[0], 'audit_id')
+    in_range, _ = db.list_audit_logs(from_date='2025-03-02', to_date='2025-03-03')
+    assert {row['change_timestamp'][:10] for row in in_range} == {'2025-03-02', '2025-03-03'}
@@ -0,0 +1,28 @@
+"""
+Managed indexes and the query plans of the hot queries on a freshly initialized database
+"""
+
+
+def test_hot_queries_use_indexes(db):
+    assert db.check_query_plans() == []
+
+
+def _indexes(conn):
+    return {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_only_retired_managed_indexes_are_dropped(db, monkeypatch):
+    with db.get_db_connection() as conn:
+        conn.execute("CREATE INDEX idx_leases_operator ON leases (agreement_title)")
+        monkeypatch.setitem(db.MANAGED_INDEXES, 'idx_leases_retired', ('leases', 'asset_class'))
+        db.create_managed_indexes(conn)
+        assert {'idx_leases_operator', 'idx_leases_retired'} <= _indexes(conn)
+
+        monkeypatch.delitem(db.MANAGED_INDEXES, 'idx_leases_retired')
+        db.create_managed_indexes(conn)
+        indexes = _indexes(conn)
+        managed = {row['name'] for row in conn.execute("SELECT name FROM managed_indexes")}
+
+    assert 'idx_leases_retired' not in indexes
+    assert 'idx_leases_operator' in indexes
+    assert managed == set(db.MANAGED_INDEXES) & indexes
@@ -0,0 +1,36 @@
+"""
+Schedules shared by the schedule cache are read-only
+"""
+
+from datetime import date
+
+import pytest
+
+from lease_application.lease_accounting.core.models import LeaseData
+from lease_application.lease_accounting.schedule.schedule_cache import ScheduleCache
+
+
+def _lease() -> LeaseData:
+    return LeaseData(auto_id=1, lease_start_date=date(2024, 1, 1), end_date=date(2026, 12, 31),
+                     first_payment_date=date(2024, 1, 1), frequency_months=1, day_of_month="1",
+                     rental_1=1000.0, borrowing_rate=6.0)
+
+
+def test_cached_schedule_is_read_only():
+    cache = ScheduleCache()
+    schedule = cache.get_or_generate(_lease())
+    liability = schedule[0].lease_liability
+
+    with pytest.raises(TypeError):
+        schedule[0].lease_liability = 0.0
+    with pytest.raises(TypeError):
+        schedule[1].is_closing = True
+    with pytest.raises(TypeError):
+        schedule.column('rental_amount')[0] = 0.0
+
+    copy = schedule.copy()
+    copy[0].lease_liability = 0.0
+    again = cache.get_or_generate(_lease())
+    assert again is schedule and cache.hits == 1
+    assert again[0].lease_liability == liability
+    assert copy.to_dicts()[1:] == schedule.to_dicts()[1:]